@@ -0,0 +1,5 @@
+"""
+Fetch-path benchmarks.
+Run from the repository root, e.g. `python -m benchmarks.fields_projection @channel`;
+`python -m benchmarks.offline` runs every fetch path against a local fake API.
+"""
@@ -0,0 +1,625 @@
+"""
+Offline fake YouTube Data API + Reddit API server.
+
+Serves deterministic synthetic channels, videos, comment threads,
+subreddits, users, posts and comments, or replays fixtures recorded with
+benchmarks.transport. Latency and error injection are configurable, so
+every fetch path can be benchmarked without network access or credentials.
+
+Synthetic sizes are encoded in the identifier:
+    YouTube   @bench_5000    -> channel with 5,000 uploads (plain handles get --videos)
+    Reddit    r/bench_2000   -> subreddit with 2,000 posts (plain names get --posts)
+
+Point the clients at it with:
+    YouTubeChannelAnalyser(key, api_endpoint=server.url)
+    RedditAnalyser(id, secret, agent, oauth_url=server.url, reddit_url=server.url)
+
+Usage:
+    python -m benchmarks.fake_api --port 8765 --latency 0.05 --error-rate 0.02
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+from .transport import FixtureStore, REPLAY_TOKEN
+
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+UPLOAD_SPACING = timedelta(hours=20)
+POST_SPACING = timedelta(minutes=17)
+COMMENTS_PER_VIDEO = 120
+COMMENTS_PER_POST = 40
+MORE_COMMENTS_PER_POST = 250   # Top-level comments behind a "load more" stub
+
+WORDS = ("great video love this amazing content thanks helpful awesome python data chart "
+         "insight trend growth viral tutorial 😂 🔥 ❤️ 👍").split()
+
+
+def _seed(*parts):
+    """Deterministic integer seed for a synthetic object."""
+    return int(hashlib.md5(":".join(map(str, parts)).encode()).hexdigest()[:12], 16)
+
+
+def _size_from_name(name, default):
+    """'bench_5000' -> 5000, anything else -> default."""
+    match = re.search(r'_(\d+)$', name)
+    return int(match.group(1)) if match else default
+
+
+def _rfc3339(dt):
+    return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _text(rng, words=12):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randrange(3, words)))
+
+
+class FakeData:
+    """Deterministic synthetic API objects"""
+
+    TOP_WINDOW_DAYS = {'hour': 1 / 24, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+    def __init__(self, default_videos=500, default_posts=1000):
+        self.default_videos = default_videos
+        self.default_posts = default_posts
+        # Newest posts held back from /new, to simulate arrivals between runs
+        self.unpublished = 0
+        # Post indices removed from /new (deleted or removed by moderators)
+        self.deleted = set()
+        self._orders = {}
+        self._issued = {}
+
+
+    # ---------- YouTube ----------
+
+    @staticmethod
+    def channel_id(handle_or_size):
+        """Channel IDs embed the upload count: UC + 'fake' + 18 digits."""
+        return f"UCfake{int(handle_or_size):018d}"
+
+
+    def resolve_handle(self, handle):
+        return self.channel_id(_size_from_name(handle.lstrip('@'), self.default_videos))
+
+
+    @staticmethod
+    def channel_size(channel_id):
+        match = re.match(r'^U[CU]fake(\d{18})$', channel_id)
+        return int(match.group(1)) if match else None
+
+
+    def channel(self, channel_id):
+        size = self.channel_size(channel_id)
+        if size is None:
+            return None
+        rng = random.Random(_seed('channel', channel_id))
+        return {
+            'id': channel_id,
+            'snippet': {
+                'title': f"Benchmark Channel {size}",
+                'description': "Synthetic channel served by benchmarks.fake_api",
+                'publishedAt': _rfc3339(EPOCH - UPLOAD_SPACING * (size + 10)),
+                'customUrl': f"@bench_{size}",
+                'country': 'PK',
+            },
+            'statistics': {
+                'viewCount': str(size * rng.randrange(5_000, 50_000)),
+                'subscriberCount': str(rng.randrange(1_000, 5_000_000)),
+                'hiddenSubscriberCount': False,
+                'videoCount': str(size),
+            },
+            'contentDetails': {'relatedPlaylists': {'uploads': 'UU' + channel_id[2:]}},
+        }
+
+
+    @staticmethod
+    def video_id(channel_id, index):
+        return f"{channel_id}-{index}"
+
+
+    @staticmethod
+    def video_published(index, size):
+        """Index 0 is the oldest upload; the newest is at EPOCH."""
+        return EPOCH - UPLOAD_SPACING * (size - 1 - index)
+
+
+    def playlist_page(self, playlist_id, token, max_results):
+        channel_id = 'UC' + playlist_id[2:]
+        size = self.channel_size(channel_id)
+        if size is None:
+            return None
+
+        start = int(token or 0)
+        newest_first = range(size - 1 - start, max(-1, size - 1 - start - max_results), -1)
+        page = {
+            'items': [{
+                'contentDetails': {
+                    'videoId': self.video_id(channel_id, i),
+                    'videoPublishedAt': _rfc3339(self.video_published(i, size)),
+                }
+            } for i in newest_first],
+            'pageInfo': {'totalResults': size, 'resultsPerPage': max_results},
+        }
+        if start + max_results < size:
+            page['nextPageToken'] = str(start + max_results)
+        return page
+
+
+    def video(self, video_id):
+        channel_id, _, index = video_id.rpartition('-')
+        size = self.channel_size(channel_id)
+        if size is None or not index.isdigit() or int(index) >= size:
+            return None
+
+        index = int(index)
+        rng = random.Random(_seed('video', video_id))
+        views = int(rng.lognormvariate(9, 1.5))
+        minutes, seconds = rng.randrange(1, 60), rng.randrange(60)
+        return {
+            'id': video_id,
+            'snippet': {
+                'title': f"Video {index}: {_text(rng, 8)}",
+                'publishedAt': _rfc3339(self.video_published(index, size)),
+                'description': _text(rng, 80),
+                'tags': rng.sample(WORDS, 3),
+                'categoryId': str(rng.choice([10, 20, 22, 24, 27, 28])),
+            },
+            'statistics': {
+                'viewCount': str(views),
+                'likeCount': str(int(views * rng.uniform(0.01, 0.06))),
+                'commentCount': str(int(views * rng.uniform(0.001, 0.01))),
+            },
+            'contentDetails': {'duration': f"PT{minutes}M{seconds}S"},
+            'status': {'privacyStatus': 'private' if rng.random() < 0.02 else 'public'},
+        }
+
+
+    def comment_threads(self, video_id, token, max_results):
+        start = int(token or 0)
+        rng = random.Random(_seed('comments', video_id))
+        total = rng.randrange(COMMENTS_PER_VIDEO // 2, COMMENTS_PER_VIDEO * 2)
+
+        items = []
+        for i in range(start, min(total, start + max_results)):
+            crng = random.Random(_seed('comment', video_id, i))
+            items.append({
+                'id': f"{video_id}.c{i}",
+                'snippet': {
+                    'videoId': video_id,
+                    'topLevelComment': {'id': f"{video_id}.c{i}", 'snippet': {
+                        'textDisplay': _text(crng, 25),
+                        'textOriginal': _text(crng, 25),
+                        'authorDisplayName': f"@viewer{crng.randrange(10_000)}",
+                        'likeCount': int(crng.expovariate(0.2)),
+                        'publishedAt': _rfc3339(EPOCH - timedelta(minutes=i * 7)),
+                    }},
+                    'totalReplyCount': crng.randrange(5),
+                },
+            })
+
+        page = {'items': items}
+        if start + max_results < total:
+            page['nextPageToken'] = str(start + max_results)
+        return page
+
+
+    # ---------- Reddit ----------
+
+    def subreddit_about(self, name):
+        rng = random.Random(_seed('subreddit', name.lower()))
+        return {'kind': 't5', 'data': {
+            'id': format(_seed('sr', name) % 36 ** 6, 'x'),
+            'name': f"t5_{name.lower()}",
+            'display_name': name,
+            'title': f"r/{name} (synthetic)",
+            'public_description': "Synthetic subreddit served by benchmarks.fake_api",
+            'subscribers': rng.randrange(10_000, 5_000_000),
+            'accounts_active': rng.randrange(100, 20_000),
+            'created_utc': (EPOCH - timedelta(days=3000)).timestamp(),
+            'over18': False,
+            'url': f"/r/{name}/",
+        }}
+
+
+    def post(self, subreddit, index, author=None):
+        """Index 0 is the newest post."""
+        post_id = f"{format(_seed('post', subreddit.lower()) % 36 ** 3, 'x')}{index:x}"
+        self._issued[post_id] = (subreddit, index, author)
+        rng = random.Random(_seed('post', subreddit.lower(), index))
+        score = int(rng.lognormvariate(4, 1.6))
+        is_self = rng.random() < 0.6
+        return {'kind': 't3', 'data': {
+            'id': post_id,
+            'name': f"t3_{post_id}",
+            'title': _text(rng, 14),
+            'author': author or f"user{rng.randrange(5_000)}",
+            'subreddit': subreddit,
+            'subreddit_name_prefixed': f"r/{subreddit}",
+            'created_utc': (EPOCH - POST_SPACING * index).timestamp(),
+            'score': score,
+            'ups': score,
+            'upvote_ratio': round(rng.uniform(0.6, 1.0), 2),
+            'num_comments': int(score * rng.uniform(0.05, 0.5)),
+            'permalink': f"/r/{subreddit}/comments/{post_id}/",
+            'url': f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/" if is_self else "https://example.com/a",
+            'is_self': is_self,
+            'selftext': _text(rng, 60) if is_self else '',
+            'link_flair_text': rng.choice([None, 'Discussion', 'News', 'Help']),
+            'total_awards_received': rng.randrange(3),
+            'is_video': rng.random() < 0.05,
+            'domain': f"self.{subreddit}" if is_self else 'example.com',
+        }}
+
+
+    def issued(self, fullname):
+        """(subreddit, index, author) of a post previously served, or None."""
+        return self._issued.get(fullname[3:])
+
+
+    def lookup_post(self, fullname):
+        """A post previously served in a listing, as /api/info returns it (None if unknown)."""
+        issued = self.issued(fullname)
+        return self.post(*issued) if issued else None
+
+
+    def listing_order(self, subreddit, sort, size, t=None):
+        """Post indices in listing order: new by age, top by score inside its window, others shuffled."""
+        key = (subreddit.lower(), sort, size, t, self.unpublished, frozenset(self.deleted))
+        if key not in self._orders:
+            if sort == 'new':
+                order = [i for i in range(self.unpublished, size) if i not in self.deleted]
+            elif sort == 'top':
+                days = self.TOP_WINDOW_DAYS.get(t)
+                window = min(size, int(timedelta(days=days) / POST_SPACING) + 1) if days else size
+                order = sorted(range(window), key=lambda i: -self.post(subreddit, i)['data']['score'])
+            else:
+                order = list(range(size))
+                random.Random(_seed('order', subreddit.lower(), sort)).shuffle(order)
+            self._orders[key] = order
+        return self._orders[key]
+
+
+    def comment(self, link_id, index, depth=0, parent_id=None, subreddit='bench', author=None, post_created=None):
+        comment_id = f"{link_id[-4:]}{index:x}d{depth}"
+        rng = random.Random(_seed('rcomment', link_id, index, depth))
+        if post_created is not None:
+            created = post_created + rng.expovariate(1 / 3600) * (depth + 1)
+        else:
+            created = (EPOCH - timedelta(minutes=index * 3)).timestamp()
+        return {'kind': 't1', 'data': {
+            'id': comment_id,
+            'name': f"t1_{comment_id}",
+            'body': _text(rng, 30),
+            'author': author or f"user{rng.randrange(5_000)}",
+            'subreddit': subreddit,
+            'link_id': link_id,
+            'parent_id': parent_id or link_id,
+            'created_utc': created,
+            'score': int(rng.expovariate(0.1)),
+            'depth': depth,
+            'permalink': f"/r/{subreddit}/comments/{link_id[3:]}/_/{comment_id}/",
+            'replies': '',
+        }}
+
+
+    def listing(self, children, after=None, before=None):
+        return {'kind': 'Listing', 'data': {'after': after, 'before': before, 'dist': len(children),
+                                            'children': children}}
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        self._dispatch('POST')
+
+
+    def _dispatch(self, method):
+        server = self.server
+        server.count_request()
+
+        if server.latency:
+            time.sleep(server.latency * random.uniform(0.5, 1.5))
+
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/')
+        query = dict(parse_qsl(parts.query))
+        youtube = path.startswith('/youtube/v3/')
+
+        if server.error_rate and random.random() < server.error_rate:
+            return self._inject_error(youtube)
+
+        if server.fixtures:
+            fixture = server.fixtures.load(method, self.path)
+            if fixture:
+                return self._send(fixture['status'], fixture['content'].encode('utf-8'), fixture['headers'])
+
+        try:
+            body = self._youtube(path, query) if youtube else self._reddit(method, path, query)
+        except Exception as e:
+            return self._send_json(500, {'error': {'code': 500, 'message': str(e)}})
+
+        if body is None:
+            return self._send_json(404, {'error': {'code': 404, 'message': f"Not found: {path}"}})
+
+        content = json.dumps(body).encode('utf-8')
+        etag = '"' + hashlib.md5(content).hexdigest() + '"'
+        if youtube and self.headers.get('If-None-Match') == etag:
+            return self._send(304, b'', {'etag': etag})
+        return self._send(200, content, {'content-type': 'application/json', 'etag': etag})
+
+
+    # ---------- YouTube ----------
+
+    def _youtube(self, path, query):
+        data = self.server.data
+        resource = path.rsplit('/', 1)[-1]
+        max_results = int(query.get('maxResults', 5))
+
+        if resource == 'channels':
+            if 'forHandle' in query:
+                return {'items': [{'id': data.resolve_handle(query['forHandle'])}]}
+            items = [data.channel(cid) for cid in query.get('id', '').split(',')]
+            return {'items': [item for item in items if item]}
+
+        if resource == 'search':
+            name = query.get('q', 'bench')
+            cid = data.resolve_handle(name)
+            return {'items': [{'snippet': {'channelId': cid, 'channelTitle': name}}]}
+
+        if resource == 'playlistItems':
+            return data.playlist_page(query.get('playlistId', ''), query.get('pageToken'), max_results)
+
+        if resource == 'videos':
+            items = [data.video(vid) for vid in query.get('id', '').split(',')]
+            return {'items': [item for item in items if item]}
+
+        if resource == 'commentThreads':
+            return data.comment_threads(query.get('videoId', ''), query.get('pageToken'), max_results)
+
+        return None
+
+
+    # ---------- Reddit ----------
+
+    def _reddit(self, method, path, query):
+        data = self.server.data
+        limit = min(int(query.get('limit', 25)), 100)
+        after = query.get('after')
+
+        if path == '/api/v1/access_token':
+            return REPLAY_TOKEN
+
+        if path == '/api/v1/me':
+            return {'name': 'bench', 'id': 'bench'}
+
+        match = re.match(r'^/r/([^/]+)/about$', path)
+        if match:
+            return data.subreddit_about(match.group(1))
+
+        match = re.match(r'^/r/([^/]+)(?:/(hot|new|rising|top|controversial))?$', path)
+        if match:
+            name, sort = match.group(1), match.group(2) or 'hot'
+            size = _size_from_name(name, self.server.data.default_posts)
+            if sort == 'rising':
+                size = min(size, 100)
+            order = data.listing_order(name, sort, size, query.get('t'))
+            return self._paged_posts(name, order, limit, after, query.get('before'))
+
+        match = re.match(r'^/user/([^/]+)/about$', path)
+        if match:
+            name = match.group(1)
+            rng = random.Random(_seed('user', name))
+            return {'kind': 't2', 'data': {
+                'id': format(_seed('u', name) % 36 ** 6, 'x'), 'name': name,
+                'created_utc': (EPOCH - timedelta(days=2000)).timestamp(),
+                'link_karma': rng.randrange(100_000), 'comment_karma': rng.randrange(200_000),
+                'is_employee': False, 'is_gold': False, 'is_mod': True, 'has_verified_email': True,
+            }}
+
+        match = re.match(r'^/user/([^/]+)/(submitted|comments)$', path)
+        if match:
+            name, kind = match.groups()
+            size = _size_from_name(name, 300)
+            if kind == 'submitted':
+                order = [i for i in range(data.unpublished, size) if i not in data.deleted]
+                return self._paged_posts('bench', order, limit, after, query.get('before'), author=name)
+
+            start = self._offset(after)
+            children = [data.comment(f"t3_u{i:x}", i, subreddit='bench', author=name)
+                        for i in range(start, min(size, start + limit))]
+            next_after = f"t1_offset{start + limit}" if start + limit < size else None
+            return data.listing(children, next_after)
+
+        match = re.match(r'^(?:/r/([^/]+))?/comments/([^/]+)', path)
+        if match:
+            subreddit, post_id = match.group(1) or 'bench', match.group(2)
+            link_id = f"t3_{post_id}"
+            post = data.lookup_post(link_id)
+            if post is None:
+                post = data.post(subreddit, 0)
+                post['data'].update({'id': post_id, 'name': link_id})
+            created = post['data']['created_utc']
+            comments = []
+            for i in range(COMMENTS_PER_POST):
+                top = data.comment(link_id, i, 0, subreddit=subreddit, post_created=created)
+                reply = data.comment(link_id, i, 1, parent_id=top['data']['name'], subreddit=subreddit,
+                                     post_created=created)
+                top['data']['replies'] = data.listing([reply])
+                comments.append(top)
+            hidden = [f"{link_id[-4:]}{i:x}d0" for i in range(COMMENTS_PER_POST, COMMENTS_PER_POST + MORE_COMMENTS_PER_POST)]
+            comments.append({'kind': 'more', 'data': {
+                'id': hidden[0], 'name': f"t1_{hidden[0]}", 'parent_id': link_id, 'depth': 0,
+                'count': len(hidden), 'children': hidden,
+            }})
+            return [data.listing([post]), data.listing(comments)]
+
+        if path == '/api/morechildren':
+            link_id = query.get('link_id', '')
+            post = data.lookup_post(link_id)
+            created = post['data']['created_utc'] if post else None
+            things = []
+            for comment_id in query.get('children', '').split(','):
+                index = int(comment_id[4:comment_id.rindex('d')], 16)
+                things.append(data.comment(link_id, index, 0, subreddit='bench', post_created=created))
+            return {'json': {'errors': [], 'data': {'things': things}}}
+
+        if path == '/api/info':
+            children = []
+            for fullname in query.get('id', '').split(','):
+                if fullname.startswith('t3_'):
+                    post = data.lookup_post(fullname)
+                    if post is None:
+                        post = data.post('bench', 0)
+                        post['data'].update({'id': fullname[3:], 'name': fullname})
+                    children.append(post)
+            return data.listing(children)
+
+        return None
+
+
+    def _paged_posts(self, subreddit, order, limit, after, before=None, author=None):
+        data = self.server.data
+
+        if before:
+            # Page towards newer posts: the `limit` posts listed just above the anchor
+            anchor = data.issued(before)
+            end = order.index(anchor[1]) if anchor and anchor[1] in order else 0
+            start = max(0, end - limit)
+            children = [data.post(subreddit, i, author) for i in order[start:end]]
+            newer = children[0]['data']['name'] if start > 0 and children else None
+            return data.listing(children, before=newer)
+
+        start = self._offset(after)
+        children = [data.post(subreddit, i, author) for i in order[start:start + limit]]
+        next_after = f"t3_offset{start + limit}" if start + limit < len(order) else None
+        return data.listing(children, next_after)
+
+
+    @staticmethod
+    def _offset(after):
+        """Listings page with opaque 'after' cursors; ours encode the offset."""
+        match = re.search(r'offset(\d+)$', after or '')
+        return int(match.group(1)) if match else 0
+
+
+    # ---------- Responses ----------
+
+    def _inject_error(self, youtube):
+        status = random.choice([429, 500, 503] + ([403] if youtube else []))
+        if status == 403:
+            body = {'error': {'code': 403, 'errors': [{'reason': 'rateLimitExceeded'}], 'message': 'Rate Limit Exceeded'}}
+        else:
+            body = {'error': {'code': status, 'message': 'Injected error'}}
+        headers = {'retry-after': '1'} if status == 429 else {}
+        self.server.count_error()
+        return self._send(status, json.dumps(body).encode('utf-8'), {'content-type': 'application/json', **headers})
+
+
+    def _send_json(self, status, body):
+        return self._send(status, json.dumps(body).encode('utf-8'), {'content-type': 'application/json'})
+
+
+    def _send(self, status, content, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if content:
+            self.wfile.write(content)
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    """Threaded fake API server; use as a context manager to run it in the background"""
+
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0, error_rate=0.0, videos=500, posts=1000, fixtures=None, seed=0):
+        """
+        Args:
+            port (int): Port to listen on (0 = any free port)
+            latency (float): Mean seconds added to every response (±50% jitter)
+            error_rate (float): Fraction of requests answered with 429/5xx/403 rate-limit errors
+            videos (int): Uploads for channels whose handle has no size suffix
+            posts (int): Posts for subreddits whose name has no size suffix
+            fixtures (str): Directory of recorded fixtures served before synthetic data
+            seed (int): Seed for latency jitter and error injection
+        """
+        super().__init__(('127.0.0.1', port), FakeAPIHandler)
+        random.seed(seed)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.data = FakeData(videos, posts)
+        self.fixtures = FixtureStore(fixtures) if fixtures else None
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/"
+
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+
+    def count_error(self):
+        with self._lock:
+            self.errors += 1
+
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean seconds per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of injected errors (0-1)")
+    parser.add_argument("--videos", type=int, default=500, help="Default uploads per channel")
+    parser.add_argument("--posts", type=int, default=1000, help="Default posts per subreddit")
+    parser.add_argument("--replay", help="Fixture directory recorded with benchmarks.transport")
+    args = parser.parse_args()
+
+    server = FakeAPIServer(args.port, args.latency, args.error_rate, args.videos, args.posts, args.replay)
+    print(f"🧪 Fake YouTube + Reddit API on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark: payload size and JSON parse time with and without fields= projections.
+
+Fetches the same uploads-playlist pages and videos.list batches twice, once
+with the full parts and once with the projections used by
+YouTubeChannelAnalyser, and reports bytes received and parse time for each.
+Uses about 4 × pages + 2 × batches quota units (playlist pages are walked
+once per variant to collect page tokens).
+
+Usage:
+    YOUTUBE_API_KEY=... python -m benchmarks.fields_projection @channel --videos 500
+"""
+
+import argparse
+import json
+import os
+import time
+
+from googleapiclient.http import build_http
+
+from platforms.youtube.api_client import YouTubeChannelAnalyser, PLAYLIST_FIELDS, VIDEO_FIELDS
+
+
+def measure(http, requests):
+    """
+    Execute raw requests and time their JSON parsing.
+
+    Returns:
+        dict: {"requests", "bytes", "parse_ms", "bodies"}
+    """
+    total_bytes = 0
+    parse_seconds = 0.0
+    bodies = []
+
+    for request in requests:
+        _, content = http.request(request.uri, method=request.method, headers=request.headers)
+        total_bytes += len(content)
+
+        start = time.perf_counter()
+        bodies.append(json.loads(content))
+        parse_seconds += time.perf_counter() - start
+
+    return {
+        "requests": len(requests),
+        "bytes": total_bytes,
+        "parse_ms": parse_seconds * 1000,
+        "bodies": bodies,
+    }
+
+
+def playlist_requests(youtube, playlist_id, max_videos, fields=None):
+    """Build the playlistItems requests for the first `max_videos` uploads."""
+    http = build_http()
+    requests = []
+    token = None
+
+    while len(requests) * 50 < max_videos:
+        request = youtube.playlistItems().list(
+            part='contentDetails', playlistId=playlist_id, maxResults=50, pageToken=token, fields=fields
+        )
+        requests.append(request)
+
+        # Page tokens are needed to build the next request
+        _, content = http.request(request.uri)
+        token = json.loads(content).get('nextPageToken')
+        if not token:
+            break
+
+    return requests
+
+
+def report(label, full, projected):
+    """Print one before/after comparison row."""
+    saved = (1 - projected['bytes'] / full['bytes']) * 100 if full['bytes'] else 0
+    speedup = full['parse_ms'] / projected['parse_ms'] if projected['parse_ms'] else 0
+    print(f"{label:<16} {full['requests']:>5} req | "
+          f"{full['bytes'] / 1024:>9.1f} KB → {projected['bytes'] / 1024:>8.1f} KB ({saved:.0f}% smaller) | "
+          f"parse {full['parse_ms']:>7.1f} ms → {projected['parse_ms']:>6.1f} ms ({speedup:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("channel", help="Channel ID, handle or URL")
+    parser.add_argument("--videos", type=int, default=500, help="Uploads to include (default: 500)")
+    parser.add_argument("--api-key", default=os.environ.get("YOUTUBE_API_KEY"))
+    args = parser.parse_args()
+
+    if not args.api_key:
+        parser.error("Set YOUTUBE_API_KEY or pass --api-key")
+
+    analyser = YouTubeChannelAnalyser(args.api_key, use_cache=False)
+    channel_id = analyser.extract_channel_id(args.channel)
+    stats = analyser.get_channel_statistics(channel_id)
+    youtube = analyser.youtube
+    http = build_http()
+
+    # Playlist pages
+    full_pages = measure(http, playlist_requests(youtube, stats['uploads_playlist_id'], args.videos))
+    projected_pages = measure(http, playlist_requests(youtube, stats['uploads_playlist_id'], args.videos, PLAYLIST_FIELDS))
+
+    video_ids = [
+        item['contentDetails']['videoId']
+        for body in projected_pages['bodies']
+        for item in body.get('items', [])
+    ][:args.videos]
+    batches = [','.join(video_ids[i:i+50]) for i in range(0, len(video_ids), 50)]
+
+    # Video detail batches
+    part = 'snippet,statistics,contentDetails,status'
+    full_videos = measure(http, [youtube.videos().list(part=part, id=batch) for batch in batches])
+    projected_videos = measure(http, [youtube.videos().list(part=part, id=batch, fields=VIDEO_FIELDS) for batch in batches])
+
+    print(f"\n📦 fields= projection benchmark: {stats['channel_name']} ({len(video_ids)} videos)")
+    print("=" * 100)
+    report("playlistItems", full_pages, projected_pages)
+    report("videos", full_videos, projected_videos)
+    report("total",
+           {k: full_pages[k] + full_videos[k] for k in ("requests", "bytes", "parse_ms")},
+           {k: projected_pages[k] + projected_videos[k] for k in ("requests", "bytes", "parse_ms")})
+
+
+if __name__ == "__main__":
+    main()
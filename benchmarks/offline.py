@@ -0,0 +1,109 @@
+"""
+Benchmark: end-to-end fetch paths against the offline fake API server.
+
+Starts benchmarks.fake_api in-process and times full analyses through the
+real clients - YouTube on the thread pool vs. the async backend (cold and
+warm response cache) and Reddit subreddit/user analysis - with no network
+access, credentials or quota.
+
+Usage:
+    python -m benchmarks.offline --videos 2000 --posts 1000 --latency 0.05
+    python -m benchmarks.offline --error-rate 0.02 --pace off
+    python -m benchmarks.offline --replay fixtures/ --channel @channel --subreddit python
+"""
+
+import argparse
+import io
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from core import rate_limiter
+from benchmarks.fake_api import FakeAPIServer
+
+
+def timed(fn, *args, **kwargs):
+    """Wall time of one call with the clients' progress output silenced."""
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def bench_youtube(url, channel, cache_dir):
+    """Sync vs. async channel analysis, each with a cold then warm cache."""
+    from platforms.youtube.api_client import YouTubeChannelAnalyser
+
+    for label, async_backend in (("threads", False), ("async", True)):
+        run_cache = tempfile.mkdtemp(dir=cache_dir)
+        analyser = YouTubeChannelAnalyser(
+            "offline-benchmark", cache_dir=run_cache, async_backend=async_backend, api_endpoint=url
+        )
+
+        for state in ("cold", "warm"):
+            calls_before = analyser.quota_units_used
+            seconds, (_, df) = timed(analyser.get_channel_data, channel)
+            units = analyser.quota_units_used - calls_before
+            print(f"YouTube {label:<7} {state} | {len(df):>6} videos in {seconds:6.2f}s | {units:>4} quota units")
+
+
+def bench_reddit(url, subreddit, user, posts):
+    """Subreddit and user analysis through PRAW."""
+    from platforms.reddit.api_client import RedditAnalyser
+
+    root = url.rstrip('/')
+    with redirect_stdout(io.StringIO()):
+        analyser = RedditAnalyser("offline", "benchmark", "social-analytics-hub benchmark",
+                                  oauth_url=root, reddit_url=root)
+
+    seconds, data = timed(analyser.analyze_subreddit, subreddit, limit=posts)
+    print(f"Reddit  subreddit    | {len(data['posts']):>6} posts  in {seconds:6.2f}s")
+
+    seconds, data = timed(analyser.analyze_user, user, limit=posts)
+    print(f"Reddit  user         | {len(data['posts']):>6} posts  in {seconds:6.2f}s "
+          f"(+{len(data['comments'])} comments)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=2000, help="Uploads on the synthetic channel")
+    parser.add_argument("--posts", type=int, default=1000, help="Posts to analyse per subreddit/user")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean seconds per fake response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of injected errors (0-1)")
+    parser.add_argument("--pace", choices=["on", "off"], default="on",
+                        help="'off' lifts the client-side pacers to measure raw transport cost")
+    parser.add_argument("--replay", help="Fixture directory recorded with benchmarks.transport")
+    parser.add_argument("--channel", help="Channel to analyse (default: synthetic @bench_<videos>)")
+    parser.add_argument("--subreddit", help="Subreddit to analyse (default: synthetic bench_<posts>)")
+    parser.add_argument("--user", default="bench_user", help="Reddit user to analyse")
+    args = parser.parse_args()
+
+    if args.pace == "off":
+        # Must happen before the first get_pacer() call creates the shared pacers
+        for name in ("youtube", "reddit"):
+            rate_limiter.PACER_SETTINGS[name] = {"rate": 1e6, "burst": 1000}
+
+    channel = args.channel or f"@bench_{args.videos}"
+    subreddit = args.subreddit or f"bench_{args.posts}"
+    cache_dir = tempfile.mkdtemp(prefix="offline-bench-")
+
+    server = FakeAPIServer(latency=args.latency, error_rate=args.error_rate, videos=args.videos,
+                           posts=args.posts, fixtures=args.replay)
+    print(f"\n🧪 Offline fetch benchmark on {server.url} "
+          f"(latency {args.latency * 1000:.0f} ms, errors {args.error_rate:.0%}, pacing {args.pace})")
+    print("=" * 86)
+
+    try:
+        with server:
+            bench_youtube(server.url, channel, cache_dir)
+            bench_reddit(server.url, subreddit, args.user, args.posts)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print("=" * 86)
+    print(f"📡 {server.requests} requests served, {server.errors} injected errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: PRAW Submission objects vs. the raw-JSON listing fast path.
+
+Pages the same subreddit and user listings through both parsers against
+the offline fake API server (no network, no credentials) and checks that
+they build identical DataFrames. Latency is zero and pacing is lifted by
+default, so the timings are the client-side cost of turning listing pages
+into a DataFrame.
+
+Usage:
+    python -m benchmarks.reddit_listings --posts 1000 --repeat 5
+"""
+
+import argparse
+import io
+import time
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from core import rate_limiter
+from benchmarks.fake_api import FakeAPIServer
+
+
+def best_of(fn, repeat):
+    """Best wall time of `repeat` runs, plus the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=1000, help="Posts per listing")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean seconds per fake response")
+    args = parser.parse_args()
+
+    for name in ("youtube", "reddit"):
+        rate_limiter.PACER_SETTINGS[name] = {"rate": 1e6, "burst": 1000}
+
+    from platforms.reddit.api_client import RedditAnalyser
+
+    print(f"\n🧮 Reddit listing parsing benchmark ({args.posts} posts per listing)")
+    print("=" * 86)
+
+    with FakeAPIServer(latency=args.latency, posts=args.posts) as server:
+        root = server.url.rstrip('/')
+        with redirect_stdout(io.StringIO()):
+            analysers = {
+                raw: RedditAnalyser("offline", "benchmark", "social-analytics-hub benchmark",
+                                    raw_listings=raw, oauth_url=root, reddit_url=root)
+                for raw in (False, True)
+            }
+
+        subreddit = analysers[False].reddit.subreddit(f"bench_{args.posts}")
+        subreddit._fetch()
+        user = analysers[False].reddit.redditor("bench_user")
+
+        cases = {
+            "subreddit hot": lambda a: a._fetch_subreddit_posts(subreddit, args.posts, subreddit.subscribers),
+            "user submitted": lambda a: a._fetch_user_posts(user, args.posts),
+        }
+
+        for label, fetch in cases.items():
+            praw_seconds, praw_df = best_of(lambda: fetch(analysers[False]), args.repeat)
+            raw_seconds, raw_df = best_of(lambda: fetch(analysers[True]), args.repeat)
+
+            # Both paths must produce the same table
+            pd.testing.assert_frame_equal(praw_df, raw_df, check_dtype=False)
+
+            print(f"{label:<15} | {len(raw_df):>5} posts | PRAW objects {praw_seconds * 1000:>8.1f} ms → "
+                  f"raw JSON {raw_seconds * 1000:>7.1f} ms | {praw_seconds / raw_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
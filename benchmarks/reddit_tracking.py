@@ -0,0 +1,80 @@
+"""
+Offline check: incremental post tracking survives a vanished anchor.
+
+Tracks a subreddit and a user into a fresh post store against the fake
+API server, then simulates the cases a long-running store meets:
+new arrivals, nothing new, and the newest stored post being deleted (so
+Reddit answers the `before` page with an empty listing) while new posts
+keep arriving. Every step asserts how many posts the store gained.
+
+Usage:
+    python -m benchmarks.reddit_tracking --posts 300
+"""
+
+import argparse
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from core import rate_limiter
+from benchmarks.fake_api import FakeAPIServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=300, help="Posts in the fake subreddit and user listings")
+    args = parser.parse_args()
+
+    for name in ("youtube", "reddit"):
+        rate_limiter.PACER_SETTINGS[name] = {"rate": 1e6, "burst": 1000}
+
+    from platforms.reddit.api_client import RedditAnalyser
+
+    print(f"\n🗄️ Reddit post tracking check ({args.posts} posts per listing)")
+    print("=" * 86)
+
+    with FakeAPIServer(posts=args.posts) as server, tempfile.TemporaryDirectory() as tmp:
+        root = server.url.rstrip('/')
+        data = server.data
+        with redirect_stdout(io.StringIO()):
+            analyser = RedditAnalyser("offline", "check", "social-analytics-hub check", oauth_url=root,
+                                      reddit_url=root, store_path=os.path.join(tmp, "posts.db"))
+        store = analyser.post_store
+
+        sources = {
+            f"r/bench_{args.posts}": lambda: analyser.analyze_subreddit(f"bench_{args.posts}", limit=args.posts,
+                                                                        track_history=True),
+            f"u/bench_{args.posts}": lambda: analyser.analyze_user(f"bench_{args.posts}", limit=args.posts,
+                                                                   track_history=True),
+        }
+
+        def track(label, expected_new):
+            for source, run in sources.items():
+                before, requests = store.count(source), server.requests
+                with redirect_stdout(io.StringIO()):
+                    run()
+                gained = store.count(source) - before
+                assert gained == expected_new, f"{label} ({source}): expected {expected_new} new posts, got {gained}"
+                print(f"{label:<32} | {source:<12} | +{gained:>3} posts | {server.requests - requests:>3} requests")
+
+        data.unpublished = 50
+        track("first run", args.posts - 50)
+
+        data.unpublished = 30
+        track("20 new posts", 20)
+
+        track("nothing new", 0)
+
+        # Delete the newest stored post: the `before` anchor is gone
+        data.deleted.add(30)
+        data.unpublished = 15
+        track("anchor deleted, 15 new posts", 15)
+
+        track("nothing new after recovery", 0)
+
+    print("✅ Store kept up through a deleted anchor")
+
+
+if __name__ == "__main__":
+    main()
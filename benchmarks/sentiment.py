@@ -0,0 +1,84 @@
+"""
+Benchmark: per-comment VADER loop vs. the batched scoring engine.
+
+Scores a synthetic comment set (fake-API style texts plus a share of
+short duplicate replies such as "first!" or emoji-only comments) once
+with the original one-dict-per-comment loop and then with
+SentimentScorer, cold (empty cache) and warm (repeat analysis), and
+checks that the scores are identical.
+
+Usage:
+    python -m benchmarks.sentiment --comments 100000 --duplicates 0.3 --processes 4
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from benchmarks.fake_api import _text
+from sentiment_scoring import SentimentScorer, SentimentIntensityAnalyzer
+
+
+DUPLICATE_REPLIES = ["first!", "First", "😂😂😂", "🔥🔥", "❤️", "lol", "LOL", "who's here in 2026?",
+                     "This is gold", "Underrated", "👍", "W", "L", "so good!!", "Amazing video"]
+
+
+def make_comments(count, duplicates, seed=0):
+    """Synthetic comment texts; `duplicates` of them are drawn from a small pool of stock replies."""
+    rng = random.Random(seed)
+    return [
+        rng.choice(DUPLICATE_REPLIES) if rng.random() < duplicates else _text(rng, 40)
+        for _ in range(count)
+    ]
+
+
+def loop_scores(texts):
+    """The original analyze_comments loop: polarity_scores and one dict per comment."""
+    analyzer = SentimentIntensityAnalyzer()
+    rows = []
+    for text in texts:
+        scores = analyzer.polarity_scores(text)
+        rows.append({'compound': scores['compound'], 'positive': scores['pos'],
+                     'negative': scores['neg'], 'neutral': scores['neu']})
+    return pd.DataFrame(rows)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--comments", type=int, default=100_000, help="Comments to score")
+    parser.add_argument("--duplicates", type=float, default=0.3, help="Share of stock duplicate replies")
+    parser.add_argument("--processes", type=int, default=None, help="Scoring processes (default: CPU count)")
+    args = parser.parse_args()
+
+    texts = make_comments(args.comments, args.duplicates)
+    unique = len(set(texts))
+
+    print(f"\n🧠 VADER scoring benchmark ({args.comments:,} comments, {unique:,} distinct)")
+    print("=" * 86)
+
+    loop_seconds, expected = timed(lambda: loop_scores(texts))
+    print(f"{'per-comment loop':<22} | {loop_seconds:>7.2f} s | {args.comments / loop_seconds:>9,.0f} comments/s")
+
+    scorer = SentimentScorer(processes=args.processes)
+    try:
+        for label in ("engine (cold cache)", "engine (warm cache)"):
+            seconds, scores = timed(lambda: scorer.score(texts))
+            pd.testing.assert_frame_equal(scores[expected.columns], expected)
+            print(f"{label:<22} | {seconds:>7.2f} s | {args.comments / seconds:>9,.0f} comments/s | "
+                  f"{loop_seconds / seconds:>6.1f}x")
+    finally:
+        scorer.close()
+
+    print(f"processes: {scorer.processes} | cache: {scorer.cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
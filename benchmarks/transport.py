@@ -0,0 +1,189 @@
+"""
+Record/replay HTTP transports for offline benchmarks.
+
+RecordingHttp (httplib2, used by googleapiclient) and RecordingSession
+(requests, used by prawcore) pass calls through to the real API and save
+every response as a JSON fixture. ReplayHttp / ReplaySession serve those
+fixtures without a network, and benchmarks.fake_api can serve them over HTTP.
+
+Fixtures are keyed by method + path + sorted query string, with credentials
+(`key`, `access_token`) removed, so a recording made against the real API
+replays against any host.
+
+Usage (record a real channel and subreddit once):
+    YOUTUBE_API_KEY=... REDDIT_CLIENT_ID=... REDDIT_CLIENT_SECRET=... \\
+        python -m benchmarks.transport fixtures/ --channel @channel --subreddit python
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+import httplib2
+import requests
+from googleapiclient.http import build_http
+
+
+SECRET_PARAMS = {'key', 'access_token'}
+REPLAY_TOKEN = {'access_token': 'replay', 'token_type': 'bearer', 'expires_in': 86400, 'scope': '*'}
+
+
+def fixture_key(method, url):
+    """Host-independent fixture key for a request."""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SECRET_PARAMS)
+    normalized = f"{method.upper()} {parts.path.rstrip('/')}?{urlencode(query)}"
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest(), normalized
+
+
+class FixtureStore:
+    """One JSON file per recorded response"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+
+    def save(self, method, url, status, headers, content):
+        """Write one response fixture."""
+        key, normalized = fixture_key(method, url)
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Never write live OAuth tokens to disk
+        if '/api/v1/access_token' in normalized:
+            content = json.dumps(REPLAY_TOKEN).encode()
+
+        fixture = {
+            'request': normalized,
+            'status': status,
+            'headers': {k.lower(): v for k, v in headers.items() if k.lower() in ('content-type', 'etag', 'retry-after')},
+            'content': content.decode('utf-8', errors='replace'),
+        }
+        with open(os.path.join(self.directory, f"{key}.json"), 'w', encoding='utf-8') as f:
+            json.dump(fixture, f)
+
+
+    def load(self, method, url):
+        """Get a recorded response (None if the request was never recorded)."""
+        key, _ = fixture_key(method, url)
+        path = os.path.join(self.directory, f"{key}.json")
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+# ==================== HTTPLIB2 (YouTube) ====================
+
+class RecordingHttp:
+    """httplib2 transport that records every response"""
+
+    def __init__(self, store, http=None):
+        self.store = store
+        self.http = http or build_http()
+
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        response, content = self.http.request(uri, method=method, body=body, headers=headers, **kwargs)
+        if response.status < 300:
+            self.store.save(method, uri, response.status, response, content)
+        return response, content
+
+
+class ReplayHttp:
+    """httplib2 transport that serves recorded fixtures (404 when missing)"""
+
+    def __init__(self, store):
+        self.store = store
+
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        fixture = self.store.load(method, uri)
+        if fixture is None:
+            error = {'error': {'code': 404, 'message': f"No fixture for {fixture_key(method, uri)[1]}"}}
+            return httplib2.Response({'status': 404, 'content-type': 'application/json'}), json.dumps(error).encode()
+
+        response = httplib2.Response({**fixture['headers'], 'status': fixture['status']})
+        return response, fixture['content'].encode('utf-8')
+
+
+# ==================== REQUESTS (Reddit) ====================
+
+class RecordingSession(requests.Session):
+    """requests session that records every response (pass as requestor_kwargs={'session': ...})"""
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+
+    def request(self, method, url, params=None, **kwargs):
+        response = super().request(method, url, params=params, **kwargs)
+        if response.status_code < 300:
+            self.store.save(method, response.url, response.status_code, response.headers, response.content)
+        return response
+
+
+class ReplaySession(requests.Session):
+    """requests session that serves recorded fixtures (404 when missing)"""
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+
+    def request(self, method, url, params=None, **kwargs):
+        prepared = requests.Request(method, url, params=params).prepare()
+        fixture = self.store.load(method, prepared.url)
+
+        response = requests.Response()
+        response.url = prepared.url
+        response.request = prepared
+        if fixture is None:
+            response.status_code = 404
+            response._content = json.dumps({'message': 'Not Found', 'error': 404}).encode()
+            response.headers['content-type'] = 'application/json'
+        else:
+            response.status_code = fixture['status']
+            response._content = fixture['content'].encode('utf-8')
+            response.headers.update(fixture['headers'])
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory", help="Fixture directory")
+    parser.add_argument("--channel", help="YouTube channel to record")
+    parser.add_argument("--videos", type=int, default=500, help="Uploads to record (default: 500)")
+    parser.add_argument("--subreddit", help="Subreddit to record")
+    parser.add_argument("--posts", type=int, default=200, help="Posts to record (default: 200)")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.directory)
+
+    if args.channel:
+        from platforms.youtube.api_client import YouTubeChannelAnalyser
+        from platforms.youtube.client_factory import client_factory
+
+        client_factory.http_pool.reset(http_factory=lambda: RecordingHttp(store))
+        analyser = YouTubeChannelAnalyser(os.environ["YOUTUBE_API_KEY"], use_cache=False)
+        analyser.get_channel_data(args.channel, max_videos=args.videos)
+
+    if args.subreddit:
+        from platforms.reddit.api_client import RedditAnalyser
+
+        analyser = RedditAnalyser(
+            os.environ["REDDIT_CLIENT_ID"],
+            os.environ["REDDIT_CLIENT_SECRET"],
+            "social-analytics-hub fixture recorder",
+            requestor_kwargs={'session': RecordingSession(store)}
+        )
+        analyser.analyze_subreddit(args.subreddit, limit=args.posts)
+
+    print(f"📼 Fixtures saved to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
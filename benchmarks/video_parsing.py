@@ -0,0 +1,178 @@
+"""
+Benchmark: per-video vs columnar parsing of videos.list items.
+
+Generates synthetic videos.list items (no API calls, no quota) and times
+the old per-item path (isodate + fromisoformat + strftime + int() casts
+into dicts, then a re-typed DataFrame) against VideoColumnBuilder, which
+collects raw fields and parses them in one vectorized pass, and against
+the production full-fetch path (_fetch_all_videos -> iter_video_frames,
+worker pool and chunking included) fed the same items as prefetched pages.
+
+Usage:
+    python -m benchmarks.video_parsing --videos 10000 20000 50000
+"""
+
+import argparse
+import io
+import random
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+
+import isodate
+import pandas as pd
+
+from platforms.youtube.api_client import YouTubeChannelAnalyser
+from platforms.youtube.columnar import VideoColumnBuilder
+
+
+def synthetic_items(count, seed=0):
+    """Build `count` videos.list items shaped like VIDEO_FIELDS responses."""
+    rng = random.Random(seed)
+    start = datetime(2010, 1, 1, tzinfo=timezone.utc)
+    items = []
+
+    for i in range(count):
+        published = start + timedelta(seconds=rng.randrange(15 * 365 * 86400))
+        hours, minutes, seconds = rng.randrange(3), rng.randrange(60), rng.randrange(60)
+        duration = "PT" + (f"{hours}H" if hours else "") + (f"{minutes}M" if minutes else "") + f"{seconds}S"
+
+        items.append({
+            'id': f"vid{i:08d}",
+            'snippet': {
+                'title': f"Video {i}",
+                'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'tags': ['tag'] * rng.randrange(5),
+                'categoryId': str(rng.randrange(1, 30)),
+                'description': "lorem ipsum " * rng.randrange(60),
+            },
+            'statistics': {
+                'viewCount': str(rng.randrange(10_000_000)),
+                'likeCount': str(rng.randrange(100_000)),
+                'commentCount': str(rng.randrange(10_000)),
+            },
+            'contentDetails': {'duration': duration},
+            'status': {'privacyStatus': 'public' if rng.random() > 0.02 else 'private'},
+        })
+
+    return items
+
+
+def per_item_frame(items):
+    """The previous parser: one dict per video, then a re-typed DataFrame."""
+    rows = []
+
+    for item in items:
+        if item['status']['privacyStatus'] != 'public':
+            continue
+
+        snippet = item['snippet']
+        stats = item.get('statistics', {})
+
+        try:
+            duration_seconds = int(isodate.parse_duration(item['contentDetails']['duration']).total_seconds())
+        except Exception:
+            duration_seconds = 0
+
+        try:
+            upload_date = datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00'))
+        except Exception:
+            upload_date = datetime.now(timezone.utc)
+
+        view_count = int(stats.get('viewCount', 0))
+        like_count = int(stats.get('likeCount', 0))
+        comment_count = int(stats.get('commentCount', 0))
+        engagement_rate = ((like_count + comment_count) / view_count * 100) if view_count > 0 else 0.0
+
+        rows.append({
+            'video_id': item['id'],
+            'title': snippet['title'],
+            'upload_date': upload_date,
+            'view_count': view_count,
+            'like_count': like_count,
+            'comment_count': comment_count,
+            'engagement_rate': round(engagement_rate, 4),
+            'duration_seconds': duration_seconds,
+            'tags': snippet.get('tags', []),
+            'category_id': snippet.get('categoryId', ''),
+            'publish_day': upload_date.strftime('%A'),
+            'publish_hour': upload_date.hour,
+            'description': snippet.get('description', '')[:500],
+        })
+
+    df = pd.DataFrame(rows)
+    for column in ('view_count', 'like_count', 'comment_count', 'duration_seconds'):
+        df[column] = df[column].astype('int64')
+    df['engagement_rate'] = df['engagement_rate'].astype('float64')
+    df['upload_date'] = pd.to_datetime(df['upload_date'], utc=True)
+
+    return df
+
+
+def columnar_frame(items, batch_size=50):
+    """The columnar parser, fed one 50-item API batch at a time."""
+    builder = VideoColumnBuilder()
+    for i in range(0, len(items), batch_size):
+        builder.add_items(items[i:i + batch_size])
+    return builder.to_frame()
+
+
+def pipeline_frame(analyser, items, batch_size=50):
+    """
+    The production full fetch: _fetch_all_videos over prefetched pages.
+
+    Playlist pages and videos.list batches are served from memory, so the
+    timing covers the worker pool, chunking and typing, not the network.
+    """
+    pages = [[item['id'] for item in items[i:i + batch_size]] for i in range(0, len(items), batch_size)]
+    batches = {page[0]: items[i * batch_size:(i + 1) * batch_size] for i, page in enumerate(pages)}
+
+    analyser.iter_playlist_pages = lambda *args, **kwargs: iter(pages)
+    analyser._fetch_video_batch = lambda page_ids: batches[page_ids[0]]
+
+    with redirect_stdout(io.StringIO()):
+        df = analyser._fetch_all_videos({'uploads_playlist_id': 'UUbenchmark'}, None)
+    return df.drop(columns=['stats_refreshed_at'])
+
+
+def best_of(fn, items, repeat):
+    """Best wall time of `repeat` runs, plus the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(items)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, nargs="+", default=[10000, 50000], help="Channel sizes to simulate")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    with redirect_stdout(io.StringIO()):
+        analyser = YouTubeChannelAnalyser("offline-benchmark", use_cache=False, cache_dir=tempfile.mkdtemp())
+    pipeline = lambda items: pipeline_frame(analyser, items)
+
+    print("\n🧮 Video parsing benchmark (synthetic videos.list items)")
+    print("=" * 86)
+
+    for count in args.videos:
+        items = synthetic_items(count)
+        old_seconds, old_df = best_of(per_item_frame, items, args.repeat)
+        new_seconds, new_df = best_of(columnar_frame, items, args.repeat)
+        pipeline_seconds, pipeline_df = best_of(pipeline, items, args.repeat)
+
+        # Every path must produce the same table
+        pd.testing.assert_frame_equal(old_df, new_df, check_dtype=False)
+        pd.testing.assert_frame_equal(old_df, pipeline_df, check_dtype=False)
+
+        print(f"{count:>7} videos | per-item {old_seconds * 1000:>8.1f} ms → "
+              f"columnar {new_seconds * 1000:>7.1f} ms ({old_seconds / new_seconds:.1f}x) → "
+              f"full-fetch pipeline {pipeline_seconds * 1000:>7.1f} ms ({old_seconds / pipeline_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
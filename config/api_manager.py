@@ -2,17 +2,14 @@
 # Centralized API key and quota management
 
 import streamlit as st
-from datetime import datetime, timedelta
-import json
-import os
+from .quota_manager import quota_manager
 
 
 class APIManager:
-    """Manage API keys and usage quotas"""
+    """Manage API keys; usage is tracked in the shared quota ledger"""
     
     def __init__(self):
-        self.quota_file = ".quota_tracker.json"
-        self.reset_quota_if_needed()
+        self.quota = quota_manager
     
     
     def get_youtube_key(self, user_key=None):
@@ -33,9 +30,8 @@ class APIManager:
         if "youtube" in st.secrets:
             key = st.secrets["youtube"]["api_key"]
             
-            # Check if quota available
+            # Check if quota available (YouTube calls are metered per request)
             if self.check_quota("youtube"):
-                self.increment_usage("youtube")
                 return key
             else:
                 st.error("⚠️ Daily quota limit reached. Please try again tomorrow or provide your own API key.")
@@ -84,80 +80,26 @@ class APIManager:
     
     def check_quota(self, platform):
         """Check if quota is available for platform."""
-        usage = self.load_usage()
-        today = datetime.now().date().isoformat()
-        
-        if today not in usage:
-            return True
-        
-        platform_usage = usage[today].get(platform, 0)
-        max_daily = st.secrets.get("quota", {}).get("max_daily_requests", 100)
-        
-        return platform_usage < max_daily
+        return self.quota.can_make_request(platform)
     
     
     def increment_usage(self, platform):
         """Increment usage counter for platform."""
-        usage = self.load_usage()
-        today = datetime.now().date().isoformat()
-        
-        if today not in usage:
-            usage[today] = {}
-        
-        if platform not in usage[today]:
-            usage[today][platform] = 0
-        
-        usage[today][platform] += 1
-        
-        self.save_usage(usage)
+        self.quota.increment_usage(platform)
     
     
     def get_remaining_quota(self, platform):
         """Get remaining quota for today."""
-        usage = self.load_usage()
-        today = datetime.now().date().isoformat()
-        
-        platform_usage = usage.get(today, {}).get(platform, 0)
-        max_daily = st.secrets.get("quota", {}).get("max_daily_requests", 100)
-        
-        return max_daily - platform_usage
-    
-    
-    def reset_quota_if_needed(self):
-        """Reset quota if new day."""
-        usage = self.load_usage()
-        today = datetime.now().date().isoformat()
-        
-        # Remove old dates
-        usage = {k: v for k, v in usage.items() if k == today}
-        
-        self.save_usage(usage)
-    
-    
-    def load_usage(self):
-        """Load usage data from file."""
-        if not os.path.exists(self.quota_file):
-            return {}
-        
-        try:
-            with open(self.quota_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    
-    
-    def save_usage(self, usage):
-        """Save usage data to file."""
-        with open(self.quota_file, 'w') as f:
-            json.dump(usage, f)
+        return self.quota.get_usage_stats(platform)["remaining"]
     
     
     def show_quota_info(self, platform):
         """Display quota information in sidebar."""
-        remaining = self.get_remaining_quota(platform)
-        max_daily = st.secrets.get("quota", {}).get("max_daily_requests", 100)
+        stats = self.quota.get_usage_stats(platform)
+        remaining = stats["remaining"]
+        max_daily = stats["limit"]
         
-        percentage = (remaining / max_daily) * 100
+        percentage = (remaining / max_daily) * 100 if max_daily > 0 else 0
         
         if percentage > 50:
             color = "#10B981"  # Green
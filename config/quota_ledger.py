@@ -0,0 +1,152 @@
+# config/quota_ledger.py
+# Process-safe daily quota ledger backed by SQLite
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+
+class QuotaLedger:
+    """
+    Shared quota ledger for every session and server process.
+
+    Increments are single UPSERT statements, so concurrent processes never
+    lose updates. Reads are served from an in-memory copy of today's rows
+    that is refreshed from disk at most every `refresh_interval` seconds.
+    The current day is computed on every call, so the ledger rolls over at
+    midnight UTC without a restart.
+    """
+
+    def __init__(self, db_path=".quota_ledger.db", refresh_interval=2.0, legacy_file=".quota_usage.json"):
+        """
+        Initialize the ledger.
+
+        Args:
+            db_path (str): SQLite database file
+            refresh_interval (float): Max age in seconds of the in-memory counts
+            legacy_file (str): Old JSON usage file imported when the database is created
+        """
+        self.db_path = db_path
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+
+        is_new = not os.path.exists(db_path)
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage (
+                day TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                units INTEGER NOT NULL,
+                PRIMARY KEY (day, platform, endpoint)
+            )
+        """)
+
+        self._day = None
+        self._counts = {}
+        self._loaded_at = 0.0
+
+        if is_new and legacy_file:
+            self._import_legacy(legacy_file)
+
+
+    @staticmethod
+    def today():
+        """Current quota day (quotas reset at midnight UTC)."""
+        return datetime.now(timezone.utc).date().isoformat()
+
+
+    def add(self, platform, endpoint, units):
+        """
+        Atomically add units to today's counter.
+
+        Args:
+            platform (str): "youtube" or "reddit"
+            endpoint (str): Endpoint name (None for untyped usage)
+            units (int): Units to add
+        """
+        day = self.today()
+        key = (platform, endpoint or '')
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO usage (day, platform, endpoint, units) VALUES (?, ?, ?, ?)
+                ON CONFLICT (day, platform, endpoint) DO UPDATE SET units = units + excluded.units
+                """,
+                (day, platform, key[1], units)
+            )
+
+            if self._day == day:
+                self._counts[key] = self._counts.get(key, 0) + units
+
+
+    def used(self, platform):
+        """Get today's total units for a platform."""
+        counts = self._current_counts()
+        return sum(units for (p, _), units in counts.items() if p == platform)
+
+
+    def endpoint_usage(self, platform):
+        """
+        Get today's units for a platform by endpoint.
+
+        Returns:
+            dict: {endpoint: units}, untyped usage excluded
+        """
+        counts = self._current_counts()
+        return {endpoint: units for (p, endpoint), units in counts.items() if p == platform and endpoint}
+
+
+    def prune(self, keep_days=7):
+        """Delete rows older than `keep_days` days."""
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=keep_days - 1)).isoformat()
+        with self._lock:
+            self._conn.execute("DELETE FROM usage WHERE day < ?", (cutoff,))
+
+
+    def _current_counts(self):
+        """Today's counts, reloaded when stale or when the day rolled over."""
+        day = self.today()
+
+        with self._lock:
+            if day != self._day or time.monotonic() - self._loaded_at > self.refresh_interval:
+                rows = self._conn.execute(
+                    "SELECT platform, endpoint, units FROM usage WHERE day = ?", (day,)
+                ).fetchall()
+                self._counts = {(platform, endpoint): units for platform, endpoint, units in rows}
+                self._day = day
+                self._loaded_at = time.monotonic()
+
+            return dict(self._counts)
+
+
+    def _import_legacy(self, legacy_file):
+        """Carry usage over from the old JSON file."""
+        if not os.path.exists(legacy_file):
+            return
+
+        try:
+            with open(legacy_file, 'r') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        with self._lock:
+            for day, platforms in legacy.items():
+                endpoints = platforms.get("endpoints", {})
+                for platform, total in platforms.items():
+                    if platform == "endpoints":
+                        continue
+                    typed = endpoints.get(platform, {})
+                    rows = [(day, platform, endpoint, units) for endpoint, units in typed.items()]
+                    rows.append((day, platform, '', total - sum(typed.values())))
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO usage (day, platform, endpoint, units) VALUES (?, ?, ?, ?)",
+                        [row for row in rows if row[3] > 0]
+                    )
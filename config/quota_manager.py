@@ -1,60 +1,72 @@
 # config/quota_manager.py
 # Simple quota tracking for free-tier API usage
+# YouTube usage is metered in Data API cost units per endpoint call;
+# Reddit usage is counted per analysis.
+# Counts live in the shared QuotaLedger (SQLite), so every session and
+# server process sees the same numbers.
 
 import streamlit as st
-from datetime import datetime, date
-import json
-import os
+from .quota_ledger import QuotaLedger
 
 
 class QuotaManager:
     """Track and limit API usage to stay within free tier"""
     
-    def __init__(self):
-        self.quota_file = ".quota_usage.json"
-        self.today = date.today().isoformat()
-        self._cleanup_old_data()
+    # Default daily limits (YouTube: Data API units, Reddit: analyses)
+    DEFAULT_LIMITS = {"youtube": 10000, "reddit": 1000}
     
+    def __init__(self, ledger=None):
+        self.ledger = ledger or QuotaLedger()
+        self.ledger.prune(keep_days=7)
     
-    def can_make_request(self, platform):
+    
+    def can_make_request(self, platform, units=1):
         """
-        Check if we can make another request today.
+        Check if we can spend more quota today.
         
         Args:
             platform (str): "youtube" or "reddit"
+            units (int): Quota the request is expected to cost
         
         Returns:
             bool: True if quota available
         """
-        usage = self._load_usage()
-        
-        # Get today's usage
-        today_usage = usage.get(self.today, {}).get(platform, 0)
+        today_usage = self.ledger.used(platform)
         
-        # Get limit from secrets
-        limit_key = f"{platform}_daily_limit"
-        if "limits" in st.secrets and limit_key in st.secrets["limits"]:
-            limit = st.secrets["limits"][limit_key]
-        else:
-            # Default limits
-            limit = 50 if platform == "youtube" else 1000
-        
-        return today_usage < limit
+        return today_usage + units <= self._get_limit(platform)
     
     
-    def increment_usage(self, platform):
+    def increment_usage(self, platform, units=1):
         """Record that we made a request."""
-        usage = self._load_usage()
-        
-        if self.today not in usage:
-            usage[self.today] = {}
-        
-        if platform not in usage[self.today]:
-            usage[self.today][platform] = 0
+        self.record_call(platform, None, units)
+    
+    
+    def record_call(self, platform, endpoint, units=1):
+        """
+        Record quota spent by one API call.
         
-        usage[self.today][platform] += 1
+        Args:
+            platform (str): "youtube" or "reddit"
+            endpoint (str): Endpoint name, e.g. "search.list" (None for untyped usage)
+            units (int): Quota units the call cost
+        """
+        self.ledger.add(platform, endpoint, units)
+    
+    
+    def record_youtube_call(self, endpoint, units):
+        """Quota meter callback for YouTubeChannelAnalyser."""
+        self.record_call("youtube", endpoint, units)
+    
+    
+    def get_endpoint_usage(self, platform):
+        """
+        Get today's quota usage broken down by endpoint.
         
-        self._save_usage(usage)
+        Returns:
+            dict: {endpoint: units}, most expensive first
+        """
+        endpoints = self.ledger.endpoint_usage(platform)
+        return dict(sorted(endpoints.items(), key=lambda kv: kv[1], reverse=True))
     
     
     def get_usage_stats(self, platform):
@@ -64,15 +76,8 @@ class QuotaManager:
         Returns:
             dict: {"used": int, "limit": int, "remaining": int, "percentage": float}
         """
-        usage = self._load_usage()
-        used = usage.get(self.today, {}).get(platform, 0)
-        
-        # Get limit from secrets
-        limit_key = f"{platform}_daily_limit"
-        if "limits" in st.secrets and limit_key in st.secrets["limits"]:
-            limit = st.secrets["limits"][limit_key]
-        else:
-            limit = 50 if platform == "youtube" else 1000
+        used = self.ledger.used(platform)
+        limit = self._get_limit(platform)
         
         remaining = max(0, limit - used)
         percentage = (used / limit) * 100 if limit > 0 else 0
@@ -147,41 +152,13 @@ class QuotaManager:
         """, unsafe_allow_html=True)
     
     
-    def _load_usage(self):
-        """Load usage data from file."""
-        if not os.path.exists(self.quota_file):
-            return {}
-        
-        try:
-            with open(self.quota_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    
-    
-    def _save_usage(self, usage):
-        """Save usage data to file."""
-        try:
-            with open(self.quota_file, 'w') as f:
-                json.dump(usage, f, indent=2)
-        except Exception as e:
-            print(f"⚠️ Warning: Could not save quota usage: {e}")
-    
-    
-    def _cleanup_old_data(self):
-        """Remove usage data older than 7 days."""
-        usage = self._load_usage()
-        
-        # Keep only last 7 days
-        cutoff_date = datetime.now().date()
-        dates_to_keep = [(cutoff_date - timedelta(days=i)).isoformat() for i in range(7)]
-        
-        cleaned_usage = {k: v for k, v in usage.items() if k in dates_to_keep}
-        
-        if len(cleaned_usage) != len(usage):
-            self._save_usage(cleaned_usage)
+    def _get_limit(self, platform):
+        """Get the daily limit from secrets, falling back to defaults."""
+        limit_key = f"{platform}_daily_limit"
+        if "limits" in st.secrets and limit_key in st.secrets["limits"]:
+            return st.secrets["limits"][limit_key]
+        return self.DEFAULT_LIMITS.get(platform, 1000)
 
 
 # Global singleton instance
-from datetime import timedelta
 quota_manager = QuotaManager()
@@ -5,9 +5,14 @@ Shared functions and configurations used across all platforms.
 """
 
 from .formatters import format_large_number, format_subscribers, seconds_to_hms
+from .rate_limiter import TokenBucketPacer, backoff_delay, call_with_backoff, get_pacer
 
 __all__ = [
     'format_large_number',
     'format_subscribers', 
     'seconds_to_hms',
+    'TokenBucketPacer',
+    'backoff_delay',
+    'call_with_backoff',
+    'get_pacer',
 ]
@@ -0,0 +1,120 @@
+"""
+Request pacing shared by all platform API clients.
+A token bucket lets calls run at full speed until the bucket drains;
+jittered exponential backoff is applied only when an API pushes back.
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucketPacer:
+    """Thread-safe token bucket"""
+
+    def __init__(self, rate, burst):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            burst: Bucket capacity (requests allowed back to back)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Claim one token.
+
+        Returns:
+            float: Seconds the caller must wait before sending (0 when a token was free)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+def backoff_delay(attempt, base=1.0, cap=32.0, retry_after=None):
+    """
+    Jittered exponential backoff.
+
+    Args:
+        attempt: Retry number, starting at 0
+        base: Delay of the first retry in seconds
+        cap: Maximum delay in seconds
+        retry_after: Server-provided Retry-After value in seconds, if any
+
+    Returns:
+        float: Seconds to wait before retrying
+    """
+    try:
+        retry_after = float(retry_after) if retry_after else None
+    except ValueError:
+        retry_after = None  # HTTP-date form: fall back to exponential backoff
+
+    if retry_after:
+        return min(cap, retry_after) + random.uniform(0, base)
+    return random.uniform(0.5, 1.0) * min(cap, base * (2 ** attempt))
+
+
+def call_with_backoff(fn, retry_policy, pacer=None, max_retries=5, label="API"):
+    """
+    Call `fn` through a pacer, retrying only when the API pushes back.
+
+    Args:
+        fn: Zero-argument callable performing one request
+        retry_policy: Callable(exception) -> (retryable, retry_after_seconds)
+        pacer: TokenBucketPacer to acquire before every attempt
+        max_retries: Retries before the last error is re-raised
+        label: API name for log messages
+
+    Returns:
+        Whatever `fn` returns
+    """
+    for attempt in range(max_retries + 1):
+        if pacer:
+            pacer.acquire()
+        try:
+            return fn()
+        except Exception as e:
+            retryable, retry_after = retry_policy(e)
+            if attempt == max_retries or not retryable:
+                raise
+
+            delay = backoff_delay(attempt, retry_after=retry_after)
+            print(f"⏳ {label} pushed back ({e.__class__.__name__}), retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+# Shared pacers, one per API (each API has its own rate limits)
+PACER_SETTINGS = {
+    "youtube": {"rate": 20.0, "burst": 20},
+    "reddit": {"rate": 1.6, "burst": 10},   # Reddit OAuth: 100 requests/minute
+}
+
+_pacers = {}
+_pacers_lock = threading.Lock()
+
+
+def get_pacer(name):
+    """Get the process-wide pacer for an API."""
+    with _pacers_lock:
+        if name not in _pacers:
+            _pacers[name] = TokenBucketPacer(**PACER_SETTINGS.get(name, {"rate": 10.0, "burst": 10}))
+        return _pacers[name]
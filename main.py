@@ -12,8 +12,18 @@ from ui.sidebar import render_sidebar
 from ui.components import info_card, section
 
 # Platform modules
-from platforms.youtube import analyze_youtube_channel, render_dashboard as render_youtube_dashboard
-from platforms.reddit import analyze_reddit, render_dashboard as render_reddit_dashboard
+from platforms.youtube import (
+    analyze_youtube_channel,
+    analyze_youtube_channels,
+    render_dashboard as render_youtube_dashboard,
+    render_bulk_dashboard as render_youtube_bulk_dashboard,
+)
+from platforms.reddit import (
+    analyze_reddit,
+    start_reddit_monitor,
+    render_dashboard as render_reddit_dashboard,
+    render_live_dashboard as render_reddit_live_dashboard,
+)
 
 # Optional modules availability flags
 try:
@@ -46,8 +56,12 @@ config = render_sidebar(SENTIMENT_AVAILABLE, VADER_AVAILABLE, PREDICTIVE_AVAILAB
 
 # ==================== ANALYZE ACTION - PLATFORM-AWARE ====================
 if config["analyze_clicked"]:
-    if config["platform"] == "youtube":
+    if config["platform"] == "youtube" and config.get("bulk"):
+        analyze_youtube_channels(config)
+    elif config["platform"] == "youtube":
         analyze_youtube_channel(config)
+    elif config["platform"] == "reddit" and config.get("live"):
+        start_reddit_monitor(config)
     elif config["platform"] == "reddit":
         analyze_reddit(config)
 
@@ -57,11 +71,21 @@ if "channel_stats" in st.session_state and st.session_state.get("platform") == "
     render_youtube_dashboard()
 
 
+# ==================== DISPLAY: YOUTUBE (BULK) ====================
+elif "bulk_channels" in st.session_state and st.session_state.get("platform") == "youtube_bulk":
+    render_youtube_bulk_dashboard()
+
+
 # ==================== DISPLAY: REDDIT ====================
 elif "reddit_data" in st.session_state and st.session_state.get("platform") == "reddit":
     render_reddit_dashboard()
 
 
+# ==================== DISPLAY: REDDIT (LIVE) ====================
+elif "reddit_monitor" in st.session_state and st.session_state.get("platform") == "reddit_live":
+    render_reddit_live_dashboard()
+
+
 # ==================== DEFAULT VIEW ====================
 else:
     section("Social Analytics Hub", "Multi-platform analytics for YouTube and Reddit")
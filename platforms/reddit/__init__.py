@@ -4,10 +4,12 @@ Reddit Analytics Platform Module.
 Handles Reddit subreddit/user analysis, data processing, and dashboard rendering.
 """
 
-from .analyzer import analyze_reddit
-from .dashboard import render_dashboard
+from .analyzer import analyze_reddit, start_reddit_monitor
+from .dashboard import render_dashboard, render_live_dashboard
 
 __all__ = [
     'analyze_reddit',
+    'start_reddit_monitor',
     'render_dashboard',
+    'render_live_dashboard',
 ]
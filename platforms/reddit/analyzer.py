@@ -4,6 +4,7 @@ Reddit Analysis Handler.
 Handles API calls, data fetching, quota management, and session state updates.
 """
 
+import uuid
 import streamlit as st
 
 
@@ -16,6 +17,9 @@ def analyze_reddit(config):
             - identifier: Subreddit name or username
             - identifier_type: 'subreddit' or 'user'
             - post_limit: Number of posts to fetch
+            - sample_listings: Sample hot/new/rising/top instead of hot only
+            - track_history: Keep posts in the local store and analyze their full history
+            - comment_posts: Harvest comment trees of this many top posts
     
     Returns:
         None. Updates st.session_state with reddit_data.
@@ -55,12 +59,16 @@ def analyze_reddit(config):
             if config["identifier_type"] == "subreddit":
                 reddit_data = reddit_analyzer.analyze_subreddit(
                     config["identifier"],
-                    limit=config["post_limit"]
+                    limit=config["post_limit"],
+                    sample_listings=config.get("sample_listings", False),
+                    track_history=config.get("track_history", False),
+                    comment_posts=config.get("comment_posts", 0)
                 )
             else:
                 reddit_data = reddit_analyzer.analyze_user(
                     config["identifier"],
-                    limit=config["post_limit"]
+                    limit=config["post_limit"],
+                    track_history=config.get("track_history", False)
                 )
             
             # Increment quota
@@ -79,3 +87,68 @@ def analyze_reddit(config):
     except Exception as e:
         st.error(f"❌ Error: {str(e)}")
         st.exception(e)
+
+
+def start_reddit_monitor(config):
+    """
+    Start (or attach to) a live subreddit monitor.
+    
+    Each session attaches under its own viewer id, so stopping or leaving
+    only releases this session's hold on a monitor other sessions share.
+    
+    Args:
+        config: Configuration dict from sidebar with keys:
+            - identifier: Subreddit name
+    
+    Returns:
+        None. Updates st.session_state with reddit_monitor and reddit_viewer_id.
+    """
+    # Check if quota manager is available
+    try:
+        from config.quota_manager import quota_manager
+        QUOTA_ENABLED = True
+    except ImportError:
+        QUOTA_ENABLED = False
+    
+    if not config["identifier"]:
+        st.error("⚠️ Please enter a subreddit")
+        return
+    
+    # Check quota
+    if QUOTA_ENABLED and not quota_manager.can_make_request("reddit"):
+        st.error("❌ Daily quota limit reached! Please try again tomorrow.")
+        st.info("💡 Tip: The quota resets at midnight UTC (5:00 AM PKT)")
+        return
+    
+    try:
+        with st.spinner("📡 Starting live monitor..."):
+            from .api_client import RedditAnalyser
+            
+            reddit_analyzer = RedditAnalyser(
+                st.secrets["reddit"]["client_id"],
+                st.secrets["reddit"]["client_secret"],
+                st.secrets["reddit"]["user_agent"]
+            )
+            
+            if "reddit_viewer_id" not in st.session_state:
+                st.session_state.reddit_viewer_id = uuid.uuid4().hex
+            viewer_id = st.session_state.reddit_viewer_id
+            
+            monitor = reddit_analyzer.start_live_monitor(config["identifier"], viewer_id)
+            
+            # Switching subreddits releases the previous monitor
+            previous = st.session_state.get("reddit_monitor")
+            if previous is not None and previous is not monitor:
+                previous.detach(viewer_id)
+            
+            # Increment quota
+            if QUOTA_ENABLED:
+                quota_manager.increment_usage("reddit")
+            
+            st.session_state.reddit_monitor = monitor
+            st.session_state.platform = "reddit_live"
+            st.rerun()
+    
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+        st.exception(e)
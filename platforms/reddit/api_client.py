@@ -3,10 +3,45 @@
 # Accurate engagement calculations: (Upvotes + Comments) / Members × 100
 
 import praw
+import prawcore
 from praw.exceptions import PRAWException, RedditAPIException
 import pandas as pd
 from datetime import datetime, timezone
+import queue
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.rate_limiter import get_pacer, backoff_delay
+from .columnar import PostColumnBuilder, CommentColumnBuilder
+from .post_store import PostStore
+from .live_stream import get_monitor
+
+
+class PacedRequestor(prawcore.Requestor):
+    """
+    prawcore Requestor that sends every Reddit call through the shared pacer.
+    
+    Requests run at full speed until the token bucket drains; only 429 and
+    5xx responses trigger jittered exponential backoff and a retry.
+    """
+    
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    MAX_RETRIES = 4
+    
+    def request(self, *args, **kwargs):
+        pacer = get_pacer("reddit")
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            pacer.acquire()
+            response = super().request(*args, **kwargs)
+            
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                return response
+            
+            delay = backoff_delay(attempt, retry_after=response.headers.get('retry-after'))
+            print(f"⏳ Reddit API returned {response.status_code}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
 
 
 class RedditAnalyser:
@@ -18,24 +53,83 @@ class RedditAnalyser:
     - Individual Posts: (Post Upvotes + Post Comments) / Members × 100
     """
     
-    def __init__(self, client_id, client_secret, user_agent):
-        """Initialize Reddit API connection."""
+    LISTING_PAGE_SIZE = 100
+    LISTING_MAX = 1000      # Reddit stops serving a listing after ~1000 items
+    INFO_BATCH_SIZE = 100   # /api/info ids per request
+    COMMENT_TREE_LIMIT = 500        # Comments per /comments request
+    MORECHILDREN_BATCH_SIZE = 100   # Stub children expanded per /api/morechildren request
+    
+    # Listings drawn by the multi-listing sampler (dedup keeps the first one listed)
+    SAMPLER_LISTINGS = {
+        'hot': ('hot', {}),
+        'new': ('new', {}),
+        'rising': ('rising', {}),
+        'top_week': ('top', {'t': 'week'}),
+        'top_month': ('top', {'t': 'month'}),
+        'top_year': ('top', {'t': 'year'}),
+    }
+    
+    def __init__(self, client_id, client_secret, user_agent, raw_listings=True,
+                 store_path=".cache/reddit/posts.db", **reddit_kwargs):
+        """
+        Initialize Reddit API connection.
+        
+        Args:
+            raw_listings: Page post listings as raw JSON into columnar arrays
+                (False reads every attribute through PRAW Submission objects)
+            store_path: SQLite file of the local post store (history tracking)
+            reddit_kwargs: Extra praw.Reddit settings, e.g. oauth_url/reddit_url
+                for the offline fake server or requestor_kwargs={'session': ...}
+                for a recording transport
+        """
+        # Kept so listings can run on their own sessions (praw.Reddit is not thread-safe)
+        self._settings = dict(
+            client_id=client_id,
+            client_secret=client_secret,
+            user_agent=user_agent,
+            check_for_async=False,
+            timeout=30,
+            requestor_class=PacedRequestor,
+            **reddit_kwargs
+        )
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self.raw_listings = raw_listings
+        self.store_path = store_path
+        self._post_store = None
+        
         try:
-            self.reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                user_agent=user_agent,
-                check_for_async=False,
-                timeout=30
-            )
-            # Test connection
-            self.reddit.user.me()
+            self.reddit = praw.Reddit(**self._settings)
+            # Test connection (fetches a token; read-only apps cannot call user.me())
+            self.reddit.auth.scopes()
             print("✅ Reddit API connected successfully")
         except Exception as e:
             print(f"❌ Reddit API connection failed: {str(e)}")
             raise
     
     
+    def _session(self, name):
+        """
+        Get a dedicated PRAW session for one concurrent listing.
+        
+        Sessions are created once per analyser and reused, so each token is
+        only fetched on first use; all of them share the Reddit pacer.
+        """
+        with self._sessions_lock:
+            if name not in self._sessions:
+                self._sessions[name] = praw.Reddit(**self._settings)
+            return self._sessions[name]
+    
+    
+    @property
+    def post_store(self):
+        """Local post store, opened on first use."""
+        with self._sessions_lock:
+            if self._post_store is None:
+                self._post_store = PostStore(self.store_path)
+            return self._post_store
+    
+    
     @staticmethod
     def clean_identifier(identifier, prefix='r/'):
         """
@@ -56,11 +150,21 @@ class RedditAnalyser:
         return identifier
     
     
-    def analyze_subreddit(self, subreddit_name, limit=200):
+    def analyze_subreddit(self, subreddit_name, limit=200, sample_listings=False, track_history=False,
+                          comment_posts=0):
         """
         Analyze a subreddit with ACCURATE engagement metrics.
         
         Engagement Rate = (Upvotes + Comments) / Members × 100
+        
+        Args:
+            subreddit_name: Subreddit name, r/ name or URL
+            limit: Posts to fetch (total budget when sampling)
+            sample_listings: Sample hot, new, rising and top (week/month/year)
+                concurrently instead of hot only, for less trend-biased timing data
+            track_history: Add new posts to the local post store and analyze
+                its full history (limit caps the first fetch only)
+            comment_posts: Harvest the comment trees of this many top posts
         """
         # Clean input
         clean_name = self.clean_identifier(subreddit_name, 'r/')
@@ -76,7 +180,17 @@ class RedditAnalyser:
             
             # Fetch info and posts
             stats = self._get_subreddit_info(subreddit)
-            posts_df = self._fetch_subreddit_posts(subreddit, limit, stats['members'])
+            if track_history:
+                name = subreddit.display_name
+                builder = self._fetch_tracked_posts(self.reddit, f"r/{name.lower()}", f"r/{name}/new", limit)
+                posts_df = builder.to_subreddit_frame(stats['members'])
+            elif sample_listings:
+                posts_df = self._fetch_subreddit_sample(subreddit, limit, stats['members'])
+            else:
+                posts_df = self._fetch_subreddit_posts(subreddit, limit, stats['members'])
+            
+            # Comment-level engagement on the top posts
+            comments_df = self.harvest_comments(posts_df, top_n=comment_posts) if comment_posts else pd.DataFrame()
             
             # Calculate engagement metrics using CORRECT formula
             engagement_stats = self._calculate_subreddit_engagement(posts_df, stats['members'])
@@ -84,6 +198,7 @@ class RedditAnalyser:
             # Merge stats
             stats.update(engagement_stats)
             stats['posts_analyzed'] = len(posts_df)
+            stats['comments_harvested'] = len(comments_df)
             
             print(f"✅ Successfully analyzed r/{clean_name}")
             print(f"📝 Fetched {len(posts_df)} posts")
@@ -93,6 +208,7 @@ class RedditAnalyser:
             return {
                 'stats': stats,
                 'posts': posts_df,
+                'comment_trees': comments_df,
                 'type': 'subreddit',
                 'name': clean_name
             }
@@ -102,21 +218,16 @@ class RedditAnalyser:
             raise
     
     
-    def analyze_user(self, username, limit=200):
-        """Analyze a Reddit user."""
+    def analyze_user(self, username, limit=200, track_history=False):
+        """Analyze a Reddit user (track_history: analyze all stored posts, see analyze_subreddit)."""
         # Clean input
         clean_name = self.clean_identifier(username, 'u/')
         
         print(f"\n👤 Analyzing u/{clean_name}...")
         
         try:
-            # Get user object
-            user = self.reddit.redditor(clean_name)
-            
-            # Fetch info, posts, and comments
-            stats = self._get_user_info(user)
-            posts_df = self._fetch_user_posts(user, limit)
-            comments_df = self._fetch_user_comments(user, limit)
+            # Fetch info, posts, and comments concurrently, each on its own session
+            stats, posts_df, comments_df = self._fetch_user_listings(clean_name, limit, track_history)
             
             # Calculate engagement metrics
             engagement_stats = self._calculate_user_engagement(posts_df, comments_df)
@@ -142,6 +253,28 @@ class RedditAnalyser:
             raise
     
     
+    def start_live_monitor(self, subreddit_name, viewer_id):
+        """
+        Stream a subreddit's new posts into live aggregates on a background thread.
+        
+        The monitor runs on its own PRAW session and is shared process-wide,
+        so dashboard reruns and other sessions read the same aggregates. It
+        keeps running only while at least one viewer stays attached.
+        
+        Args:
+            subreddit_name: Subreddit to stream
+            viewer_id: Id of the attaching viewer (one per Streamlit session)
+        
+        Returns:
+            LiveSubredditMonitor: Call snapshot() to read the aggregates
+        """
+        clean_name = self.clean_identifier(subreddit_name, 'r/')
+        monitor = get_monitor(clean_name, lambda: praw.Reddit(**self._settings), viewer_id)
+        
+        print(f"📡 Streaming new posts from r/{clean_name}")
+        return monitor
+    
+    
     # ==================== SUBREDDIT METHODS ====================
     
     def _get_subreddit_info(self, subreddit):
@@ -176,6 +309,10 @@ class RedditAnalyser:
         try:
             print(f"🔄 Fetching up to {limit} posts from r/{subreddit.display_name}...")
             
+            if self.raw_listings:
+                builder = self._fetch_listing(self.reddit, f"r/{subreddit.display_name}/hot", limit)
+                return builder.to_subreddit_frame(member_count)
+            
             # Fetch hot posts
             for post in subreddit.hot(limit=limit):
                 try:
@@ -220,6 +357,51 @@ class RedditAnalyser:
             return pd.DataFrame()
     
     
+    def _fetch_subreddit_sample(self, subreddit, budget, member_count):
+        """
+        Sample posts from several listings at once.
+        
+        Each listing pages concurrently on its own session (as raw JSON) with an
+        equal share of the budget; posts are deduplicated by post_id and
+        tagged with the listing they came from.
+        
+        Returns:
+            pd.DataFrame: Same columns as _fetch_subreddit_posts, plus listing
+        """
+        name = subreddit.display_name
+        per_listing = -(-budget // len(self.SAMPLER_LISTINGS))
+        frames = {}
+        
+        print(f"🔄 Sampling up to {budget} posts from r/{name} across {len(self.SAMPLER_LISTINGS)} listings...")
+        
+        with ThreadPoolExecutor(max_workers=len(self.SAMPLER_LISTINGS)) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_listing, self._session(f"listing_{listing}"), f"r/{name}/{sort}", per_listing, **params
+                ): listing
+                for listing, (sort, params) in self.SAMPLER_LISTINGS.items()
+            }
+            
+            for future in as_completed(futures):
+                listing = futures[future]
+                try:
+                    frames[listing] = future.result().to_subreddit_frame(member_count)
+                except Exception as e:
+                    print(f"⚠️ Skipping {listing} listing: {str(e)}")
+        
+        frames = [frames[listing].assign(listing=listing) for listing in self.SAMPLER_LISTINGS
+                  if listing in frames and not frames[listing].empty]
+        if not frames:
+            return pd.DataFrame()
+        
+        df = pd.concat(frames, ignore_index=True)
+        sampled = len(df)
+        df = df.drop_duplicates('post_id', keep='first').head(budget).reset_index(drop=True)
+        
+        print(f"🧹 {sampled - len(df)} duplicate posts removed across listings")
+        return df
+    
+    
     def _calculate_subreddit_engagement(self, df, member_count):
         """
         Calculate ACCURATE engagement metrics.
@@ -263,6 +445,240 @@ class RedditAnalyser:
         }
     
     
+    # ==================== RAW LISTINGS ====================
+    
+    def _fetch_listing(self, reddit, path, limit, **params):
+        """
+        Page a post listing as raw JSON, skipping PRAW object construction.
+        
+        Args:
+            reddit: PRAW session to send the requests through (paced and retried)
+            path: Listing path, e.g. 'r/python/hot' or 'user/spez/submitted'
+            limit: Maximum number of posts
+            params: Extra query parameters (e.g. sort='new')
+        
+        Returns:
+            PostColumnBuilder: Collected posts, ready for to_*_frame()
+        """
+        builder = PostColumnBuilder()
+        
+        for children in self._iter_listing(reddit, path, limit, **params):
+            builder.add_children(children, limit)
+        
+        return builder
+    
+    
+    def _iter_listing(self, reddit, path, limit, before=None, **params):
+        """
+        Yield the raw children of each listing page.
+        
+        Pages towards older posts with the `after` cursor; given `before`
+        (a fullname), pages towards posts newer than it instead.
+        """
+        direction = 'before' if before else 'after'
+        cursor = before
+        fetched = 0
+        
+        while fetched < limit:
+            page_params = {**params, 'limit': self.LISTING_PAGE_SIZE}
+            if cursor:
+                page_params[direction] = cursor
+            
+            listing = reddit.request(method='GET', path=path, params=page_params)['data']
+            children = listing['children'][:limit - fetched]
+            if not children:
+                return
+            
+            fetched += len(children)
+            yield children
+            
+            cursor = listing.get(direction)
+            if not cursor:
+                return
+    
+    
+    # ==================== COMMENT TREES ====================
+    
+    def harvest_comments(self, posts_df, top_n=10, more_limit=4, max_workers=4):
+        """
+        Fetch and flatten the comment trees of the top posts by upvotes.
+        
+        Trees are fetched concurrently on a pool of PRAW sessions (all sharing
+        the Reddit pacer) as raw JSON. Like replace_more(limit=more_limit),
+        at most `more_limit` "load more comments" requests are made per post;
+        remaining stubs are dropped.
+        
+        Args:
+            posts_df: Posts DataFrame with post_id, upvotes and created_utc
+            top_n: Number of top posts to harvest
+            more_limit: /api/morechildren requests per post (0 = first page only)
+            max_workers: Trees fetched at once
+        
+        Returns:
+            pd.DataFrame: One row per comment (post_id, comment_id, parent_id,
+                depth, score, created_utc, author, body, is_top_level,
+                minutes_after_post)
+        """
+        if posts_df.empty or top_n <= 0:
+            return pd.DataFrame()
+        
+        top_posts = posts_df.nlargest(top_n, 'upvotes')
+        
+        # One session per worker, lent out for one tree at a time
+        sessions = queue.Queue()
+        for i in range(min(max_workers, len(top_posts))):
+            sessions.put(self._session(f"comments_{i}"))
+        
+        def fetch_tree(post_id):
+            reddit = sessions.get()
+            try:
+                return self._fetch_comment_tree(reddit, post_id, more_limit)
+            finally:
+                sessions.put(reddit)
+        
+        print(f"💬 Harvesting comment trees for the top {len(top_posts)} posts...")
+        builder = CommentColumnBuilder()
+        
+        with ThreadPoolExecutor(max_workers=sessions.qsize()) as executor:
+            futures = {executor.submit(fetch_tree, post_id): post_id for post_id in top_posts['post_id']}
+            
+            for future in as_completed(futures):
+                post_id = futures[future]
+                try:
+                    for comment in future.result():
+                        builder.add_comment(post_id, comment)
+                except Exception as e:
+                    print(f"⚠️ Skipping comments of post {post_id}: {str(e)}")
+        
+        df = builder.to_frame()
+        posted_at = df['post_id'].map(top_posts.set_index('post_id')['created_utc'])
+        df['minutes_after_post'] = ((df['created_utc'] - posted_at).dt.total_seconds() / 60).round(1)
+        
+        print(f"✅ Harvested {len(df)} comments")
+        return df
+    
+    
+    def _fetch_comment_tree(self, reddit, post_id, more_limit):
+        """
+        Fetch one post's comments, expanding the largest "more" stubs first.
+        
+        Returns:
+            list: Raw t1 data dicts, depth-first
+        """
+        listings = reddit.request(
+            method='GET', path=f"comments/{post_id}", params={'limit': self.COMMENT_TREE_LIMIT, 'sort': 'top'}
+        )
+        comments, stubs = self._flatten_comments(listings[1]['data']['children'])
+        requests_made = 0
+        
+        while stubs and requests_made < more_limit:
+            stubs.sort(key=lambda more: more.get('count', 0), reverse=True)
+            children = stubs.pop(0).get('children') or []
+            
+            # Empty stubs are "continue this thread" links, which need a request per thread
+            for i in range(0, len(children), self.MORECHILDREN_BATCH_SIZE):
+                if requests_made >= more_limit:
+                    break
+                
+                response = reddit.request(method='GET', path='api/morechildren', params={
+                    'api_type': 'json',
+                    'link_id': f"t3_{post_id}",
+                    'children': ','.join(children[i:i + self.MORECHILDREN_BATCH_SIZE]),
+                    'sort': 'top',
+                })
+                requests_made += 1
+                
+                more_comments, more_stubs = self._flatten_comments(response['json']['data']['things'])
+                comments.extend(more_comments)
+                stubs.extend(more_stubs)
+        
+        return comments
+    
+    
+    @staticmethod
+    def _flatten_comments(children):
+        """Split a comment forest into flat t1 dicts (depth-first) and "more" stubs."""
+        comments, stubs = [], []
+        stack = list(reversed(children))
+        
+        while stack:
+            child = stack.pop()
+            if child.get('kind') == 'more':
+                stubs.append(child['data'])
+            elif child.get('kind') == 't1':
+                comments.append(child['data'])
+                replies = child['data'].get('replies')
+                if replies:
+                    stack.extend(reversed(replies['data']['children']))
+        
+        return comments, stubs
+    
+    
+    # ==================== POST STORE ====================
+    
+    def _fetch_tracked_posts(self, reddit, source, path, limit, **params):
+        """
+        Bring the local post store for one listing up to date.
+        
+        1. New posts: page from the newest stored post with the `before`
+           cursor (first run: the newest `limit` posts). Reddit answers an
+           empty page when that anchor was deleted, removed or has aged out
+           of the listing, so an empty result falls back to paging from the
+           top with `after` until a stored post turns up (one extra request
+           when there simply is nothing new).
+        2. Scores: re-read posts still inside the voting window through
+           /api/info, 100 per request.
+        
+        Args:
+            source: Store key, 'r/<subreddit>' or 'u/<user>'
+            path: Newest-first listing path
+        
+        Returns:
+            PostColumnBuilder: Every stored post for the source, newest first
+        """
+        store = self.post_store
+        anchor = store.newest_fullname(source)
+        new_posts = 0
+        
+        for children in self._iter_listing(reddit, path, limit if anchor is None else self.LISTING_MAX,
+                                           before=anchor, **params):
+            posts = [child['data'] for child in children if child.get('kind') == 't3']
+            store.upsert(source, posts)
+            new_posts += len(posts)
+        
+        if anchor is not None and not new_posts:
+            new_posts = self._catch_up_from_top(reddit, source, path, **params)
+        
+        due = store.refresh_due(source)
+        for i in range(0, len(due), self.INFO_BATCH_SIZE):
+            listing = reddit.request(method='GET', path='api/info',
+                                     params={'id': ','.join(due[i:i + self.INFO_BATCH_SIZE])})['data']
+            store.upsert(source, [child['data'] for child in listing['children'] if child.get('kind') == 't3'])
+        
+        builder = PostColumnBuilder()
+        builder.add_children(store.load(source))
+        
+        print(f"🗄️ {source}: {new_posts} new posts, {len(due)} scores refreshed, {len(builder)} in history")
+        return builder
+    
+    
+    def _catch_up_from_top(self, reddit, source, path, **params):
+        """Page a newest-first listing with `after` until a stored post appears; returns posts added."""
+        store = self.post_store
+        new_posts = 0
+        
+        for children in self._iter_listing(reddit, path, self.LISTING_MAX, **params):
+            posts = [child['data'] for child in children if child.get('kind') == 't3']
+            known = store.known_ids(source, [post['id'] for post in posts])
+            
+            store.upsert(source, posts)
+            new_posts += len(posts) - len(known)
+            if known:
+                break
+        
+        return new_posts
+    
+    
     # ==================== USER METHODS ====================
     
     def _get_user_info(self, user):
@@ -284,13 +700,51 @@ class RedditAnalyser:
             return {}
     
     
-    def _fetch_user_posts(self, user, limit):
-        """Fetch user posts."""
+    def _fetch_user_listings(self, username, limit, track_history=False):
+        """
+        Fetch user info, posts and comments in parallel.
+        
+        The listings page independently (up to 1000 items, 100 per request),
+        so the analysis takes as long as the slowest one instead of the sum.
+        
+        Returns:
+            tuple: (stats, posts_df, comments_df)
+        """
+        posts_session = self._session('posts')
+        tasks = {
+            'info': (self._get_user_info, self.reddit.redditor(username)),
+            'posts': (self._fetch_user_posts, posts_session.redditor(username), limit, posts_session, track_history),
+            'comments': (self._fetch_user_comments, self._session('comments').redditor(username), limit),
+        }
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {executor.submit(fn, *args): name for name, (fn, *args) in tasks.items()}
+            
+            # Merge results as each listing finishes
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results['info'], results['posts'], results['comments']
+    
+    
+    def _fetch_user_posts(self, user, limit, reddit=None, track_history=False):
+        """Fetch user posts (reddit: session that owns `user`, for the raw path)."""
         posts_list = []
         
         try:
             print(f"🔄 Fetching up to {limit} posts from u/{user.name}...")
             
+            if track_history:
+                builder = self._fetch_tracked_posts(
+                    reddit or self.reddit, f"u/{user.name.lower()}", f"user/{user.name}/submitted", limit, sort='new'
+                )
+                return builder.to_user_frame()
+            
+            if self.raw_listings:
+                builder = self._fetch_listing(reddit or self.reddit, f"user/{user.name}/submitted", limit, sort='new')
+                return builder.to_user_frame()
+            
             for post in user.submissions.new(limit=limit):
                 try:
                     # Simplified engagement for user posts
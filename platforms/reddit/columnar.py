@@ -0,0 +1,215 @@
+# platforms/reddit/columnar.py
+"""
+Reddit Columnar Post Builder.
+Turns raw listing JSON into typed post DataFrames without PRAW objects.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+SELFTEXT_LIMIT = 300
+COMMENT_BODY_LIMIT = 500
+
+# Columns produced for each listing kind (same as the PRAW-object parsers)
+SUBREDDIT_COLUMNS = [
+    'post_id', 'title', 'author', 'created_utc', 'upvotes', 'upvote_ratio', 'num_comments',
+    'engagement_rate', 'permalink', 'url', 'is_self', 'selftext', 'link_flair_text',
+    'num_awards', 'is_video', 'domain',
+]
+USER_COLUMNS = [
+    'post_id', 'title', 'subreddit', 'created_utc', 'upvotes', 'upvote_ratio', 'num_comments',
+    'engagement_rate', 'permalink', 'is_self', 'num_awards',
+]
+
+
+class PostColumnBuilder:
+    """Collect raw t3 listing fields column by column, then type them in bulk"""
+
+    def __init__(self):
+        self.post_id = []
+        self.title = []
+        self.author = []
+        self.subreddit = []
+        self.created_utc = []
+        self.upvotes = []
+        self.upvote_ratio = []
+        self.num_comments = []
+        self.permalink = []
+        self.url = []
+        self.is_self = []
+        self.selftext = []
+        self.link_flair_text = []
+        self.num_awards = []
+        self.is_video = []
+        self.domain = []
+
+
+    def __len__(self):
+        return len(self.post_id)
+
+
+    def add_children(self, children, limit=None):
+        """
+        Append the t3 children of one listing page.
+
+        Args:
+            children (list): listing['data']['children']
+            limit (int): Stop once this many posts are collected
+        """
+        for child in children:
+            if limit is not None and len(self) >= limit:
+                return
+            if child.get('kind') != 't3':
+                continue
+
+            post = child['data']
+            is_self = bool(post.get('is_self'))
+
+            self.post_id.append(post['id'])
+            self.title.append(post.get('title', ''))
+            self.author.append(post.get('author') or '[deleted]')
+            self.subreddit.append(post.get('subreddit', ''))
+            self.created_utc.append(post.get('created_utc'))
+            self.upvotes.append(post.get('score'))
+            self.upvote_ratio.append(post.get('upvote_ratio'))
+            self.num_comments.append(post.get('num_comments'))
+            self.permalink.append(f"https://reddit.com{post.get('permalink', '')}")
+            self.url.append(post.get('url', ''))
+            self.is_self.append(is_self)
+            self.selftext.append((post.get('selftext') or '')[:SELFTEXT_LIMIT] if is_self else '')
+            self.link_flair_text.append(post.get('link_flair_text') or 'None')
+            self.num_awards.append(post.get('total_awards_received'))
+            self.is_video.append(bool(post.get('is_video')))
+            self.domain.append(post.get('domain', ''))
+
+
+    def to_subreddit_frame(self, member_count):
+        """
+        Build the subreddit posts DataFrame.
+
+        Engagement Rate = ((Upvotes + Comments) / Members) × 100
+
+        Returns:
+            pd.DataFrame: Same columns as _fetch_subreddit_posts, plus date
+        """
+        if not len(self):
+            return pd.DataFrame()
+
+        columns = self._typed_columns()
+        columns['engagement_rate'] = (
+            (columns['upvotes'] + columns['num_comments']) / member_count * 100
+        ).round(4)
+
+        df = self._frame(SUBREDDIT_COLUMNS, columns)
+        _add_time_columns(df)
+        df['date'] = df['created_utc'].dt.date
+        return df
+
+
+    def to_user_frame(self):
+        """
+        Build the user posts DataFrame.
+
+        Engagement Rate = ((Comments + Awards) / max(Upvotes, 1)) × 100
+
+        Returns:
+            pd.DataFrame: Same columns as _fetch_user_posts
+        """
+        if not len(self):
+            return pd.DataFrame()
+
+        columns = self._typed_columns()
+        columns['engagement_rate'] = (
+            (columns['num_comments'] + columns['num_awards']) / np.maximum(columns['upvotes'], 1) * 100
+        ).round(2)
+
+        df = self._frame(USER_COLUMNS, columns)
+        _add_time_columns(df)
+        return df
+
+
+    def _frame(self, names, typed):
+        """DataFrame of `names`, preferring typed columns over the raw lists."""
+        return pd.DataFrame({name: typed[name] if name in typed else getattr(self, name) for name in names})
+
+
+    def _typed_columns(self):
+        """Numeric and timestamp columns, converted in one pass each."""
+        created = pd.to_numeric(pd.Series(self.created_utc, dtype='object'), errors='coerce')
+
+        return {
+            # Whole microseconds, as datetime.fromtimestamp() produced
+            'created_utc': pd.to_datetime((created * 1e6).round(), unit='us', utc=True),
+            'upvotes': _to_int64(self.upvotes),
+            'upvote_ratio': pd.to_numeric(pd.Series(self.upvote_ratio, dtype='object'),
+                                          errors='coerce').fillna(0.0).to_numpy(dtype='float64'),
+            'num_comments': _to_int64(self.num_comments),
+            'num_awards': _to_int64(self.num_awards),
+        }
+
+
+class CommentColumnBuilder:
+    """Collect raw t1 comment fields column by column, then type them in bulk"""
+
+    def __init__(self):
+        self.post_id = []
+        self.comment_id = []
+        self.parent_id = []
+        self.depth = []
+        self.score = []
+        self.created_utc = []
+        self.author = []
+        self.body = []
+
+
+    def __len__(self):
+        return len(self.comment_id)
+
+
+    def add_comment(self, post_id, comment):
+        """Append one raw t1 data dict."""
+        self.post_id.append(post_id)
+        self.comment_id.append(comment['id'])
+        self.parent_id.append(comment.get('parent_id', ''))
+        self.depth.append(comment.get('depth'))
+        self.score.append(comment.get('score'))
+        self.created_utc.append(comment.get('created_utc'))
+        self.author.append(comment.get('author') or '[deleted]')
+        self.body.append((comment.get('body') or '')[:COMMENT_BODY_LIMIT])
+
+
+    def to_frame(self):
+        """
+        Build the comments DataFrame.
+
+        Returns:
+            pd.DataFrame: post_id, comment_id, parent_id, depth, score,
+                created_utc, author, body, is_top_level
+        """
+        created = pd.to_numeric(pd.Series(self.created_utc, dtype='object'), errors='coerce')
+
+        df = pd.DataFrame({
+            'post_id': self.post_id,
+            'comment_id': self.comment_id,
+            'parent_id': self.parent_id,
+            'depth': _to_int64(self.depth),
+            'score': _to_int64(self.score),
+            'created_utc': pd.to_datetime((created * 1e6).round(), unit='us', utc=True),
+            'author': self.author,
+            'body': self.body,
+        })
+        df['is_top_level'] = df['parent_id'].str.startswith('t3_')
+        return df
+
+
+def _add_time_columns(df):
+    """Add posting-time features."""
+    df['hour'] = df['created_utc'].dt.hour
+    df['day_of_week'] = df['created_utc'].dt.day_name()
+    df['day_name'] = df['day_of_week']
+
+
+def _to_int64(values):
+    """Convert listing counts (possibly missing) to an int64 array."""
+    return pd.to_numeric(pd.Series(values, dtype='object'), errors='coerce').fillna(0).to_numpy(dtype='int64')
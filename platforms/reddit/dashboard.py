@@ -5,13 +5,15 @@ Coordinates all Reddit view components and handles the main dashboard flow.
 """
 
 import streamlit as st
+from ui.components import section
 from .data_processor import preprocess_reddit_data
 from .views import (
     render_header,
     render_kpi_cards,
     render_stat_cards,
     render_top_posts_chart,
-    render_reddit_tabs
+    render_reddit_tabs,
+    render_live_monitor
 )
 
 
@@ -46,3 +48,26 @@ def render_dashboard():
     
     # Tabs
     render_reddit_tabs(posts_df, reddit_data, stats)
+
+
+def render_live_dashboard():
+    """
+    Render the live subreddit monitor dashboard.
+    
+    Requires session state to contain:
+        - reddit_monitor: Running LiveSubredditMonitor
+        - reddit_viewer_id: This session's viewer id on the monitor
+    """
+    monitor = st.session_state.reddit_monitor
+    viewer_id = st.session_state.reddit_viewer_id
+    
+    section("Reddit Live Monitor", f"Streaming new posts from r/{monitor.subreddit_name}")
+    
+    # Stop only releases this session; the stream ends when its last viewer leaves
+    if st.button("⏹️ Stop Monitor", key="reddit_live_stop"):
+        monitor.detach(viewer_id)
+        del st.session_state.reddit_monitor
+        st.session_state.platform = None
+        st.rerun()
+    
+    render_live_monitor(monitor, viewer_id=viewer_id, refresh_seconds=5)
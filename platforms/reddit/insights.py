@@ -101,6 +101,12 @@ class RedditInsights:
         day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         heatmap_data = heatmap_data.reindex(day_order)
         
+        return self.heatmap_figure(heatmap_data)
+    
+    
+    @staticmethod
+    def heatmap_figure(heatmap_data):
+        """Render a day × hour table (e.g. a live monitor's activity cube) as a heatmap."""
         fig = go.Figure(data=go.Heatmap(
             z=heatmap_data.values,
             x=heatmap_data.columns,
@@ -213,3 +219,41 @@ class RedditInsights:
         )
         
         return fig
+    
+    
+    @staticmethod
+    def comment_depth_analysis(comments_df):
+        """Comments and average comment score by reply depth (harvested comment trees)."""
+        if comments_df is None or comments_df.empty:
+            return None
+        
+        by_depth = comments_df.groupby('depth').agg(
+            comments=('comment_id', 'size'),
+            avg_score=('score', 'mean')
+        ).reset_index()
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=by_depth['depth'],
+            y=by_depth['comments'],
+            marker_color='#FF4500',
+            name='Comments'
+        ))
+        fig.add_trace(go.Scatter(
+            x=by_depth['depth'],
+            y=by_depth['avg_score'],
+            mode='lines+markers',
+            line=dict(color='#3B82F6', width=2.5),
+            name='Avg Score',
+            yaxis='y2'
+        ))
+        
+        fig.update_layout(
+            title=None,
+            xaxis_title="Reply Depth",
+            yaxis_title="Comments",
+            yaxis2=dict(title="Avg Comment Score", overlaying='y', side='right'),
+            xaxis=dict(tickmode='linear', dtick=1)
+        )
+        
+        return fig
@@ -0,0 +1,324 @@
+# platforms/reddit/live_stream.py
+"""
+Reddit Live Subreddit Monitor.
+Streams new submissions on a background thread into rolling in-memory aggregates.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+
+
+WINDOW_HOURS = 48            # Hourly ring buffer length
+TRACKED_POSTS = 500          # Recent posts whose scores are re-read for velocity
+SCORE_REFRESH_SECONDS = 60   # How often tracked scores are re-read
+VIEWER_TIMEOUT_SECONDS = 120 # Viewers not seen for this long are dropped
+INFO_BATCH_SIZE = 100
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+class HourlyRing:
+    """Fixed-size ring of per-hour counters; the oldest hour is overwritten"""
+
+    def __init__(self, fields, hours=WINDOW_HOURS):
+        self.hours = hours
+        self.slot_hour = np.full(hours, -1, dtype='int64')
+        self.values = {field: np.zeros(hours) for field in fields}
+
+
+    def add(self, timestamp, **amounts):
+        """Add amounts to the hour containing `timestamp` (hours older than the ring are dropped)."""
+        hour = int(timestamp // 3600)
+        slot = hour % self.hours
+
+        if self.slot_hour[slot] != hour:
+            if hour < self.slot_hour[slot]:
+                return
+            self.slot_hour[slot] = hour
+            for values in self.values.values():
+                values[slot] = 0
+
+        for field, amount in amounts.items():
+            self.values[field][slot] += amount
+
+
+    def to_frame(self, now):
+        """Last `hours` hours up to `now`, oldest first, zeros for empty hours."""
+        current = int(now // 3600)
+        hours = np.arange(current - self.hours + 1, current + 1)
+        slots = hours % self.hours
+        valid = self.slot_hour[slots] == hours
+
+        return pd.DataFrame(
+            {field: np.where(valid, values[slots], 0) for field, values in self.values.items()},
+            index=pd.to_datetime(hours * 3600, unit='s', utc=True)
+        )
+
+
+class ActivityCube:
+    """Day-of-week × hour-of-day post counts and upvote totals"""
+
+    def __init__(self):
+        self.posts = np.zeros((7, 24))
+        self.upvotes = np.zeros((7, 24))
+
+
+    @staticmethod
+    def cell(timestamp):
+        """(weekday, hour) of a UTC timestamp."""
+        created = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return created.weekday(), created.hour
+
+
+    def add(self, timestamp, posts=0, upvotes=0):
+        """Add posts/upvotes to the cell a post was created in."""
+        day, hour = self.cell(timestamp)
+        self.posts[day, hour] += posts
+        self.upvotes[day, hour] += upvotes
+
+
+    def mean_upvotes(self):
+        """Average upvotes per post, shaped like RedditInsights.engagement_heatmap's pivot."""
+        means = np.divide(self.upvotes, self.posts, out=np.zeros((7, 24)), where=self.posts > 0)
+        return pd.DataFrame(means, index=DAY_ORDER, columns=range(24))
+
+
+class LiveSubredditMonitor:
+    """
+    Background ingestion of one subreddit's new submissions.
+
+    PRAW's submission stream feeds posts-per-hour and the day × hour cube;
+    the newest TRACKED_POSTS are re-read through /api/info every
+    SCORE_REFRESH_SECONDS, and their score/comment deltas become the
+    upvote and comment velocity. Readers only ever take a snapshot.
+
+    The stream runs while it has viewers: each one attaches with its own
+    id and re-attaches on every refresh. The last viewer to detach, or
+    every viewer going quiet for `viewer_timeout`, stops it.
+    """
+
+    def __init__(self, reddit, subreddit_name, window_hours=WINDOW_HOURS, refresh_seconds=SCORE_REFRESH_SECONDS,
+                 viewer_timeout=VIEWER_TIMEOUT_SECONDS):
+        """
+        Args:
+            reddit: Dedicated praw.Reddit session (used only by the stream thread)
+            subreddit_name: Subreddit to stream
+            window_hours: Length of the hourly ring buffers
+            refresh_seconds: Interval between score refreshes
+            viewer_timeout: Seconds without a refresh after which a viewer is dropped
+        """
+        self.reddit = reddit
+        self.subreddit_name = subreddit_name
+        self.refresh_seconds = refresh_seconds
+        self.viewer_timeout = viewer_timeout
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._viewers = {}
+
+        self.posts_per_hour = HourlyRing(('posts',), window_hours)
+        self.velocity = HourlyRing(('upvotes', 'comments'), window_hours)
+        self.cube = ActivityCube()
+        self._tracked = OrderedDict()
+
+        self.total_posts = 0
+        self.started_at = None
+        self.last_post_at = None
+        self.error = None
+
+
+    @property
+    def running(self):
+        """Whether the stream thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+
+    def start(self):
+        """Start the stream thread (no-op when already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self.error = None
+        self.started_at = datetime.now(timezone.utc)
+        self._thread = threading.Thread(target=self._run, name=f"reddit-stream-{self.subreddit_name}", daemon=True)
+        self._thread.start()
+
+
+    def stop(self):
+        """Ask the stream thread to exit after its current poll."""
+        self._stop.set()
+
+
+    @property
+    def viewers(self):
+        """Number of attached viewers."""
+        with self._lock:
+            return len(self._viewers)
+
+
+    def attach(self, viewer_id):
+        """
+        Register a viewer, or refresh one that is already attached.
+
+        Returns:
+            bool: False when the monitor has stopped (start a new one instead)
+        """
+        with self._lock:
+            if self._stop.is_set() or (self._thread is not None and not self._thread.is_alive()):
+                return False
+            self._viewers[viewer_id] = time.monotonic()
+            return True
+
+
+    def detach(self, viewer_id):
+        """Drop a viewer; the stream stops when it was the last one."""
+        with self._lock:
+            self._viewers.pop(viewer_id, None)
+            if not self._viewers:
+                self._stop.set()
+
+
+    def _reap_viewers(self):
+        """Drop viewers that stopped refreshing; True once the monitor should stop."""
+        cutoff = time.monotonic() - self.viewer_timeout
+
+        with self._lock:
+            for viewer_id, seen in list(self._viewers.items()):
+                if seen < cutoff:
+                    del self._viewers[viewer_id]
+            if not self._viewers:
+                self._stop.set()
+            return self._stop.is_set()
+
+
+    def snapshot(self, recent=20):
+        """
+        Copy the live aggregates.
+
+        Returns:
+            dict: posts_per_hour and velocity (hourly DataFrames), heatmap
+                (day × hour mean upvotes), recent posts and status fields
+        """
+        now = time.time()
+
+        with self._lock:
+            tracked = list(self._tracked.items())[-recent:]
+            snapshot = {
+                'posts_per_hour': self.posts_per_hour.to_frame(now)['posts'],
+                'velocity': self.velocity.to_frame(now),
+                'heatmap': self.cube.mean_upvotes(),
+                'total_posts': self.total_posts,
+                'started_at': self.started_at,
+                'last_post_at': self.last_post_at,
+                'running': self.running,
+                'error': self.error,
+            }
+
+        snapshot['recent'] = pd.DataFrame(
+            [{'fullname': fullname, **post} for fullname, post in reversed(tracked)],
+            columns=['fullname', 'title', 'created_utc', 'upvotes', 'num_comments', 'permalink']
+        )
+        return snapshot
+
+
+    def _run(self):
+        subreddit = self.reddit.subreddit(self.subreddit_name)
+        next_refresh = time.monotonic() + self.refresh_seconds
+
+        try:
+            # pause_after=0 yields None after every empty poll, so stop/refresh stay responsive
+            for post in subreddit.stream.submissions(pause_after=0):
+                if self._reap_viewers():
+                    return
+                if post is not None:
+                    self._ingest(post)
+                if time.monotonic() >= next_refresh:
+                    self._refresh_scores()
+                    next_refresh = time.monotonic() + self.refresh_seconds
+        except Exception as e:
+            self.error = str(e)
+            print(f"❌ Live stream for r/{self.subreddit_name} stopped: {str(e)}")
+
+
+    def _ingest(self, post):
+        """Add one new submission to every aggregate."""
+        with self._lock:
+            if post.fullname in self._tracked:
+                return
+
+            self.posts_per_hour.add(post.created_utc, posts=1)
+            self.cube.add(post.created_utc, posts=1, upvotes=post.score)
+            self._tracked[post.fullname] = {
+                'title': post.title,
+                'created_utc': datetime.fromtimestamp(post.created_utc, tz=timezone.utc),
+                'upvotes': post.score,
+                'num_comments': post.num_comments,
+                'permalink': f"https://reddit.com{post.permalink}",
+            }
+            while len(self._tracked) > TRACKED_POSTS:
+                self._tracked.popitem(last=False)
+
+            self.total_posts += 1
+            self.last_post_at = datetime.now(timezone.utc)
+
+
+    def _refresh_scores(self):
+        """Re-read tracked posts; score and comment deltas feed velocity and the cube."""
+        with self._lock:
+            fullnames = list(self._tracked)
+
+        now = time.time()
+        for i in range(0, len(fullnames), INFO_BATCH_SIZE):
+            for post in self.reddit.info(fullnames=fullnames[i:i + INFO_BATCH_SIZE]):
+                with self._lock:
+                    tracked = self._tracked.get(post.fullname)
+                    if tracked is None:
+                        continue
+
+                    upvotes = post.score - tracked['upvotes']
+                    comments = post.num_comments - tracked['num_comments']
+                    self.velocity.add(now, upvotes=upvotes, comments=comments)
+                    self.cube.add(post.created_utc, upvotes=upvotes)
+
+                    tracked['upvotes'] = post.score
+                    tracked['num_comments'] = post.num_comments
+
+
+# Process-wide monitors, shared by every Streamlit session and rerun
+_monitors = {}
+_monitors_lock = threading.Lock()
+
+
+def get_monitor(subreddit_name, reddit_factory, viewer_id):
+    """
+    Attach a viewer to the running monitor for a subreddit, starting one if needed.
+
+    Stopped monitors are dropped from the registry on the way.
+
+    Args:
+        subreddit_name: Subreddit to stream
+        reddit_factory: Callable returning a new praw.Reddit session for the stream
+        viewer_id: Id of the attaching viewer (one per Streamlit session)
+
+    Returns:
+        LiveSubredditMonitor
+    """
+    key = subreddit_name.lower()
+
+    with _monitors_lock:
+        for name, monitor in list(_monitors.items()):
+            if not monitor.running:
+                del _monitors[name]
+
+        monitor = _monitors.get(key)
+        if monitor is None or not monitor.attach(viewer_id):
+            monitor = LiveSubredditMonitor(reddit_factory(), subreddit_name)
+            monitor.attach(viewer_id)
+            monitor.start()
+            _monitors[key] = monitor
+        return monitor
@@ -0,0 +1,143 @@
+# platforms/reddit/post_store.py
+"""
+Reddit Post Store.
+Keeps every post seen per subreddit/user so history outlives Reddit's ~1000-item listings.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+
+
+# Scores keep moving while a post is young; older posts are left as stored
+SCORE_REFRESH_WINDOW = timedelta(days=3)
+SCORE_REFRESH_INTERVAL = timedelta(minutes=30)
+
+# Listing fields kept per post (what PostColumnBuilder reads)
+STORED_FIELDS = (
+    'id', 'name', 'title', 'author', 'subreddit', 'created_utc', 'score', 'upvote_ratio',
+    'num_comments', 'permalink', 'url', 'is_self', 'selftext', 'link_flair_text',
+    'total_awards_received', 'is_video', 'domain',
+)
+
+
+class PostStore:
+    """
+    SQLite store of raw post fields, keyed by (source, post_id).
+
+    A source is 'r/<subreddit>' or 'u/<user>'. Posts are upserted, so a
+    refresh only overwrites the fields that changed and the first-seen
+    time is kept.
+    """
+
+    def __init__(self, db_path=".cache/reddit/posts.db"):
+        """
+        Args:
+            db_path (str): SQLite database file
+        """
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS posts (
+                source TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                created_utc REAL NOT NULL,
+                data TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                refreshed_at REAL NOT NULL,
+                PRIMARY KEY (source, post_id)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS posts_by_age ON posts (source, created_utc)")
+
+
+    def upsert(self, source, posts):
+        """
+        Insert new posts and overwrite the fields of known ones.
+
+        Args:
+            source (str): 'r/<subreddit>' or 'u/<user>'
+            posts (list): Raw t3 data dicts from a listing or /api/info
+        """
+        now = time.time()
+        rows = [
+            (source, post['id'], float(post.get('created_utc') or 0),
+             json.dumps({field: post.get(field) for field in STORED_FIELDS}), now, now)
+            for post in posts
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO posts (source, post_id, created_utc, data, first_seen, refreshed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, post_id) DO UPDATE SET
+                    data = excluded.data, refreshed_at = excluded.refreshed_at
+                """,
+                rows
+            )
+
+
+    def newest_fullname(self, source):
+        """Fullname (t3_<id>) of the newest stored post, the anchor for `before` paging."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT post_id FROM posts WHERE source = ? ORDER BY created_utc DESC LIMIT 1", (source,)
+            ).fetchone()
+        return f"t3_{row[0]}" if row else None
+
+
+    def known_ids(self, source, post_ids):
+        """The subset of `post_ids` already stored for a source."""
+        post_ids = list(post_ids)
+        if not post_ids:
+            return set()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT post_id FROM posts WHERE source = ? AND post_id IN ({','.join('?' * len(post_ids))})",
+                (source, *post_ids)
+            ).fetchall()
+        return {post_id for (post_id,) in rows}
+
+
+    def refresh_due(self, source, window=SCORE_REFRESH_WINDOW, interval=SCORE_REFRESH_INTERVAL):
+        """
+        Fullnames of posts still inside the voting window and not refreshed recently.
+
+        Returns:
+            list: ['t3_<id>', ...]
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT post_id FROM posts WHERE source = ? AND created_utc >= ? AND refreshed_at <= ?",
+                (source, now - window.total_seconds(), now - interval.total_seconds())
+            ).fetchall()
+        return [f"t3_{post_id}" for (post_id,) in rows]
+
+
+    def load(self, source):
+        """
+        All stored posts for a source, newest first, as listing children.
+
+        Returns:
+            list: [{'kind': 't3', 'data': {...}}, ...] (feed to PostColumnBuilder)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM posts WHERE source = ? ORDER BY created_utc DESC", (source,)
+            ).fetchall()
+        return [{'kind': 't3', 'data': json.loads(data)} for (data,) in rows]
+
+
+    def count(self, source):
+        """Number of stored posts for a source."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts WHERE source = ?", (source,)).fetchone()[0]
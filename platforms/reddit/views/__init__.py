@@ -9,6 +9,7 @@ from .kpi_cards import render_kpi_cards
 from .stat_cards import render_stat_cards
 from .top_posts_chart import render_top_posts_chart
 from .tabs import render_reddit_tabs
+from .live_monitor import render_live_monitor
 
 __all__ = [
     'render_header',
@@ -16,4 +17,5 @@ __all__ = [
     'render_stat_cards',
     'render_top_posts_chart',
     'render_reddit_tabs',
+    'render_live_monitor',
 ]
@@ -0,0 +1,91 @@
+# platforms/reddit/views/live_monitor.py
+"""
+Reddit Live Monitor Component.
+Renders a live subreddit monitor's rolling aggregates, refreshed in place.
+"""
+
+import streamlit as st
+import plotly.graph_objects as go
+from ui.components import kpi, chart_card, end_card
+from ui.styles import plotly_layout
+from ..insights import RedditInsights
+
+
+def render_live_monitor(monitor, viewer_id, refresh_seconds=5):
+    """
+    Render the live panel; only this fragment reruns every `refresh_seconds`.
+
+    Every refresh re-attaches the viewer, which keeps the stream alive while
+    the panel is on screen.
+
+    Args:
+        monitor: Running LiveSubredditMonitor
+        viewer_id: This session's viewer id on the monitor
+        refresh_seconds: Refresh interval of the panel
+    """
+    @st.fragment(run_every=refresh_seconds)
+    def live_panel():
+        monitor.attach(viewer_id)
+        snapshot = monitor.snapshot()
+        posts_per_hour = snapshot['posts_per_hour']
+        velocity = snapshot['velocity']
+
+        if snapshot['error']:
+            st.error(f"❌ Stream stopped: {snapshot['error']}")
+        elif not snapshot['running']:
+            st.warning("⏹️ Stream stopped")
+
+        # KPIs
+        c1, c2, c3, c4 = st.columns(4)
+        with c1:
+            kpi("Posts Streamed", f"{snapshot['total_posts']:,}",
+                f"Since {snapshot['started_at']:%H:%M} UTC" if snapshot['started_at'] else "Starting")
+        with c2:
+            kpi("Posts / Hour", f"{int(posts_per_hour.iloc[-1]):,}", "Current hour")
+        with c3:
+            kpi("Upvote Velocity", f"{int(velocity['upvotes'].iloc[-1]):+,}", "Upvotes gained this hour")
+        with c4:
+            kpi("Comment Velocity", f"{int(velocity['comments'].iloc[-1]):+,}", "Comments gained this hour")
+
+        st.markdown("")
+
+        left, right = st.columns(2)
+
+        with left:
+            cont = chart_card("Posts per Hour")
+            with cont:
+                fig = go.Figure(go.Bar(x=posts_per_hour.index, y=posts_per_hour.values, marker_color='#FF4500'))
+                fig.update_layout(**plotly_layout(), height=320, xaxis_title="Hour (UTC)", yaxis_title="Posts",
+                                  margin=dict(l=20, r=20, t=20, b=40))
+                st.plotly_chart(fig, use_container_width=True)
+            end_card()
+
+        with right:
+            cont = chart_card("Upvote & Comment Velocity")
+            with cont:
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=velocity.index, y=velocity['upvotes'], name='Upvotes / hour',
+                                         line=dict(color='#FF4500', width=2.5)))
+                fig.add_trace(go.Scatter(x=velocity.index, y=velocity['comments'], name='Comments / hour',
+                                         line=dict(color='#3B82F6', width=2.5)))
+                fig.update_layout(**plotly_layout(), height=320, xaxis_title="Hour (UTC)", hovermode='x unified',
+                                  margin=dict(l=20, r=20, t=20, b=40))
+                st.plotly_chart(fig, use_container_width=True)
+            end_card()
+
+        cont = chart_card("Activity Heatmap (avg upvotes by posting time)")
+        with cont:
+            st.plotly_chart(RedditInsights.heatmap_figure(snapshot['heatmap']), use_container_width=True)
+        end_card()
+
+        cont = chart_card("Latest Posts")
+        with cont:
+            st.dataframe(
+                snapshot['recent'].drop(columns=['fullname']),
+                use_container_width=True,
+                hide_index=True,
+                column_config={"permalink": st.column_config.LinkColumn("Link")}
+            )
+        end_card()
+
+    live_panel()
@@ -123,14 +123,19 @@ def render_reddit_tabs(posts_df, reddit_data, stats):
                 from ..insights import RedditInsights
                 insights = RedditInsights(posts_df, stats)
                 
+                comment_trees = reddit_data.get('comment_trees')
+                choices = [
+                    "Engagement Heatmap",
+                    "Engagement Distribution",
+                    "Posting Timeline",
+                    "Top Subreddits" if reddit_data['type'] == 'user' else "Content Type Analysis"
+                ]
+                if comment_trees is not None and not comment_trees.empty:
+                    choices.append("Comment Depth")
+                
                 chart_choice = st.selectbox(
                     "Choose Analysis",
-                    [
-                        "Engagement Heatmap",
-                        "Engagement Distribution",
-                        "Posting Timeline",
-                        "Top Subreddits" if reddit_data['type'] == 'user' else "Content Type Analysis"
-                    ],
+                    choices,
                     key="reddit_insights_choice"
                 )
                 
@@ -166,6 +171,12 @@ def render_reddit_tabs(posts_df, reddit_data, stats):
                             else:
                                 st.info("Not enough data for this analysis")
                         
+                        elif chart_choice == "Comment Depth":
+                            st.markdown(f"*{len(comment_trees):,} comments from the top {comment_trees['post_id'].nunique()} posts*")
+                            fig = insights.comment_depth_analysis(comment_trees)
+                            fig.update_layout(**plotly_layout())
+                            st.plotly_chart(fig, use_container_width=True)
+                        
                         else:  # Content Type Analysis
                             st.markdown("*Compare self posts vs links/media*")
                             fig = insights.content_type_analysis()
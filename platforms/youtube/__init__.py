@@ -4,10 +4,12 @@ YouTube Analytics Platform Module.
 Handles YouTube channel analysis, data processing, and dashboard rendering.
 """
 
-from .analyzer import analyze_youtube_channel
-from .dashboard import render_dashboard
+from .analyzer import analyze_youtube_channel, analyze_youtube_channels
+from .dashboard import render_dashboard, render_bulk_dashboard
 
 __all__ = [
     'analyze_youtube_channel',
+    'analyze_youtube_channels',
     'render_dashboard',
+    'render_bulk_dashboard',
 ]
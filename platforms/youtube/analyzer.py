@@ -5,6 +5,7 @@ Handles API calls, data fetching, quota management, and session state updates.
 """
 
 import streamlit as st
+from datetime import datetime, timedelta, timezone
 from .api_client import YouTubeChannelAnalyser
 
 
@@ -15,6 +16,9 @@ def analyze_youtube_channel(config):
     Args:
         config: Configuration dict from sidebar with keys:
             - channel_input: Channel ID/URL/username
+            - incremental: Refresh from the channel's last snapshot
+            - window_days: Only fetch uploads from the last N days (None = all)
+            - max_videos: Most recent uploads to analyze (None = all)
             - fetch_comments: Whether to fetch comments
             - max_comments: Max comments per video
             - num_videos_for_comments: Number of videos to fetch comments from
@@ -46,20 +50,69 @@ def analyze_youtube_channel(config):
             # Get API key from secrets
             api_key = st.secrets["youtube"]["api_key"]
             
-            # Create analyzer
-            analyzer = YouTubeChannelAnalyser(api_key=api_key)
+            # Create analyzer (every API call is metered in quota units)
+            analyzer = YouTubeChannelAnalyser(
+                api_key=api_key,
+                quota_meter=quota_manager.record_youtube_call if QUOTA_ENABLED else None
+            )
+            
+            # Fetch data (refused up front if it cannot fit in today's budget)
+            quota_budget = quota_manager.get_usage_stats("youtube")["remaining"] if QUOTA_ENABLED else None
+            window_days = config.get("window_days")
+            published_after = datetime.now(timezone.utc) - timedelta(days=window_days) if window_days else None
             
-            # Fetch data
             st.session_state.channel_stats, st.session_state.video_df = analyzer.get_channel_data(
-                config["channel_input"]
+                config["channel_input"],
+                max_videos=config.get("max_videos"),
+                incremental=config.get("incremental", False),
+                quota_budget=quota_budget,
+                published_after=published_after
             )
             
-            # Increment quota
-            if QUOTA_ENABLED:
-                quota_manager.increment_usage("youtube")
+            # Comments of the most viewed videos, harvested several videos at a time;
+            # only comments missing from the sentiment store are scored
+            video_df = st.session_state.video_df
+            top_videos = []
+            if config["fetch_comments"] and not video_df.empty:
+                from sentiment_analyzer import SentimentAnalyzer, CommentTextStats
+                from sentiment_store import CommentSentimentStore
+                
+                top_videos = video_df.nlargest(config["num_videos_for_comments"], 'view_count')['video_id'].tolist()
+                
+                # The harvest is metered too: cap it to what the video fetch left of today's budget
+                harvest_cost = SentimentAnalyzer.estimate_quota_cost(len(top_videos), config["max_comments"])
+                if QUOTA_ENABLED and not quota_manager.can_make_request("youtube", units=harvest_cost):
+                    per_video = SentimentAnalyzer.estimate_quota_cost(1, config["max_comments"])
+                    affordable = quota_manager.get_usage_stats("youtube")["remaining"] // per_video
+                    st.warning(f"⚠️ Today's quota only covers comments of {affordable} of {len(top_videos)} videos "
+                               f"({per_video} units each)")
+                    top_videos = top_videos[:affordable]
             
-            # Store in session state
-            st.session_state.analyzer = analyzer
+            if top_videos:
+                sentiment = SentimentAnalyzer(analyzer.youtube, store=CommentSentimentStore())
+                
+                # Keywords, bigrams and emoji are counted page by page during the harvest
+                text_stats = CommentTextStats(score=False)
+                st.session_state.comments_df = sentiment.fetch_comments_for_videos(
+                    top_videos, max_comments=config["max_comments"], on_page=text_stats.update
+                )
+                st.session_state.comment_terms = {
+                    'keywords': text_stats.keywords(15),
+                    'bigrams': text_stats.bigrams(15),
+                    'emojis': text_stats.emojis(10),
+                }
+                st.session_state.comment_sentiment = sentiment.analyze_comments(st.session_state.comments_df)
+                st.session_state.comment_summary = sentiment.get_sentiment_summary(
+                    st.session_state.comment_sentiment, video_ids=top_videos
+                )
+                st.session_state.comment_video_summaries = sentiment.get_video_summaries(top_videos)
+            else:
+                for key in ("comments_df", "comment_sentiment", "comment_summary", "comment_video_summaries",
+                            "comment_terms"):
+                    st.session_state.pop(key, None)
+            
+            # Store in session state (results only: the client is shared process-wide)
+            st.session_state.cache_stats = analyzer.cache_stats
             st.session_state.fetch_comments = config["fetch_comments"]
             st.session_state.max_comments = config["max_comments"]
             st.session_state.num_videos_for_comments = config["num_videos_for_comments"]
@@ -72,3 +125,68 @@ def analyze_youtube_channel(config):
     except Exception as e:
         st.session_state.clear()
         st.error(f"❌ Error: {str(e)}")
+
+
+def analyze_youtube_channels(config):
+    """
+    Handle the multi-channel (bulk) analysis workflow.
+    
+    Args:
+        config: Configuration dict from sidebar with keys:
+            - channel_inputs: List of channel IDs/URLs/handles
+            - window_days: Only fetch uploads from the last N days (None = all)
+            - max_videos: Most recent uploads to analyze per channel (None = all)
+    
+    Returns:
+        None. Updates st.session_state with bulk_channels and bulk_videos.
+    """
+    # Check if quota manager is available
+    try:
+        from config.quota_manager import quota_manager
+        QUOTA_ENABLED = True
+    except ImportError:
+        QUOTA_ENABLED = False
+    
+    # Validate input
+    if not config["channel_inputs"]:
+        st.error("⚠️ Please enter at least one channel identifier")
+        return
+    
+    # Check quota
+    if QUOTA_ENABLED and not quota_manager.can_make_request("youtube"):
+        st.error("❌ Daily quota limit reached! Please try again tomorrow.")
+        st.info("💡 Tip: The quota resets at midnight UTC (5:00 AM PKT)")
+        return
+    
+    try:
+        with st.spinner(f"🔄 Analyzing {len(config['channel_inputs'])} YouTube channels..."):
+            api_key = st.secrets["youtube"]["api_key"]
+            
+            analyzer = YouTubeChannelAnalyser(
+                api_key=api_key,
+                quota_meter=quota_manager.record_youtube_call if QUOTA_ENABLED else None
+            )
+            
+            # One budget for the whole run, identifier resolution included
+            quota_budget = quota_manager.get_usage_stats("youtube")["remaining"] if QUOTA_ENABLED else None
+            window_days = config.get("window_days")
+            published_after = datetime.now(timezone.utc) - timedelta(days=window_days) if window_days else None
+            
+            st.session_state.bulk_channels, st.session_state.bulk_videos, failed = analyzer.get_bulk_channel_data(
+                config["channel_inputs"],
+                max_videos=config.get("max_videos"),
+                quota_budget=quota_budget,
+                published_after=published_after
+            )
+            
+            # Store in session state
+            st.session_state.bulk_failed = failed
+            st.session_state.cache_stats = analyzer.cache_stats
+            st.session_state.platform = "youtube_bulk"
+            
+            st.success(f"✅ {len(st.session_state.bulk_channels)} channels analyzed successfully!")
+            st.rerun()
+    
+    except Exception as e:
+        st.session_state.clear()
+        st.error(f"❌ Error: {str(e)}")
@@ -1,25 +1,291 @@
 # youtube.py
 # Enhanced YouTube Data Extraction with Maximum Accuracy + VALIDATION
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import pandas as pd
+import os
 import re
 from datetime import datetime, timezone
-import isodate
-import time
+import json
+import math
+import threading
+import asyncio
+from .response_cache import ResponseCache
+from .client_factory import client_factory
+from .async_client import AsyncYouTubeClient, run_sync
+from .columnar import VideoColumnBuilder, add_derived_columns
+from .snapshot_store import ChannelSnapshotStore, snapshot_covers, stats_refresh_due
+from .channel_index import ChannelIndex, is_channel_id, read_warmup_file
+from core.rate_limiter import get_pacer, call_with_backoff
+
+
+# YouTube Data API v3 quota cost per call, in units
+QUOTA_COSTS = {
+    'channels.list': 1,
+    'playlistItems.list': 1,
+    'videos.list': 1,
+    'commentThreads.list': 1,
+    'search.list': 100,
+}
+
+
+# Partial-response projections: exactly the fields the parsers below read.
+# 'etag' is kept on cached calls so stale entries can be revalidated.
+CHANNEL_ID_FIELDS = 'etag,items(id)'
+SEARCH_FIELDS = 'etag,items(snippet(channelId,channelTitle))'
+CHANNEL_FIELDS = (
+    'etag,items(id,snippet(title,description,publishedAt,customUrl,country),'
+    'statistics(subscriberCount,viewCount,videoCount,hiddenSubscriberCount),'
+    'contentDetails/relatedPlaylists/uploads)'
+)
+PLAYLIST_FIELDS = 'etag,nextPageToken,items/contentDetails(videoId,videoPublishedAt)'
+VIDEO_FIELDS = (
+    'etag,items(id,snippet(title,publishedAt,tags,categoryId,description),'
+    'statistics(viewCount,likeCount,commentCount),contentDetails/duration,status/privacyStatus)'
+)
+VIDEO_STATISTICS_FIELDS = 'items(id,statistics(viewCount,likeCount,commentCount))'
+
+# Units held back per identifier resolved through the API (a forHandle lookup plus a search fallback)
+RESOLVE_QUOTA_RESERVE = QUOTA_COSTS['channels.list'] + QUOTA_COSTS['search.list']
+
+# Videos collected before the streaming pipeline types a chunk (one to_frame() per chunk)
+FRAME_CHUNK_VIDEOS = 5000
+
+# 403 reasons that mean "slow down" rather than "forbidden"
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+
+def youtube_retry_policy(error):
+    """
+    Decide whether an error is API pushback worth retrying.
+    
+    Returns:
+        tuple: (retryable, Retry-After seconds or None)
+    """
+    if not isinstance(error, HttpError):
+        return False, None
+    
+    status = error.resp.status
+    retry_after = error.resp.get('retry-after')
+    
+    if status == 429 or status >= 500:
+        return True, retry_after
+    
+    if status == 403:
+        try:
+            errors = json.loads(error.content.decode('utf-8'))['error'].get('errors', [])
+        except (ValueError, KeyError, AttributeError):
+            return False, None
+        return any(e.get('reason') in RATE_LIMIT_REASONS for e in errors), retry_after
+    
+    return False, None
+
+
+class MeteredHttpRequest(HttpRequest):
+    """HttpRequest that reports the quota cost of every executed call"""
+    
+    quota_meter = None
+    
+    def execute(self, http=None, num_retries=0):
+        try:
+            return super().execute(http=http, num_retries=num_retries)
+        finally:
+            # Failed and 304 responses are still charged by the API
+            if self.quota_meter:
+                endpoint = self.methodId.split('.', 1)[-1]
+                self.quota_meter(endpoint, QUOTA_COSTS.get(endpoint, 1))
 
 
 class YouTubeChannelAnalyser:
-    def __init__(self, api_key):
+    def __init__(self, api_key, use_cache=True, cache_dir=".cache/youtube", max_workers=8, quota_meter=None,
+                 max_retries=5, async_backend=False, max_connections=16, api_endpoint=None):
+        """
+        Args:
+            api_key (str): YouTube Data API key
+            use_cache (bool): Serve repeat calls from the on-disk response cache
+            cache_dir (str): Directory for cached responses, snapshots and the channel index
+            max_workers (int): Concurrent requests for batched fetches
+            quota_meter (callable): Called as quota_meter(endpoint, units) for every
+                API call made through self.youtube (including SentimentAnalyzer)
+            max_retries (int): Retries on 429, 5xx and 403 rate-limit responses
+            async_backend (bool): Fetch uploads, video batches and statistics on an
+                asyncio/aiohttp backend instead of the googleapiclient thread pool
+            max_connections (int): Requests in flight at once on the async backend
+            api_endpoint (str): Data API root URL override (e.g. the offline fake server
+                in benchmarks/fake_api.py); None uses https://youtube.googleapis.com/
+        """
         self.api_key = api_key
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+        self.quota_meter = quota_meter
+        self.quota_units_used = 0
+        self._quota_lock = threading.Lock()
+        
+        # The discovery service and connections are shared process-wide
+        self.youtube, self.client_build_seconds, self.client_reused = client_factory.get_service(
+            api_key, MeteredHttpRequest, quota_meter, api_endpoint
+        )
+        self.api_endpoint = api_endpoint
+        self.http_pool = client_factory.http_pool
+        self.cache = ResponseCache(cache_dir) if use_cache else None
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.async_backend = async_backend
+        self.max_connections = max_connections
+        self.pacer = get_pacer("youtube")
+        self.snapshots = ChannelSnapshotStore(os.path.join(cache_dir, "snapshots"))
+        self.channel_index = ChannelIndex(os.path.join(cache_dir, "channel_index.json"))
+
+
+    def _record_quota(self, endpoint):
+        """Count units spent by this analyser (the shared service reports them to quota_meter)"""
+        with self._quota_lock:
+            self.quota_units_used += QUOTA_COSTS.get(endpoint, 1)
+
+
+    def _record_async_call(self, endpoint):
+        """Quota metering for the async backend (it bypasses MeteredHttpRequest)"""
+        self._record_quota(endpoint)
+        if self.quota_meter:
+            self.quota_meter(endpoint, QUOTA_COSTS.get(endpoint, 1))
+
+
+    def _async_client(self):
+        """Create an async client sharing this analyser's cache, pacer and quota meter"""
+        kwargs = {'api_url': f"{self.api_endpoint.rstrip('/')}/youtube/v3/"} if self.api_endpoint else {}
+        return AsyncYouTubeClient(
+            self.api_key,
+            youtube_retry_policy,
+            cache=self.cache,
+            pacer=self.pacer,
+            on_call=self._record_async_call,
+            max_retries=self.max_retries,
+            max_connections=self.max_connections,
+            **kwargs
+        )
+
+
+    def client_report(self, pool_at_start):
+        """One-line summary of client setup time saved and warm connections reused"""
+        pool = self.http_pool.stats()
+        reused = pool['reused'] - pool_at_start['reused']
+        created = pool['created'] - pool_at_start['created']
+        
+        if self.client_reused:
+            service = f"shared service (saved {self.client_build_seconds * 1000:.0f} ms build)"
+        else:
+            service = f"new service ({self.client_build_seconds * 1000:.0f} ms build)"
+        return f"{service}, {reused} warm connections reused, {created} opened"
+
+
+    @property
+    def cache_stats(self):
+        """Cache hit/miss counters (empty when caching is disabled)"""
+        return self.cache.stats() if self.cache else {}
+
+
+    def _execute(self, endpoint, cached=True, **params):
+        """
+        Execute a Data API list call through the response cache.
+        
+        Args:
+            endpoint (str): "<resource>.list", e.g. "videos.list"
+            cached (bool): Set False to always hit the network
+            **params: Request parameters
+        
+        Returns:
+            dict: API response body
+        """
+        resource = endpoint.split('.')[0]
+        request = getattr(self.youtube, resource)().list(**params)
+        
+        if self.cache is None or not cached:
+            return self._send(request)
+        
+        entry = self.cache.lookup(endpoint, params)
+        if entry and self.cache.is_fresh(endpoint, entry):
+            self.cache.record('hits')
+            return entry['body']
+        
+        # Stale entry: revalidate instead of re-downloading
+        if entry and entry.get('etag'):
+            request.headers['If-None-Match'] = entry['etag']
+        
+        try:
+            response = self._send(request)
+        except HttpError as e:
+            if entry and e.resp.status == 304:
+                self.cache.refresh(endpoint, params, entry)
+                self.cache.record('revalidated')
+                return entry['body']
+            raise
+        
+        self.cache.store(endpoint, params, response)
+        self.cache.record('misses')
+        return response
 
 
     def extract_channel_id(self, channel_identifier):
-        """Extract channel ID with improved accuracy"""
+        """Extract channel ID, checking the local index before any API call"""
         channel_identifier = channel_identifier.strip()
         
+        if is_channel_id(channel_identifier):
+            return channel_identifier
+        
+        channel_id = self.channel_index.lookup(channel_identifier)
+        if channel_id:
+            return channel_id
+        
+        channel_id = self._resolve_channel_id(channel_identifier)
+        self.channel_index.record(channel_identifier, channel_id)
+        return channel_id
+
+
+    def _send(self, request):
+        """Execute a request through the shared pacer, retrying on API pushback"""
+        endpoint = request.methodId.split('.', 1)[-1]
+        
+        def attempt():
+            try:
+                with self.http_pool.connection() as http:
+                    return request.execute(http=http)
+            finally:
+                self._record_quota(endpoint)
+        
+        return call_with_backoff(
+            attempt,
+            youtube_retry_policy,
+            pacer=self.pacer,
+            max_retries=self.max_retries,
+            label="YouTube API"
+        )
+
+
+    def warm_channel_index(self, path):
+        """
+        Bulk-load the channel index from a file.
+        
+        Lines with "identifier,UC..." are stored directly; bare identifiers
+        are resolved once through the API.
+        
+        Returns:
+            int: Number of identifiers now in the index
+        """
+        known, unresolved = read_warmup_file(path)
+        self.channel_index.record_many(known)
+        
+        for identifier in unresolved:
+            try:
+                self.extract_channel_id(identifier)
+            except ValueError as e:
+                print(f"⚠️ {str(e)}")
+        
+        return len(known) + len([i for i in unresolved if self.channel_index.lookup(i)])
+
+
+    def _resolve_channel_id(self, channel_identifier):
+        """Resolve a channel ID through the API with improved accuracy"""
         # Direct channel ID
         if channel_identifier.startswith('UC') and len(channel_identifier) == 24:
             return channel_identifier
@@ -28,11 +294,12 @@ class YouTubeChannelAnalyser:
         if channel_identifier.startswith('@'):
             username = channel_identifier[1:]
             try:
-                request = self.youtube.channels().list(
+                response = self._execute(
+                    'channels.list',
                     part='id',
-                    forHandle=username
+                    forHandle=username,
+                    fields=CHANNEL_ID_FIELDS
                 )
-                response = request.execute()
                 if response.get('items'):
                     return response['items'][0]['id']
             except:
@@ -40,13 +307,14 @@ class YouTubeChannelAnalyser:
             
             # Fallback to search
             try:
-                request = self.youtube.search().list(
+                response = self._execute(
+                    'search.list',
                     part='snippet',
                     q=username,
                     type='channel',
-                    maxResults=5
+                    maxResults=5,
+                    fields=SEARCH_FIELDS
                 )
-                response = request.execute()
                 
                 for item in response.get('items', []):
                     if item['snippet'].get('channelTitle', '').lower() == username.lower():
@@ -75,24 +343,26 @@ class YouTubeChannelAnalyser:
                     return identifier
                 
                 try:
-                    request = self.youtube.channels().list(
+                    response = self._execute(
+                        'channels.list',
                         part='id',
-                        forHandle=identifier
+                        forHandle=identifier,
+                        fields=CHANNEL_ID_FIELDS
                     )
-                    response = request.execute()
                     if response.get('items'):
                         return response['items'][0]['id']
                 except:
                     pass
                 
                 try:
-                    request = self.youtube.search().list(
+                    response = self._execute(
+                        'search.list',
                         part='snippet',
                         q=identifier,
                         type='channel',
-                        maxResults=5
+                        maxResults=5,
+                        fields=SEARCH_FIELDS
                     )
-                    response = request.execute()
                     
                     for item in response.get('items', []):
                         if item['snippet'].get('channelTitle', '').lower().replace(' ', '') == identifier.lower().replace(' ', ''):
@@ -105,13 +375,14 @@ class YouTubeChannelAnalyser:
         
         # Last resort: Direct search
         try:
-            request = self.youtube.search().list(
+            response = self._execute(
+                'search.list',
                 part='snippet',
                 q=channel_identifier,
                 type='channel',
-                maxResults=5
+                maxResults=5,
+                fields=SEARCH_FIELDS
             )
-            response = request.execute()
             
             for item in response.get('items', []):
                 if item['snippet'].get('channelTitle', '').lower() == channel_identifier.lower():
@@ -128,147 +399,410 @@ class YouTubeChannelAnalyser:
     def get_channel_statistics(self, channel_id):
         """Get ACTUAL channel stats from YouTube API"""
         try:
-            request = self.youtube.channels().list(
-                part='snippet,statistics,contentDetails,brandingSettings',
-                id=channel_id
+            response = self._execute(
+                'channels.list',
+                part='snippet,statistics,contentDetails',
+                id=channel_id,
+                fields=CHANNEL_FIELDS
             )
-            response = request.execute()
             
             if not response.get('items'):
                 raise ValueError("Channel not found")
             
-            item = response['items'][0]
-            stats = item.get('statistics', {})
-            snippet = item.get('snippet', {})
-            
-            # RETURN ACTUAL CHANNEL STATS
-            return {
-                'channel_id': channel_id,
-                'channel_name': snippet.get('title', 'Unknown'),
-                'description': snippet.get('description', ''),
-                'published_at': snippet.get('publishedAt', ''),
-                'total_subscribers': int(stats.get('subscriberCount', 0)),
-                'total_views': int(stats.get('viewCount', 0)),  # ACTUAL VIEWS
-                'total_videos': int(stats.get('videoCount', 0)),  # ACTUAL VIDEO COUNT
-                'uploads_playlist_id': item['contentDetails']['relatedPlaylists']['uploads'],
-                'hidden_subscriber_count': stats.get('hiddenSubscriberCount', False),
-                'custom_url': snippet.get('customUrl', ''),
-                'country': snippet.get('country', 'Unknown')
-            }
+            return self._parse_channel_item(response['items'][0])
         except HttpError as e:
             raise ValueError(f"API Error: {str(e)}")
 
 
-    def get_video_ids_from_playlist(self, playlist_id, max_results=500):
-        """Fetch ALL video IDs with proper pagination"""
-        video_ids = []
-        next_page_token = None
+    def get_channels_statistics(self, channel_ids):
+        """
+        Get channel stats for many channels, 50 IDs per channels.list call.
+        
+        Args:
+            channel_ids (list): Channel IDs
+        
+        Returns:
+            dict: {channel_id: stats dict}; channels that were not found are omitted
+        """
+        batches = [channel_ids[i:i+50] for i in range(0, len(channel_ids), 50)]
+        statistics = {}
+        
+        for batch in batches:
+            try:
+                response = self._execute(
+                    'channels.list',
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(batch),
+                    maxResults=50,
+                    fields=CHANNEL_FIELDS
+                )
+            except HttpError as e:
+                raise ValueError(f"API Error: {str(e)}")
+            
+            for item in response.get('items', []):
+                statistics[item['id']] = self._parse_channel_item(item)
+        
+        return statistics
+
+
+    @staticmethod
+    def _parse_channel_item(item):
+        """Convert a channels.list item into a channel stats dict"""
+        stats = item.get('statistics', {})
+        snippet = item.get('snippet', {})
         
+        # RETURN ACTUAL CHANNEL STATS
+        return {
+            'channel_id': item['id'],
+            'channel_name': snippet.get('title', 'Unknown'),
+            'description': snippet.get('description', ''),
+            'published_at': snippet.get('publishedAt', ''),
+            'total_subscribers': int(stats.get('subscriberCount', 0)),
+            'total_views': int(stats.get('viewCount', 0)),  # ACTUAL VIEWS
+            'total_videos': int(stats.get('videoCount', 0)),  # ACTUAL VIDEO COUNT
+            'uploads_playlist_id': item['contentDetails']['relatedPlaylists']['uploads'],
+            'hidden_subscriber_count': stats.get('hiddenSubscriberCount', False),
+            'custom_url': snippet.get('customUrl', ''),
+            'country': snippet.get('country', 'Unknown')
+        }
+
+
+    def get_video_ids_from_playlist(self, playlist_id, max_results=500, stop_at_ids=None,
+                                    published_after=None, published_before=None):
+        """
+        Fetch ALL video IDs with proper pagination.
+        
+        Args:
+            playlist_id (str): Uploads playlist ID
+            max_results (int): Maximum number of IDs to return (None = all)
+            stop_at_ids (set): Known video IDs; paging stops at the first one
+                (uploads are listed newest first, so everything after it is known)
+            published_after (datetime): Only return videos published at/after this (UTC);
+                paging stops after the first page that lies entirely before it
+            published_before (datetime): Only return videos published at/before this (UTC)
+        
+        Returns:
+            list: Video IDs, newest first
+        """
         print(f"📥 Fetching video IDs...")
         
-        while len(video_ids) < max_results:
+        video_ids = []
+        for page_ids in self.iter_playlist_pages(playlist_id, max_results, stop_at_ids,
+                                                 published_after, published_before):
+            video_ids.extend(page_ids)
+            print(f"  ✓ Fetched {len(video_ids)} videos so far...")
+        
+        return video_ids
+
+
+    def iter_playlist_pages(self, playlist_id, max_results=None, stop_at_ids=None,
+                            published_after=None, published_before=None):
+        """
+        Walk an uploads playlist one page at a time.
+        
+        Takes the same arguments as get_video_ids_from_playlist.
+        
+        Yields:
+            list: Up to 50 video IDs per page, newest first
+        """
+        returned = 0
+        next_page_token = None
+        windowed = published_after is not None or published_before is not None
+        
+        while max_results is None or returned < max_results:
             try:
-                request = self.youtube.playlistItems().list(
+                remaining = 50 if max_results is None else max_results - returned
+                response = self._execute(
+                    'playlistItems.list',
                     part='contentDetails',
                     playlistId=playlist_id,
-                    maxResults=min(50, max_results - len(video_ids)),
-                    pageToken=next_page_token
+                    maxResults=50 if windowed else min(50, remaining),
+                    pageToken=next_page_token,
+                    fields=PLAYLIST_FIELDS
                 )
-                response = request.execute()
-                
-                for item in response.get('items', []):
-                    video_ids.append(item['contentDetails']['videoId'])
-                
-                print(f"  ✓ Fetched {len(video_ids)} videos so far...")
-                
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token:
-                    break
-                
-                time.sleep(0.1)
-                    
             except HttpError as e:
                 print(f"⚠️ Error fetching playlist: {str(e)}")
+                return
+            
+            page_ids, reached_known, page_before_window = self._filter_playlist_page(
+                response.get('items', []), stop_at_ids, published_after, published_before
+            )
+            
+            if max_results is not None:
+                page_ids = page_ids[:max_results - returned]
+            if page_ids:
+                returned += len(page_ids)
+                yield page_ids
+            
+            # Upload order and publish order can differ slightly (premieres,
+            # scheduled videos), so only a page fully before the window ends the walk
+            if reached_known or (windowed and page_before_window):
+                return
+            
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                return
+
+
+    def _filter_playlist_page(self, items, stop_at_ids, published_after, published_before):
+        """
+        Select the wanted video IDs from one playlistItems page.
+        
+        Returns:
+            tuple: (page_ids, reached_known, page_before_window)
+        """
+        windowed = published_after is not None or published_before is not None
+        page_ids = []
+        page_before_window = bool(items)
+        reached_known = False
+        
+        for item in items:
+            video_id = item['contentDetails']['videoId']
+            if stop_at_ids and video_id in stop_at_ids:
+                reached_known = True
                 break
+            
+            if windowed:
+                published = self._parse_timestamp(item['contentDetails'].get('videoPublishedAt'))
+                if published is None:
+                    continue  # Private or deleted video
+                if published_after is None or published >= published_after:
+                    page_before_window = False
+                if published_before is not None and published > published_before:
+                    continue
+                if published_after is not None and published < published_after:
+                    continue
+            
+            page_ids.append(video_id)
         
-        return video_ids
+        return page_ids, reached_known, page_before_window
 
 
-    def get_video_details(self, video_ids):
-        """Get detailed video statistics"""
-        all_video_data = []
-        total_batches = (len(video_ids) + 49) // 50
+    def iter_video_frames(self, playlist_id, max_results=None, published_after=None, published_before=None,
+                          chunk_videos=FRAME_CHUNK_VIDEOS):
+        """
+        Streaming fetch pipeline: playlist pages -> detail batches -> typed chunks.
         
-        print(f"📊 Fetching details for {len(video_ids)} videos in {total_batches} batches...")
+        Each playlist page becomes one videos.list batch on the worker pool;
+        at most max_workers batches are in flight. Finished batches are
+        appended to one VideoColumnBuilder, which is typed in a single
+        to_frame() pass every `chunk_videos` videos, so memory stays bounded
+        without paying the per-frame cost on every 50-item batch.
+        
+        Yields:
+            pd.DataFrame: Typed chunk of up to chunk_videos public videos (plus
+                the last batch's overflow), in playlist order
+        """
+        pending = deque()
+        builder = VideoColumnBuilder()
         
-        for batch_num, i in enumerate(range(0, len(video_ids), 50), 1):
-            batch = video_ids[i:i+50]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pages = self.iter_playlist_pages(playlist_id, max_results, None, published_after, published_before)
             
-            try:
-                request = self.youtube.videos().list(
-                    part='snippet,statistics,contentDetails,status',
-                    id=','.join(batch)
-                )
-                response = request.execute()
+            for page_ids in pages:
+                pending.append(executor.submit(self._fetch_video_batch, page_ids))
                 
-                for item in response.get('items', []):
-                    # Only public videos
-                    if item['status']['privacyStatus'] != 'public':
+                if len(pending) >= self.max_workers:
+                    items = pending.popleft().result()
+                    if items:
+                        builder.add_items(items)
+                    if len(builder) >= chunk_videos:
+                        yield self._builder_to_frame(builder)
+                        builder = VideoColumnBuilder()
+            
+            while pending:
+                items = pending.popleft().result()
+                if items:
+                    builder.add_items(items)
+        
+        if len(builder):
+            yield self._builder_to_frame(builder)
+
+
+    @staticmethod
+    def _builder_to_frame(builder):
+        """Type the collected batches in one pass"""
+        df = builder.to_frame()
+        df['stats_refreshed_at'] = datetime.now(timezone.utc)
+        return df
+
+
+    @staticmethod
+    def _parse_timestamp(value):
+        """Parse an API RFC 3339 timestamp (None if missing or invalid)"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+
+    def get_video_details(self, video_ids, concurrent=True, max_workers=None):
+        """
+        Get detailed video statistics.
+        
+        Args:
+            video_ids (list): Video IDs to fetch
+            concurrent (bool): Fetch 50-ID batches on a worker pool
+            max_workers (int): Worker limit (defaults to self.max_workers)
+        
+        Returns:
+            list: Video dicts in the same order as video_ids
+        """
+        df = self.get_video_frame(video_ids, concurrent, max_workers)
+        return df.drop(columns=['stats_refreshed_at']).to_dict('records')
+
+
+    def get_video_frame(self, video_ids, concurrent=True, max_workers=None):
+        """
+        Get detailed video statistics as a typed DataFrame.
+        
+        Raw fields from every batch are collected column by column and
+        parsed in one vectorized pass at the end.
+        
+        Returns:
+            pd.DataFrame: One row per public video, in the same order as video_ids
+        """
+        batches = [video_ids[i:i+50] for i in range(0, len(video_ids), 50)]
+        total_batches = len(batches)
+        
+        print(f"📊 Fetching details for {len(video_ids)} videos in {total_batches} batches...")
+        
+        builder = VideoColumnBuilder()
+        
+        if self.async_backend:
+            for items in run_sync(self._async_fetch_video_batches(batches)):
+                if items is not None:
+                    builder.add_items(items)
+            print(f"  ✓ {total_batches} batches complete ({len(builder)} videos processed)")
+        elif concurrent and total_batches > 1:
+            workers = min(max_workers or self.max_workers, total_batches)
+            
+            # map() yields results in submission order, so rows stay deterministic
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self._fetch_video_batch, batches)
+                for batch_num, items in enumerate(results, 1):
+                    if items is None:
                         continue
-                    
-                    snippet = item['snippet']
-                    stats = item.get('statistics', {})
-                    content_details = item['contentDetails']
-                    
-                    try:
-                        duration = isodate.parse_duration(content_details['duration'])
-                        duration_seconds = int(duration.total_seconds())
-                    except:
-                        duration_seconds = 0
-                    
-                    try:
-                        upload_date = datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00'))
-                    except:
-                        upload_date = datetime.now(timezone.utc)
-                    
-                    view_count = int(stats.get('viewCount', 0))
-                    like_count = int(stats.get('likeCount', 0))
-                    comment_count = int(stats.get('commentCount', 0))
-                    
-                    engagement_rate = ((like_count + comment_count) / view_count * 100) if view_count > 0 else 0.0
-                    
-                    video_data = {
-                        'video_id': item['id'],
-                        'title': snippet['title'],
-                        'upload_date': upload_date,
-                        'view_count': view_count,
-                        'like_count': like_count,
-                        'comment_count': comment_count,
-                        'engagement_rate': round(engagement_rate, 4),
-                        'duration_seconds': duration_seconds,
-                        'tags': snippet.get('tags', []),
-                        'category_id': snippet.get('categoryId', ''),
-                        'publish_day': upload_date.strftime('%A'),
-                        'publish_hour': upload_date.hour,
-                        'description': snippet.get('description', '')[:500],
-                    }
-                    
-                    all_video_data.append(video_data)
-                
-                print(f"  ✓ Batch {batch_num}/{total_batches} complete ({len(all_video_data)} videos processed)")
-                time.sleep(0.1)
-                    
+                    builder.add_items(items)
+                    print(f"  ✓ Batch {batch_num}/{total_batches} complete ({len(builder)} videos processed)")
+        else:
+            for batch_num, batch in enumerate(batches, 1):
+                items = self._fetch_video_batch(batch)
+                if items is None:
+                    continue
+                builder.add_items(items)
+                print(f"  ✓ Batch {batch_num}/{total_batches} complete ({len(builder)} videos processed)")
+        
+        df = builder.to_frame()
+        df['stats_refreshed_at'] = datetime.now(timezone.utc)
+        
+        return df
+
+
+    def _fetch_video_batch(self, batch):
+        """Fetch the raw items for one batch of up to 50 videos (None on API error)"""
+        try:
+            response = self._execute(
+                'videos.list',
+                part='snippet,statistics,contentDetails,status',
+                id=','.join(batch),
+                fields=VIDEO_FIELDS
+            )
+        except HttpError as e:
+            print(f"⚠️ Error fetching batch starting at {batch[0]}: {str(e)}")
+            return None
+        
+        return response.get('items', [])
+
+
+    def get_video_statistics(self, video_ids):
+        """
+        Fetch fresh view/like/comment counts (bypasses the response cache).
+        
+        Returns:
+            dict: video_id -> {"view_count", "like_count", "comment_count"}.
+                Videos that were deleted or made private are missing.
+        """
+        batches = [video_ids[i:i+50] for i in range(0, len(video_ids), 50)]
+        
+        def fetch(batch):
+            try:
+                return self._execute(
+                    'videos.list',
+                    cached=False,
+                    part='statistics',
+                    id=','.join(batch),
+                    fields=VIDEO_STATISTICS_FIELDS
+                ).get('items', [])
             except HttpError as e:
-                print(f"⚠️ Error in batch {batch_num}: {str(e)}")
-                continue
+                print(f"⚠️ Error refreshing statistics: {str(e)}")
+                return []
+        
+        statistics = {}
+        
+        if self.async_backend:
+            results = run_sync(self._async_fetch_video_batches(batches, statistics_only=True))
+            results = [items or [] for items in results]
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(batches)))) as executor:
+                results = list(executor.map(fetch, batches))
         
-        return all_video_data
+        for items in results:
+            for item in items:
+                stats = item.get('statistics', {})
+                statistics[item['id']] = {
+                    'view_count': int(stats.get('viewCount', 0)),
+                    'like_count': int(stats.get('likeCount', 0)),
+                    'comment_count': int(stats.get('commentCount', 0)),
+                }
+        
+        return statistics
+
 
+    @staticmethod
+    def estimate_quota_cost(video_count, refresh_count=None):
+        """
+        Predict the quota units a video fetch will cost.
+        
+        Args:
+            video_count (int): Videos to fetch in full
+            refresh_count (int): For incremental refreshes, videos whose statistics
+                are due (video_count is then the expected number of new uploads)
+        
+        Returns:
+            int: Upper bound in quota units (cache hits make it cheaper)
+        """
+        pages = max(1, math.ceil(video_count / 50))
+        units = pages * QUOTA_COSTS['playlistItems.list']
+        units += math.ceil(video_count / 50) * QUOTA_COSTS['videos.list']
+        
+        if refresh_count:
+            units += math.ceil(refresh_count / 50) * QUOTA_COSTS['videos.list']
+        
+        return units
 
-    def get_channel_data(self, channel_identifier, max_videos=500):
-        """Main method - Returns ACTUAL channel stats + video data"""
+
+    def get_channel_data(self, channel_identifier, max_videos=None, incremental=False, quota_budget=None,
+                         published_after=None, published_before=None):
+        """
+        Main method - Returns ACTUAL channel stats + video data.
+        
+        Args:
+            channel_identifier (str): Channel ID, handle or URL
+            max_videos (int): Maximum number of recent uploads to analyze (None = all)
+            incremental (bool): Reuse the channel's last snapshot and only fetch
+                new uploads plus statistics that are due for a refresh
+            quota_budget (int): Remaining quota units; the analysis is refused
+                up front if its predicted cost does not fit
+            published_after (datetime): Only analyze uploads published at/after this (UTC)
+            published_before (datetime): Only analyze uploads published at/before this (UTC)
+        """
         print(f"\n🔍 Analyzing: {channel_identifier}")
         print("=" * 60)
+        units_at_start = self.quota_units_used
+        pool_at_start = self.http_pool.stats()
         
         # Step 1: Get channel ID
         channel_id = self.extract_channel_id(channel_identifier)
@@ -283,41 +817,51 @@ class YouTubeChannelAnalyser:
         print(f"   Total Videos: {channel_stats['total_videos']}")
         print(f"   Created: {channel_stats['published_at'][:10]}")
         
-        # Step 3: Fetch video data
-        actual_limit = min(max_videos, channel_stats['total_videos'])
-        print(f"\n📥 Fetching up to {actual_limit} most recent videos...")
-        
-        video_ids = self.get_video_ids_from_playlist(
-            channel_stats['uploads_playlist_id'],
-            max_results=actual_limit
-        )
-        
-        if not video_ids:
-            raise ValueError("No videos found")
-        
-        print(f"✅ Retrieved {len(video_ids)} video IDs")
+        # The channel's own handle is a free index entry
+        if channel_stats['custom_url']:
+            self.channel_index.record(channel_stats['custom_url'], channel_id)
         
-        # Step 4: Get video details
-        video_data = self.get_video_details(video_ids)
+        # Step 3: Fetch video data
+        # None walks the whole uploads playlist (the channel's videoCount can lag behind it)
+        actual_limit = None if max_videos is None else min(max_videos, channel_stats['total_videos'])
+        expected_videos = channel_stats['total_videos'] if actual_limit is None else actual_limit
         
-        if not video_data:
-            raise ValueError("Could not fetch video details")
+        # Snapshots hold the latest uploads, so windowed analyses bypass them
+        windowed = published_after is not None or published_before is not None
+        snapshot = self.snapshots.load(channel_id) if incremental and not windowed else None
+        use_snapshot = snapshot is not None and not snapshot.empty and snapshot_covers(snapshot, actual_limit)
         
-        print(f"✅ Processed {len(video_data)} public videos\n")
+        if quota_budget is not None:
+            quota_budget -= self.quota_units_used - units_at_start
+            
+            if use_snapshot:
+                new_uploads = max(0, channel_stats['total_videos'] - len(snapshot))
+                due = int(stats_refresh_due(snapshot, datetime.now(timezone.utc)).sum())
+                estimated = self.estimate_quota_cost(min(new_uploads, expected_videos), refresh_count=due)
+            else:
+                estimated = self.estimate_quota_cost(expected_videos)
+            
+            print(f"💰 Estimated quota cost: {estimated} units ({quota_budget} remaining)")
+            if estimated > quota_budget:
+                raise ValueError(
+                    f"This analysis needs about {estimated} quota units but only {quota_budget} remain today"
+                )
         
-        # Step 5: Create DataFrame
-        df = pd.DataFrame(video_data)
+        if use_snapshot:
+            df = self._refresh_snapshot(snapshot, channel_stats, actual_limit)
+        else:
+            df = self._fetch_all_videos(channel_stats, actual_limit, published_after, published_before)
         
-        df['view_count'] = df['view_count'].astype('int64')
-        df['like_count'] = df['like_count'].astype('int64')
-        df['comment_count'] = df['comment_count'].astype('int64')
-        df['engagement_rate'] = df['engagement_rate'].astype('float64')
-        df['duration_seconds'] = df['duration_seconds'].astype('int64')
+        df = df.sort_values('upload_date', ascending=False)
+        if actual_limit is not None:
+            df = df.head(actual_limit)
+        df = df.reset_index(drop=True)
+        if not windowed:
+            df.attrs['max_videos'] = actual_limit
+            self.snapshots.save(channel_id, df)
         
-        df = df.sort_values('upload_date', ascending=False).reset_index(drop=True)
-        df['view_rank'] = df['view_count'].rank(ascending=False, method='dense').astype(int)
-        df['days_since_upload'] = (datetime.now(timezone.utc) - df['upload_date']).dt.days
-        df['views_per_day'] = (df['view_count'] / df['days_since_upload'].replace(0, 1)).round(2)
+        # Step 5: Derived columns
+        df = add_derived_columns(df.drop(columns=['stats_refreshed_at']))
         
         # CRITICAL: Add validation
         fetched_views = df['view_count'].sum()
@@ -326,6 +870,412 @@ class YouTubeChannelAnalyser:
         print(f"   Views from Fetched Videos: {fetched_views:,}")
         print(f"   Total Channel Views (API): {channel_stats['total_views']:,}")
         print(f"   Coverage: {(fetched_views / channel_stats['total_views'] * 100):.1f}%")
+        print(f"   Quota Used: {self.quota_units_used - units_at_start} units")
+        print(f"   Client: {self.client_report(pool_at_start)}")
+        if self.cache:
+            cache_stats = self.cache.stats()
+            print(f"   Cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated, "
+                  f"{cache_stats['misses']} misses ({cache_stats['hit_rate']:.0f}% served from cache)")
         print("=" * 60)
         
         return channel_stats, df
+
+
+    def _fetch_all_videos(self, channel_stats, limit, published_after=None, published_before=None):
+        """Full fetch: every upload (inside the window, if any), streamed in typed chunks"""
+        print(f"\n📥 Fetching {'all' if limit is None else f'up to {limit}'} most recent videos...")
+        
+        if self.async_backend:
+            df = run_sync(self._async_channel_uploads(channel_stats, limit, published_after, published_before))
+            if df.empty:
+                raise ValueError("No videos found")
+            
+            print(f"✅ Processed {len(df)} public videos\n")
+            return df
+        
+        chunks = []
+        processed = 0
+        
+        for chunk in self.iter_video_frames(channel_stats['uploads_playlist_id'], limit,
+                                            published_after, published_before):
+            chunks.append(chunk)
+            processed += len(chunk)
+            print(f"  ✓ {processed} public videos processed")
+        
+        if not chunks:
+            raise ValueError("No videos found")
+        
+        print(f"✅ Processed {processed} public videos\n")
+        
+        return pd.concat(chunks, ignore_index=True)
+
+
+    def _refresh_snapshot(self, snapshot, channel_stats, limit):
+        """Incremental fetch: new uploads plus statistics that are due"""
+        now = datetime.now(timezone.utc)
+        print(f"\n♻️ Incremental refresh against snapshot of {len(snapshot)} videos...")
+        
+        # New uploads sit in front of the newest known video
+        new_ids = self.get_video_ids_from_playlist(
+            channel_stats['uploads_playlist_id'],
+            max_results=limit,
+            stop_at_ids=set(snapshot['video_id'])
+        )
+        new_videos = self.get_video_frame(new_ids) if new_ids else None
+        print(f"✅ {0 if new_videos is None else len(new_videos)} new public videos")
+        
+        # Refresh statistics on the age-based schedule
+        due = stats_refresh_due(snapshot, now)
+        due_ids = snapshot.loc[due, 'video_id'].tolist()
+        
+        if due_ids:
+            fresh = self.get_video_statistics(due_ids)
+            
+            # Videos missing from the response were deleted or made private
+            gone = [vid for vid in due_ids if vid not in fresh]
+            snapshot = snapshot[~snapshot['video_id'].isin(gone)].copy()
+            
+            updated = snapshot['video_id'].isin(fresh.keys())
+            for column in ('view_count', 'like_count', 'comment_count'):
+                snapshot.loc[updated, column] = snapshot.loc[updated, 'video_id'].map(
+                    lambda vid: fresh[vid][column]
+                ).astype('int64')
+            
+            views = snapshot.loc[updated, 'view_count']
+            engagement = (
+                (snapshot.loc[updated, 'like_count'] + snapshot.loc[updated, 'comment_count'])
+                / views.where(views > 0) * 100
+            ).fillna(0.0).round(4)
+            snapshot.loc[updated, 'engagement_rate'] = engagement
+            snapshot.loc[updated, 'stats_refreshed_at'] = now
+        
+        print(f"✅ Refreshed statistics for {len(due_ids)} of {len(snapshot)} known videos\n")
+        
+        if new_videos is not None and not new_videos.empty:
+            snapshot = pd.concat([new_videos, snapshot], ignore_index=True)
+        
+        return snapshot.drop_duplicates('video_id', keep='first')
+
+
+    def resolve_channel_ids(self, identifiers, quota_budget=None):
+        """
+        Resolve many channel identifiers, concurrently for those not yet indexed.
+        
+        Args:
+            identifiers (list): Channel IDs, handles or URLs
+            quota_budget (int): Units this resolution may spend; an identifier that
+                needs the API is only looked up while RESOLVE_QUOTA_RESERVE units
+                are still free (counting lookups already in flight)
+        
+        Returns:
+            tuple: ({identifier: channel_id} in input order, [identifiers that failed])
+        """
+        identifiers = list(dict.fromkeys(i.strip() for i in identifiers if i.strip()))
+        units_at_start = self.quota_units_used
+        budget_lock = threading.Lock()
+        in_flight = [0]
+        
+        def reserve(identifier):
+            if quota_budget is None or is_channel_id(identifier) or self.channel_index.lookup(identifier):
+                return 0
+            with budget_lock:
+                spent = self.quota_units_used - units_at_start
+                if spent + in_flight[0] + RESOLVE_QUOTA_RESERVE > quota_budget:
+                    return None
+                in_flight[0] += RESOLVE_QUOTA_RESERVE
+                return RESOLVE_QUOTA_RESERVE
+        
+        def resolve(identifier):
+            reserved = reserve(identifier)
+            if reserved is None:
+                print(f"⚠️ Quota budget exhausted, not resolving: {identifier}")
+                return None
+            try:
+                return self.extract_channel_id(identifier)
+            except ValueError as e:
+                print(f"⚠️ {str(e)}")
+                return None
+            finally:
+                with budget_lock:
+                    in_flight[0] -= reserved or 0
+        
+        workers = max(1, min(self.max_workers, len(identifiers)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            channel_ids = list(executor.map(resolve, identifiers))
+        
+        resolved = {i: cid for i, cid in zip(identifiers, channel_ids) if cid}
+        failed = [i for i, cid in zip(identifiers, channel_ids) if not cid]
+        
+        return resolved, failed
+
+
+    def get_bulk_channel_data(self, channel_identifiers, max_videos=None, quota_budget=None,
+                              published_after=None, published_before=None):
+        """
+        Analyze many channels in one run.
+        
+        Channel lookups are batched 50 per channels.list call and every
+        channel's uploads are fetched on one shared worker pool (and its
+        per-thread connections) under a single quota budget.
+        
+        Args:
+            channel_identifiers (list): Channel IDs, handles or URLs
+            max_videos (int): Most recent uploads per channel (None = all)
+            quota_budget (int): Remaining quota units for the whole run, identifier
+                resolution included
+            published_after (datetime): Only analyze uploads published at/after this (UTC)
+            published_before (datetime): Only analyze uploads published at/before this (UTC)
+        
+        Returns:
+            tuple: (channels DataFrame indexed by channel_id, videos DataFrame with a
+                channel_id column, [identifiers that could not be resolved])
+        """
+        print(f"\n🔍 Bulk analysis: {len(channel_identifiers)} channels")
+        print("=" * 60)
+        units_at_start = self.quota_units_used
+        pool_at_start = self.http_pool.stats()
+        
+        # Step 1: Resolve identifiers (index first, API only for unknown ones, within budget)
+        resolved, failed = self.resolve_channel_ids(channel_identifiers, quota_budget)
+        channel_ids = list(dict.fromkeys(resolved.values()))
+        print(f"✅ Resolved {len(channel_ids)} channels ({len(failed)} failed)")
+        
+        if not channel_ids:
+            raise ValueError("None of the channel identifiers could be resolved within the quota budget"
+                             if quota_budget is not None and failed else
+                             "None of the channel identifiers could be resolved")
+        
+        # Step 2: Channel statistics, 50 per call
+        channel_stats = self.get_channels_statistics(channel_ids)
+        missing = [cid for cid in channel_ids if cid not in channel_stats]
+        if missing:
+            print(f"⚠️ {len(missing)} channels not found: {', '.join(missing[:5])}")
+        
+        for stats in channel_stats.values():
+            if stats['custom_url']:
+                self.channel_index.record(stats['custom_url'], stats['channel_id'])
+        
+        limits = {
+            cid: None if max_videos is None else min(max_videos, stats['total_videos'])
+            for cid, stats in channel_stats.items()
+        }
+        
+        # Step 3: One budget check for the whole run
+        if quota_budget is not None:
+            quota_budget -= self.quota_units_used - units_at_start
+            estimated = sum(
+                self.estimate_quota_cost(stats['total_videos'] if limits[cid] is None else limits[cid])
+                for cid, stats in channel_stats.items()
+            )
+            
+            print(f"💰 Estimated quota cost: {estimated} units ({quota_budget} remaining)")
+            if estimated > quota_budget:
+                raise ValueError(
+                    f"This analysis needs about {estimated} quota units but only {quota_budget} remain today"
+                )
+        
+        # Step 4: Uploads for every channel on the shared pool
+        windowed = published_after is not None or published_before is not None
+        frames = {}
+        
+        if self.async_backend:
+            results = run_sync(self._async_bulk_uploads(channel_stats, limits, published_after, published_before))
+        else:
+            workers = max(1, min(self.max_workers, len(channel_stats)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    cid: executor.submit(self._fetch_channel_uploads, stats, limits[cid],
+                                         published_after, published_before)
+                    for cid, stats in channel_stats.items()
+                }
+                results = {cid: future.exception() or future.result() for cid, future in futures.items()}
+        
+        for done, (cid, df) in enumerate(results.items(), 1):
+            if isinstance(df, Exception):
+                if not isinstance(df, (HttpError, ValueError)):
+                    raise df
+                print(f"⚠️ {channel_stats[cid]['channel_name']}: {str(df)}")
+                continue
+            
+            if not windowed and not df.empty:
+                df.attrs['max_videos'] = limits[cid]
+                self.snapshots.save(cid, df)
+            
+            frames[cid] = df
+            print(f"  ✓ {done}/{len(results)} {channel_stats[cid]['channel_name']}: {len(df)} videos")
+        
+        # Step 5: Combine, keyed by channel_id
+        videos = [
+            add_derived_columns(df.drop(columns=['stats_refreshed_at'])).assign(channel_id=cid)
+            for cid, df in frames.items() if not df.empty
+        ]
+        video_df = pd.concat(videos, ignore_index=True) if videos else pd.DataFrame(columns=['channel_id'])
+        video_df.insert(0, 'channel_id', video_df.pop('channel_id'))
+        
+        channels_df = self._summarize_channels(channel_stats, video_df)
+        
+        print(f"📊 {len(channels_df)} channels, {len(video_df)} videos")
+        print(f"   Quota Used: {self.quota_units_used - units_at_start} units")
+        print(f"   Client: {self.client_report(pool_at_start)}")
+        print("=" * 60)
+        
+        return channels_df, video_df, failed
+
+
+    def _fetch_channel_uploads(self, channel_stats, limit, published_after=None, published_before=None):
+        """Fetch one channel's uploads on the calling worker thread"""
+        builder = VideoColumnBuilder()
+        
+        for page_ids in self.iter_playlist_pages(channel_stats['uploads_playlist_id'], limit, None,
+                                                 published_after, published_before):
+            items = self._fetch_video_batch(page_ids)
+            if items:
+                builder.add_items(items)
+        
+        return self._finish_uploads_frame(builder, limit)
+
+
+    @staticmethod
+    def _finish_uploads_frame(builder, limit):
+        """Type, order and cap one channel's collected uploads"""
+        df = builder.to_frame().sort_values('upload_date', ascending=False)
+        if limit is not None:
+            df = df.head(limit)
+        df = df.reset_index(drop=True)
+        df['stats_refreshed_at'] = datetime.now(timezone.utc)
+        
+        return df
+
+
+    @staticmethod
+    def _summarize_channels(channel_stats, video_df):
+        """Build the per-channel comparison table"""
+        channels = pd.DataFrame(list(channel_stats.values())).set_index('channel_id')
+        channels = channels.drop(columns=['description', 'uploads_playlist_id'])
+        
+        if video_df.empty:
+            video_df = pd.DataFrame(columns=['channel_id', 'view_count', 'engagement_rate', 'duration_seconds',
+                                             'views_per_day', 'upload_date'])
+        
+        grouped = video_df.groupby('channel_id')
+        summary = pd.DataFrame({
+            'videos_analyzed': grouped.size(),
+            'avg_views': grouped['view_count'].mean().round(0),
+            'median_views': grouped['view_count'].median(),
+            'avg_engagement_rate': grouped['engagement_rate'].mean().round(4),
+            'avg_duration_seconds': grouped['duration_seconds'].mean().round(0),
+            'avg_views_per_day': grouped['views_per_day'].mean().round(2),
+            'latest_upload': grouped['upload_date'].max(),
+        })
+        
+        channels = channels.join(summary)
+        channels['videos_analyzed'] = channels['videos_analyzed'].fillna(0).astype('int64')
+        
+        return channels.sort_values('total_subscribers', ascending=False)
+
+
+    # ==================== ASYNC BACKEND ====================
+    # Same outputs as the thread-pool paths above; every request of a run
+    # shares one aiohttp session, so many pages and batches are in flight at once.
+
+    async def _async_playlist_pages(self, client, playlist_id, max_results=None, stop_at_ids=None,
+                                    published_after=None, published_before=None):
+        """Async twin of iter_playlist_pages"""
+        returned = 0
+        next_page_token = None
+        windowed = published_after is not None or published_before is not None
+        
+        while max_results is None or returned < max_results:
+            try:
+                remaining = 50 if max_results is None else max_results - returned
+                response = await client.list(
+                    'playlistItems.list',
+                    part='contentDetails',
+                    playlistId=playlist_id,
+                    maxResults=50 if windowed else min(50, remaining),
+                    pageToken=next_page_token,
+                    fields=PLAYLIST_FIELDS
+                )
+            except HttpError as e:
+                print(f"⚠️ Error fetching playlist: {str(e)}")
+                return
+            
+            page_ids, reached_known, page_before_window = self._filter_playlist_page(
+                response.get('items', []), stop_at_ids, published_after, published_before
+            )
+            
+            if max_results is not None:
+                page_ids = page_ids[:max_results - returned]
+            if page_ids:
+                returned += len(page_ids)
+                yield page_ids
+            
+            if reached_known or (windowed and page_before_window):
+                return
+            
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                return
+
+
+    async def _async_video_batch(self, client, batch, statistics_only=False):
+        """Async twin of _fetch_video_batch (None on API error)"""
+        try:
+            if statistics_only:
+                response = await client.list('videos.list', cached=False, part='statistics',
+                                             id=','.join(batch), fields=VIDEO_STATISTICS_FIELDS)
+            else:
+                response = await client.list('videos.list', part='snippet,statistics,contentDetails,status',
+                                             id=','.join(batch), fields=VIDEO_FIELDS)
+        except HttpError as e:
+            print(f"⚠️ Error fetching batch starting at {batch[0]}: {str(e)}")
+            return None
+        
+        return response.get('items', [])
+
+
+    async def _async_fetch_video_batches(self, batches, statistics_only=False):
+        """Fetch every batch at once; results come back in batch order"""
+        async with self._async_client() as client:
+            return await asyncio.gather(*(
+                self._async_video_batch(client, batch, statistics_only) for batch in batches
+            ))
+
+
+    async def _async_uploads_frame(self, client, channel_stats, limit, published_after=None, published_before=None):
+        """Walk one uploads playlist; each page's detail batch starts as soon as the page arrives"""
+        tasks = []
+        
+        async for page_ids in self._async_playlist_pages(client, channel_stats['uploads_playlist_id'], limit,
+                                                         None, published_after, published_before):
+            tasks.append(asyncio.create_task(self._async_video_batch(client, page_ids)))
+        
+        builder = VideoColumnBuilder()
+        for items in await asyncio.gather(*tasks):
+            if items:
+                builder.add_items(items)
+        
+        return self._finish_uploads_frame(builder, limit)
+
+
+    async def _async_channel_uploads(self, channel_stats, limit, published_after=None, published_before=None):
+        """Async twin of the streamed full fetch for one channel"""
+        async with self._async_client() as client:
+            return await self._async_uploads_frame(client, channel_stats, limit, published_after, published_before)
+
+
+    async def _async_bulk_uploads(self, channel_stats, limits, published_after=None, published_before=None):
+        """
+        Walk every channel's uploads playlist concurrently on one session.
+        
+        Returns:
+            dict: channel_id -> DataFrame, or the exception that channel raised
+        """
+        async with self._async_client() as client:
+            results = await asyncio.gather(*(
+                self._async_uploads_frame(client, stats, limits[cid], published_after, published_before)
+                for cid, stats in channel_stats.items()
+            ), return_exceptions=True)
+        
+        return dict(zip(channel_stats.keys(), results))
+
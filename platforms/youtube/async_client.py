@@ -0,0 +1,143 @@
+# platforms/youtube/async_client.py
+"""
+YouTube Async API Client.
+asyncio backend for the Data API: one pooled aiohttp session per run,
+sharing the response cache, quota metering and pacer of the sync client.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+import httplib2
+from googleapiclient.errors import HttpError
+from core.rate_limiter import backoff_delay
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+API_URL = "https://www.googleapis.com/youtube/v3/"
+
+
+class AsyncYouTubeClient:
+    """Async Data API list calls over a single pooled aiohttp session"""
+
+    def __init__(self, api_key, retry_policy, cache=None, pacer=None, on_call=None, max_retries=5,
+                 max_connections=16, api_url=API_URL):
+        """
+        Args:
+            api_key (str): YouTube Data API key
+            retry_policy (callable): Callable(HttpError) -> (retryable, retry_after_seconds)
+            cache (ResponseCache): Shared response cache (None disables caching)
+            pacer (TokenBucketPacer): Shared pacer, reserved before every attempt
+            on_call (callable): Called as on_call(endpoint) after every attempt (quota metering)
+            max_retries (int): Retries before the last error is raised
+            max_connections (int): Connection pool size, i.e. requests in flight at once
+            api_url (str): Base URL of the Data API
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("The async backend requires aiohttp (pip install aiohttp)")
+
+        self.api_key = api_key
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.pacer = pacer
+        self.on_call = on_call
+        self.max_retries = max_retries
+        self.max_connections = max_connections
+        self.api_url = api_url
+        self.session = None
+
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+            timeout=aiohttp.ClientTimeout(total=60)
+        )
+        return self
+
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+
+
+    async def list(self, endpoint, cached=True, **params):
+        """
+        Execute a Data API list call through the response cache.
+
+        Same semantics as YouTubeChannelAnalyser._execute: fresh entries are
+        served locally, stale ones are revalidated with If-None-Match.
+
+        Returns:
+            dict: API response body
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+
+        if self.cache is None or not cached:
+            return await self._send(endpoint, params)
+
+        entry = self.cache.lookup(endpoint, params)
+        if entry and self.cache.is_fresh(endpoint, entry):
+            self.cache.record('hits')
+            return entry['body']
+
+        headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else {}
+
+        try:
+            response = await self._send(endpoint, params, headers)
+        except HttpError as e:
+            if entry and e.resp.status == 304:
+                self.cache.refresh(endpoint, params, entry)
+                self.cache.record('revalidated')
+                return entry['body']
+            raise
+
+        self.cache.store(endpoint, params, response)
+        self.cache.record('misses')
+        return response
+
+
+    async def _send(self, endpoint, params, headers=None):
+        """Send one request through the pacer, retrying on API pushback"""
+        resource = endpoint.split('.')[0]
+        url = f"{self.api_url}{resource}?{urlencode({**params, 'key': self.api_key})}"
+
+        for attempt in range(self.max_retries + 1):
+            if self.pacer:
+                await asyncio.sleep(self.pacer.reserve())
+
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    content = await response.read()
+                    if response.status == 200:
+                        return await response.json(content_type=None)
+
+                    # Same error type as googleapiclient, so retry policies and callers are shared
+                    resp = httplib2.Response({**dict(response.headers), 'status': response.status})
+                    error = HttpError(resp, content, uri=url.replace(self.api_key, '***'))
+            finally:
+                if self.on_call:
+                    self.on_call(endpoint)
+
+            retryable, retry_after = self.retry_policy(error)
+            if attempt == self.max_retries or not retryable:
+                raise error
+
+            delay = backoff_delay(attempt, retry_after=retry_after)
+            print(f"⏳ YouTube API pushed back (HTTP {error.resp.status}), retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+
+def run_sync(coro):
+    """Run a coroutine to completion from synchronous code (even inside a running loop)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Already inside an event loop (e.g. a notebook): run on a helper thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,165 @@
+# platforms/youtube/channel_index.py
+"""
+YouTube Channel Identifier Index.
+Maps handles, custom URLs, legacy usernames and channel URLs to canonical UC... IDs.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+
+
+CHANNEL_ID_PATTERN = re.compile(r'^UC[\w-]{22}$')
+
+URL_PATTERNS = [
+    (re.compile(r'youtube\.com/channel/([^/?&#]+)', re.IGNORECASE), 'channel'),
+    (re.compile(r'youtube\.com/c/([^/?&#]+)', re.IGNORECASE), 'c'),
+    (re.compile(r'youtube\.com/user/([^/?&#]+)', re.IGNORECASE), 'user'),
+    (re.compile(r'youtube\.com/@([^/?&#]+)', re.IGNORECASE), '@'),
+    (re.compile(r'youtube\.com/([^/?&#]+)', re.IGNORECASE), 'c'),
+]
+
+
+def is_channel_id(value):
+    """Check whether a string is a canonical channel ID."""
+    return bool(CHANNEL_ID_PATTERN.match(value))
+
+
+def index_keys(identifier):
+    """
+    Get the normalized index keys for a channel identifier.
+
+    Handles and custom URLs are case-insensitive on YouTube, so keys are
+    lowercased. A URL produces both its raw form and its handle/path key,
+    so "youtube.com/@name/videos" and "@Name" share an entry.
+
+    Args:
+        identifier (str): Channel handle, URL, username or search text
+
+    Returns:
+        list: Index keys, most specific first
+    """
+    raw = identifier.strip()
+    if not raw:
+        return []
+
+    normalized = re.sub(r'^(https?://)?(www\.|m\.)?', '', raw, flags=re.IGNORECASE).rstrip('/').lower()
+    keys = [normalized]
+
+    for pattern, kind in URL_PATTERNS:
+        match = pattern.search(raw)
+        if match:
+            name = match.group(1).lower()
+            keys.append(f"@{name}" if kind == '@' else f"{kind}/{name}")
+            break
+
+    return list(dict.fromkeys(keys))
+
+
+class ChannelIndex:
+    """Persistent identifier -> channel ID index"""
+
+    def __init__(self, index_file=".cache/youtube/channel_index.json"):
+        self.index_file = index_file
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def lookup(self, identifier):
+        """
+        Resolve an identifier without any network call.
+
+        Returns:
+            str or None: Channel ID if known
+        """
+        for key in index_keys(identifier):
+            channel_id = self._entries.get(key)
+            if channel_id:
+                return channel_id
+        return None
+
+
+    def record(self, identifier, channel_id):
+        """Remember a successful resolution (persists on change)."""
+        self.record_many([(identifier, channel_id)])
+
+
+    def record_many(self, pairs):
+        """
+        Remember several resolutions with a single write.
+
+        Args:
+            pairs: Iterable of (identifier, channel_id)
+        """
+        changed = False
+
+        with self._lock:
+            for identifier, channel_id in pairs:
+                if not identifier or not is_channel_id(channel_id):
+                    continue
+                for key in index_keys(identifier):
+                    if self._entries.get(key) != channel_id:
+                        self._entries[key] = channel_id
+                        changed = True
+
+            if changed:
+                self._save()
+
+
+    def _load(self):
+        """Load the index file."""
+        if not os.path.exists(self.index_file):
+            return {}
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+    def _save(self):
+        """Write the index atomically."""
+        try:
+            directory = os.path.dirname(self.index_file) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.index_file)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not save channel index: {e}")
+
+
+def read_warmup_file(path):
+    """
+    Read a channel index warm-up file.
+
+    Each non-empty line is either "identifier" or "identifier,UC...";
+    lines starting with '#' are comments.
+
+    Returns:
+        tuple: (known pairs [(identifier, channel_id)], identifiers to resolve)
+    """
+    known = []
+    unresolved = []
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            identifier, _, channel_id = line.rpartition(',')
+            if identifier and is_channel_id(channel_id.strip()):
+                known.append((identifier.strip(), channel_id.strip()))
+            else:
+                unresolved.append(line)
+
+    return known, unresolved
@@ -0,0 +1,132 @@
+# platforms/youtube/client_factory.py
+"""
+YouTube Client Factory.
+Shares discovery services and HTTP connections across analyses and sessions.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+
+
+class HttpPool:
+    """
+    Pool of httplib2 connections.
+
+    httplib2.Http is not thread-safe, so each connection is lent to one
+    thread at a time; returned connections keep their TLS sessions alive
+    for the next caller, whichever analysis or session it belongs to.
+    """
+
+    def __init__(self, max_idle=32, http_factory=build_http):
+        """
+        Args:
+            max_idle (int): Idle connections kept for reuse
+            http_factory (callable): Creates a new connection (swap in a
+                recording/replay transport for offline benchmarks)
+        """
+        self.http_factory = http_factory
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+
+    def reset(self, http_factory=None):
+        """Drop idle connections, optionally switching the connection factory."""
+        if http_factory:
+            self.http_factory = http_factory
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                return
+
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of one request."""
+        try:
+            http = self._idle.get_nowait()
+            with self._lock:
+                self.reused += 1
+        except queue.Empty:
+            http = self.http_factory()
+            with self._lock:
+                self.created += 1
+
+        try:
+            yield http
+        finally:
+            try:
+                self._idle.put_nowait(http)
+            except queue.Full:
+                pass
+
+
+    def stats(self):
+        """Connections opened vs. borrowed warm from the pool."""
+        with self._lock:
+            return {"created": self.created, "reused": self.reused}
+
+
+class ServiceFactory:
+    """Build each discovery service once per (API key, request class, quota meter, endpoint)"""
+
+    def __init__(self):
+        self._services = {}
+        self._lock = threading.Lock()
+        self.http_pool = HttpPool()
+
+
+    def get_service(self, api_key, request_class=None, quota_meter=None, api_endpoint=None):
+        """
+        Get the shared YouTube Data API service.
+
+        Args:
+            api_key (str): YouTube Data API key
+            request_class (type): HttpRequest subclass used for every call
+            quota_meter (callable): Set as request.quota_meter on every request;
+                must be a stable, process-wide callable (it is part of the cache key)
+            api_endpoint (str): Root URL override, e.g. a local fake API server
+
+        Returns:
+            tuple: (service, build_seconds, reused) - build_seconds is what the
+                first build cost, i.e. the time a reuse saves
+        """
+        key = (api_key, request_class, quota_meter, api_endpoint)
+
+        with self._lock:
+            if key in self._services:
+                service, build_seconds = self._services[key]
+                return service, build_seconds, True
+
+            kwargs = {}
+            if api_endpoint:
+                kwargs["client_options"] = {"api_endpoint": api_endpoint}
+            if request_class:
+                def request_builder(*args, **request_kwargs):
+                    request = request_class(*args, **request_kwargs)
+                    request.quota_meter = quota_meter
+                    return request
+                kwargs["requestBuilder"] = request_builder
+
+            start = time.perf_counter()
+            service = build('youtube', 'v3', developerKey=api_key, **kwargs)
+            build_seconds = time.perf_counter() - start
+
+            self._services[key] = (service, build_seconds)
+            return service, build_seconds, False
+
+
+    def clear(self):
+        """Forget every cached service (e.g. after an API key rotation)."""
+        with self._lock:
+            self._services.clear()
+
+
+# Process-wide factory, shared by every Streamlit session
+client_factory = ServiceFactory()
@@ -0,0 +1,147 @@
+# platforms/youtube/columnar.py
+"""
+YouTube Columnar Video Builder.
+Turns videos.list items into typed DataFrames with vectorized parsing.
+"""
+
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+
+
+# ISO-8601 durations as returned by the API, e.g. "PT1H2M3S", "P1DT5M", "P0D"
+DURATION_PATTERN = (
+    r'^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?'
+    r'(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$'
+)
+DURATION_UNITS = {'weeks': 604800, 'days': 86400, 'hours': 3600, 'minutes': 60, 'seconds': 1}
+
+DESCRIPTION_LIMIT = 500
+
+
+def parse_iso8601_durations(values):
+    """
+    Parse many ISO-8601 durations in one pass.
+
+    Args:
+        values: Sequence of duration strings (None/invalid -> 0)
+
+    Returns:
+        np.ndarray: Whole seconds as int64
+    """
+    parts = pd.Series(values, dtype='object').str.extract(DURATION_PATTERN)
+    seconds = np.zeros(len(parts), dtype='float64')
+
+    for unit, factor in DURATION_UNITS.items():
+        seconds += pd.to_numeric(parts[unit], errors='coerce').fillna(0).to_numpy() * factor
+
+    return seconds.astype('int64')
+
+
+class VideoColumnBuilder:
+    """Collect raw videos.list fields column by column, then type them in bulk"""
+
+    def __init__(self):
+        self.video_id = []
+        self.title = []
+        self.published_at = []
+        self.view_count = []
+        self.like_count = []
+        self.comment_count = []
+        self.duration = []
+        self.tags = []
+        self.category_id = []
+        self.description = []
+
+
+    def __len__(self):
+        return len(self.video_id)
+
+
+    def add_items(self, items):
+        """Append videos.list items (non-public videos are skipped)."""
+        for item in items:
+            if item['status']['privacyStatus'] != 'public':
+                continue
+
+            snippet = item['snippet']
+            stats = item.get('statistics', {})
+
+            self.video_id.append(item['id'])
+            self.title.append(snippet['title'])
+            self.published_at.append(snippet.get('publishedAt'))
+            self.view_count.append(stats.get('viewCount'))
+            self.like_count.append(stats.get('likeCount'))
+            self.comment_count.append(stats.get('commentCount'))
+            self.duration.append(item['contentDetails'].get('duration'))
+            self.tags.append(snippet.get('tags', []))
+            self.category_id.append(snippet.get('categoryId', ''))
+            self.description.append(snippet.get('description', '')[:DESCRIPTION_LIMIT])
+
+
+    def to_frame(self):
+        """
+        Build the typed video DataFrame.
+
+        Returns:
+            pd.DataFrame: Same columns and dtypes as the per-video parser produced
+        """
+        upload_date = pd.to_datetime(pd.Series(self.published_at, dtype='object'), utc=True, errors='coerce')
+        upload_date = upload_date.fillna(pd.Timestamp(datetime.now(timezone.utc)))
+
+        view_count = _to_int64(self.view_count)
+        like_count = _to_int64(self.like_count)
+        comment_count = _to_int64(self.comment_count)
+
+        engagement_rate = np.divide(
+            (like_count + comment_count) * 100.0, view_count,
+            out=np.zeros(len(view_count), dtype='float64'), where=view_count > 0
+        ).round(4)
+
+        return pd.DataFrame({
+            'video_id': self.video_id,
+            'title': self.title,
+            'upload_date': upload_date,
+            'view_count': view_count,
+            'like_count': like_count,
+            'comment_count': comment_count,
+            'engagement_rate': engagement_rate,
+            'duration_seconds': parse_iso8601_durations(self.duration),
+            'tags': self.tags,
+            'category_id': self.category_id,
+            'publish_day': upload_date.dt.day_name(),
+            'publish_hour': upload_date.dt.hour.astype('int64'),
+            'description': self.description,
+        })
+
+
+def build_video_frame(items):
+    """Convert videos.list items straight into a typed DataFrame."""
+    builder = VideoColumnBuilder()
+    builder.add_items(items)
+    return builder.to_frame()
+
+
+def add_derived_columns(df, now=None):
+    """
+    Add ranking and age-based columns in bulk.
+
+    Args:
+        df: Video DataFrame with view_count and upload_date
+        now: Reference UTC datetime (defaults to the current time)
+
+    Returns:
+        pd.DataFrame: df with view_rank, days_since_upload, views_per_day
+    """
+    now = now or datetime.now(timezone.utc)
+
+    df['view_rank'] = df['view_count'].rank(ascending=False, method='dense').astype(int)
+    df['days_since_upload'] = (now - df['upload_date']).dt.days
+    df['views_per_day'] = (df['view_count'] / df['days_since_upload'].replace(0, 1)).round(2)
+
+    return df
+
+
+def _to_int64(values):
+    """Convert API count strings (possibly missing) to an int64 array."""
+    return pd.to_numeric(pd.Series(values, dtype='object'), errors='coerce').fillna(0).to_numpy(dtype='int64')
@@ -5,7 +5,14 @@ Coordinates all YouTube view components and handles the main dashboard flow.
 """
 
 import streamlit as st
-from tabs import render_top_videos_tab, render_upload_schedule_tab, render_insights_tab, render_predictions_tab
+from ui.components import section
+from tabs import (
+    render_top_videos_tab,
+    render_upload_schedule_tab,
+    render_insights_tab,
+    render_predictions_tab,
+    render_comment_sentiment_tab
+)
 from .data_processor import apply_filters, calculate_stats
 from .views import (
     render_header,
@@ -13,7 +20,8 @@ from .views import (
     render_kpi_cards,
     render_performance_chart,
     render_engagement_breakdown,
-    render_data_table_tab
+    render_data_table_tab,
+    render_bulk_comparison
 )
 
 
@@ -62,8 +70,12 @@ def render_dashboard():
 
     st.markdown("")
 
-    # Tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Top Videos", "Upload Schedule", "Insights", "Predictions", "Data Table"])
+    # Tabs (Comments only when comments were fetched)
+    sentiment_df = st.session_state.get("comment_sentiment")
+    tab_names = ["Top Videos", "Upload Schedule", "Insights", "Predictions", "Data Table"]
+    if sentiment_df is not None:
+        tab_names.append("Comments")
+    tab1, tab2, tab3, tab4, tab5, *comments_tab = st.tabs(tab_names)
 
     with tab1:
         render_top_videos_tab(df)
@@ -79,3 +91,36 @@ def render_dashboard():
 
     with tab5:
         render_data_table_tab(df, stats)
+
+    for tab in comments_tab:
+        with tab:
+            render_comment_sentiment_tab(
+                df_original,
+                sentiment_df,
+                st.session_state.get("comment_summary"),
+                st.session_state.get("comment_video_summaries"),
+                st.session_state.get("comment_terms")
+            )
+
+
+def render_bulk_dashboard():
+    """
+    Render the multi-channel comparison dashboard.
+    
+    Requires session state to contain:
+        - bulk_channels: Per-channel summary DataFrame indexed by channel_id
+        - bulk_videos: Combined video DataFrame with a channel_id column
+    """
+    channels_df = st.session_state.bulk_channels
+    video_df = st.session_state.bulk_videos
+
+    section(
+        "YouTube Channel Comparison",
+        f"Bulk analysis of {len(channels_df)} channels",
+    )
+
+    failed = st.session_state.get("bulk_failed") or []
+    if failed:
+        st.warning(f"⚠️ Could not resolve {len(failed)} identifiers: {', '.join(failed[:10])}")
+
+    render_bulk_comparison(channels_df, video_df)
@@ -0,0 +1,151 @@
+# platforms/youtube/response_cache.py
+"""
+YouTube API Response Cache.
+Stores Data API list responses on disk with per-endpoint TTLs and ETag revalidation.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+class ResponseCache:
+    """
+    Disk-backed cache for YouTube Data API responses.
+
+    Entries are keyed on endpoint + request parameters. A fresh entry is served
+    without touching the network; a stale entry that carries an ETag is
+    revalidated with If-None-Match so an unchanged resource costs no payload.
+    """
+
+    # Seconds an entry is served without revalidation
+    DEFAULT_TTLS = {
+        'channels.list': 15 * 60,               # Subscriber/view counts move quickly
+        'playlistItems.list': 30 * 60,          # New uploads
+        'videos.list': 24 * 60 * 60,            # Video metadata
+        'search.list': 7 * 24 * 60 * 60,        # Channel lookups
+        'commentThreads.list': 6 * 60 * 60,
+    }
+    FALLBACK_TTL = 60 * 60
+
+    def __init__(self, cache_dir=".cache/youtube", ttls=None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory where responses are stored
+            ttls (dict): Optional per-endpoint TTL overrides in seconds
+        """
+        self.cache_dir = cache_dir
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+
+
+    @staticmethod
+    def make_key(endpoint, params):
+        """Build a stable cache key from endpoint and parameters."""
+        clean_params = {k: v for k, v in params.items() if v is not None}
+        raw = json.dumps({'endpoint': endpoint, 'params': clean_params}, sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+    def lookup(self, endpoint, params):
+        """
+        Load a cached entry.
+
+        Returns:
+            dict or None: {"stored_at": float, "etag": str, "body": dict}
+        """
+        path = self._path(endpoint, params)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+    def is_fresh(self, endpoint, entry):
+        """Check whether an entry is still inside its endpoint TTL."""
+        ttl = self.ttls.get(endpoint, self.FALLBACK_TTL)
+        return (time.time() - entry.get('stored_at', 0)) < ttl
+
+
+    def store(self, endpoint, params, body):
+        """Persist a response body together with its ETag."""
+        entry = {
+            'stored_at': time.time(),
+            'etag': body.get('etag'),
+            'body': body,
+        }
+        self._write(self._path(endpoint, params), entry)
+        return entry
+
+
+    def refresh(self, endpoint, params, entry):
+        """Restart the TTL of an entry after a 304 Not Modified."""
+        entry['stored_at'] = time.time()
+        self._write(self._path(endpoint, params), entry)
+
+
+    def record(self, outcome):
+        """Count a lookup outcome: 'hits', 'misses' or 'revalidated'."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+
+    def stats(self):
+        """
+        Get cache counters for display.
+
+        Returns:
+            dict: {"hits": int, "misses": int, "revalidated": int, "hit_rate": float}
+        """
+        with self._lock:
+            served = self.hits + self.revalidated
+            total = served + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidated': self.revalidated,
+                'hit_rate': (served / total * 100) if total > 0 else 0.0,
+            }
+
+
+    def clear(self):
+        """Delete every cached response."""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.json'):
+                    os.remove(os.path.join(root, name))
+
+
+    def _path(self, endpoint, params):
+        """Get the file path for an endpoint + params combination."""
+        return os.path.join(self.cache_dir, endpoint, f"{self.make_key(endpoint, params)}.json")
+
+
+    def _write(self, path, entry):
+        """Write an entry atomically so concurrent readers never see partial files."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not write cache entry: {e}")
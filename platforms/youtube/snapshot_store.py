@@ -0,0 +1,99 @@
+# platforms/youtube/snapshot_store.py
+"""
+YouTube Channel Snapshot Store.
+Keeps the last fetched video table per channel for incremental refreshes.
+"""
+
+import os
+from datetime import timedelta
+import pandas as pd
+
+
+# (max video age, how often its statistics are refreshed)
+STATS_REFRESH_SCHEDULE = [
+    (timedelta(days=2), timedelta(hours=1)),
+    (timedelta(days=7), timedelta(hours=6)),
+    (timedelta(days=30), timedelta(days=1)),
+    (timedelta(days=365), timedelta(days=7)),
+]
+OLD_VIDEO_REFRESH_INTERVAL = timedelta(days=30)
+
+
+class ChannelSnapshotStore:
+    """Persist one video DataFrame snapshot per channel"""
+
+    def __init__(self, snapshot_dir=".cache/youtube/snapshots"):
+        self.snapshot_dir = snapshot_dir
+
+
+    def load(self, channel_id):
+        """
+        Load the last snapshot for a channel.
+
+        Returns:
+            pd.DataFrame or None: Snapshot with a 'stats_refreshed_at' column
+        """
+        path = self._path(channel_id)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not load snapshot for {channel_id}: {e}")
+            return None
+
+
+    def save(self, channel_id, df):
+        """Write a channel snapshot atomically."""
+        path = self._path(channel_id)
+        tmp_path = f"{path}.tmp"
+
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not save snapshot for {channel_id}: {e}")
+
+
+    def _path(self, channel_id):
+        """Get the snapshot file path for a channel."""
+        return os.path.join(self.snapshot_dir, f"{channel_id}.pkl")
+
+
+def snapshot_covers(snapshot, max_videos):
+    """
+    Check whether a snapshot was taken with a large enough video limit.
+
+    Snapshots record the max_videos they were fetched with in df.attrs
+    (None = every upload); older snapshots were capped at 500.
+    """
+    covered = snapshot.attrs.get('max_videos', 500)
+    if covered is None:
+        return True
+    return max_videos is not None and covered >= max_videos
+
+
+def stats_refresh_due(snapshot, now):
+    """
+    Select videos whose statistics are due for a refresh.
+
+    Young videos gain views quickly and are refreshed often; old videos
+    are refreshed rarely.
+
+    Args:
+        snapshot: Snapshot DataFrame with upload_date and stats_refreshed_at
+        now: Current UTC datetime
+
+    Returns:
+        pd.Series: Boolean mask over snapshot rows
+    """
+    age = now - snapshot['upload_date']
+    since_refresh = now - snapshot['stats_refreshed_at']
+
+    interval = pd.Series(OLD_VIDEO_REFRESH_INTERVAL, index=snapshot.index)
+    for max_age, refresh_every in reversed(STATS_REFRESH_SCHEDULE):
+        interval[age < max_age] = refresh_every
+
+    return since_refresh >= interval
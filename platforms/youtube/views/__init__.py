@@ -10,6 +10,7 @@ from .kpi_cards import render_kpi_cards
 from .performance_chart import render_performance_chart
 from .engagement_cards import render_engagement_breakdown
 from .data_table import render_data_table_tab
+from .bulk_comparison import render_bulk_comparison
 
 __all__ = [
     'render_header',
@@ -18,4 +19,5 @@ __all__ = [
     'render_performance_chart',
     'render_engagement_breakdown',
     'render_data_table_tab',
+    'render_bulk_comparison',
 ]
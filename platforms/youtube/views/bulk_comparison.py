@@ -0,0 +1,99 @@
+# platforms/youtube/views/bulk_comparison.py
+"""
+YouTube Multi-Channel Comparison Component.
+"""
+
+import streamlit as st
+import plotly.graph_objects as go
+from ui.components import chart_card, end_card
+from ui.styles import plotly_layout
+from core.formatters import format_large_number, seconds_to_hms
+
+
+def render_bulk_comparison(channels_df, video_df):
+    """
+    Render the channel comparison table, charts and CSV downloads.
+
+    Args:
+        channels_df: Per-channel summary indexed by channel_id
+        video_df: Combined video data with a channel_id column
+    """
+    # Comparison table
+    cont = chart_card(f"Channel Comparison ({len(channels_df)} channels, {len(video_df):,} videos)")
+    with cont:
+        tbl = channels_df.copy()
+        tbl["Subscribers"] = tbl["total_subscribers"].apply(format_large_number)
+        tbl["Total Views"] = tbl["total_views"].apply(format_large_number)
+        tbl["Avg Views"] = tbl["avg_views"].fillna(0).apply(format_large_number)
+        tbl["Avg Duration"] = tbl["avg_duration_seconds"].fillna(0).apply(seconds_to_hms)
+        tbl["Engagement Rate"] = tbl["avg_engagement_rate"].fillna(0).map(lambda v: f"{v:.2f}%")
+
+        display_tbl = tbl[[
+            "channel_name", "Subscribers", "Total Views", "total_videos",
+            "videos_analyzed", "Avg Views", "Engagement Rate", "Avg Duration"
+        ]].rename(columns={
+            "channel_name": "Channel",
+            "total_videos": "Total Videos",
+            "videos_analyzed": "Analyzed",
+        })
+
+        st.dataframe(display_tbl, use_container_width=True, height=420)
+    end_card()
+
+    if video_df.empty:
+        return
+
+    left, right = st.columns([1, 1])
+    names = channels_df["channel_name"]
+
+    with left:
+        cont = chart_card("Average Views per Video")
+        with cont:
+            top = channels_df.sort_values("avg_views", ascending=False).head(25)
+            fig = go.Figure(go.Bar(
+                x=top["avg_views"],
+                y=top["channel_name"],
+                orientation="h",
+                marker=dict(color="#2563EB"),
+                hovertemplate='%{y}<br>👁️ %{x:,.0f} avg views<extra></extra>',
+            ))
+            fig.update_layout(**plotly_layout(), height=500)
+            fig.update_yaxes(autorange="reversed")
+            st.plotly_chart(fig, use_container_width=True, key="bulk_avg_views")
+        end_card()
+
+    with right:
+        cont = chart_card("Subscribers vs Engagement")
+        with cont:
+            fig = go.Figure(go.Scatter(
+                x=channels_df["total_subscribers"],
+                y=channels_df["avg_engagement_rate"],
+                mode="markers",
+                marker=dict(size=10, color="#3B82F6", opacity=0.8),
+                text=names,
+                hovertemplate='<b>%{text}</b><br>Subscribers: %{x:,}<br>Engagement: %{y:.2f}%<extra></extra>',
+            ))
+            fig.update_layout(**plotly_layout(), height=500)
+            fig.update_xaxes(type="log", title="Subscribers")
+            fig.update_yaxes(title="Avg Engagement Rate (%)")
+            st.plotly_chart(fig, use_container_width=True, key="bulk_engagement")
+        end_card()
+
+    # Downloads
+    d1, d2 = st.columns(2)
+    with d1:
+        st.download_button(
+            "📥 Download Channel Summary (CSV)",
+            channels_df.to_csv().encode("utf-8"),
+            file_name="channel_comparison.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    with d2:
+        st.download_button(
+            "📥 Download All Videos (CSV)",
+            video_df.drop(columns=["tags", "description"]).to_csv(index=False).encode("utf-8"),
+            file_name="channel_videos.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
@@ -3,9 +3,46 @@
 
 from googleapiclient.errors import HttpError
 import pandas as pd
+import numpy as np
+import math
+import queue
 import re
+import threading
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+from core.rate_limiter import get_pacer, call_with_backoff
+from platforms.youtube.api_client import QUOTA_COSTS, youtube_retry_policy
+from platforms.youtube.client_factory import client_factory
+from sentiment_scoring import sentiment_scorer, normalize_text, text_hash, categorize, SCORE_COLUMNS
+
+# Partial-response projection: only the comment fields read below
+COMMENT_FIELDS = (
+    'nextPageToken,items(id,snippet(totalReplyCount,'
+    'topLevelComment/snippet(authorDisplayName,textDisplay,likeCount,publishedAt)))'
+)
+COMMENT_PAGE_SIZE = 100
+
+# Columns of the multi-video comments frame
+COMMENT_COLUMNS = ['video_id', 'comment_id', 'author', 'text', 'like_count', 'published_at', 'reply_count']
+
+# Comments buffered per sentiment_scorer batch by CommentTextStats
+TEXT_STATS_SCORE_BATCH = 5000
+
+# Keyword / emoji extraction
+WORD_PATTERN = re.compile(r'\b[a-z]{3,}\b')
+STOP_WORDS = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all',
+              'can', 'has', 'was', 'one', 'our', 'out', 'this', 'that',
+              'with', 'have', 'from', 'they', 'been', 'will', 'what',
+              'about', 'which', 'when', 'more', 'your', 'like', 'just'}
+EMOJI_PATTERN = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE)
 
 try:
     from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
@@ -18,166 +55,485 @@ except ImportError:
 class SentimentAnalyzer:
     """Analyze sentiment from YouTube comments"""
     
-    def __init__(self, youtube_client):
+    def __init__(self, youtube_client, max_workers=8, store=None):
+        # Pass YouTubeChannelAnalyser.youtube so comment calls are quota-metered
         self.youtube = youtube_client
+        self.pacer = get_pacer("youtube")
+        self.http_pool = client_factory.http_pool
+        self.max_workers = max_workers
+        # Optional CommentSentimentStore: known comments are never rescored
+        self.store = store
         if VADER_AVAILABLE:
             self.analyzer = SentimentIntensityAnalyzer()
         else:
             self.analyzer = None
     
+    @staticmethod
+    def estimate_quota_cost(video_count, max_comments=100):
+        """
+        Predict the quota units a comment harvest will cost.
+        
+        Args:
+            video_count (int): Videos to harvest
+            max_comments (int): Comment budget per video
+        
+        Returns:
+            int: Upper bound in quota units (videos with fewer comments stop early)
+        """
+        return video_count * math.ceil(max_comments / COMMENT_PAGE_SIZE) * QUOTA_COSTS['commentThreads.list']
+    
     def fetch_video_comments(self, video_id, max_comments=100):
         """Fetch comments from a specific video"""
-        comments = []
+        try:
+            return [comment for page in self._comment_pages(video_id, max_comments) for comment in page]
+        
+        except HttpError as e:
+            st.error(f"Could not fetch comments: {e}")
+            return []
+    
+    def fetch_comments_for_videos(self, video_ids, max_comments=100, max_workers=None, on_page=None):
+        """
+        Fetch comments from many videos concurrently.
+        
+        Pages from iter_comment_pages are appended to one set of columns
+        as they arrive.
+        
+        Args:
+            video_ids (list): Videos to harvest, e.g. the top N by views
+            max_comments (int): Comment budget per video
+            max_workers (int): Videos fetched at once (default self.max_workers)
+            on_page (callable): Also called with every page, e.g. CommentTextStats.update
+        
+        Returns:
+            pd.DataFrame: One row per comment (COMMENT_COLUMNS), videos in video_ids order
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        columns = {name: [] for name in COMMENT_COLUMNS}
+        
+        for page in self.iter_comment_pages(video_ids, max_comments, max_workers):
+            for name in COMMENT_COLUMNS:
+                columns[name].extend(comment[name] for comment in page)
+            if on_page:
+                on_page(page)
+        
+        df = pd.DataFrame(columns)
+        df['like_count'] = df['like_count'].astype('int64')
+        df['reply_count'] = df['reply_count'].astype('int64')
+        print(f"  ✓ {len(df)} comments from {df['video_id'].nunique()}/{len(video_ids)} videos")
+        
+        # Arrival order is arbitrary; group rows by the caller's video order
+        order = {video_id: i for i, video_id in enumerate(video_ids)}
+        return df.sort_values('video_id', key=lambda s: s.map(order), kind='stable').reset_index(drop=True)
+    
+    def iter_comment_pages(self, video_ids, max_comments=100, max_workers=None, max_buffered=32):
+        """
+        Yield comment pages from many videos as workers fetch them.
+        
+        Each video walks its own commentThreads pages (at most
+        ceil(max_comments / 100) of them) on a worker thread. Workers share
+        the YouTube pacer and pooled connections, and block once
+        `max_buffered` pages are waiting, so memory stays bounded however
+        many comments are harvested. Closing the generator cancels videos
+        not started yet and stops the others before their next page.
+        
+        Args:
+            video_ids (list): Videos to harvest
+            max_comments (int): Comment budget per video
+            max_workers (int): Videos fetched at once (default self.max_workers)
+            max_buffered (int): Pages held between the workers and the consumer
+        
+        Yields:
+            list: Comment dicts of one page, each with its video_id
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        if not video_ids:
+            return
+        
+        pages = queue.Queue(maxsize=max_buffered)
+        stop = threading.Event()
+        finished = object()
+        
+        def put(item):
+            # Give up once the consumer has stopped reading
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def harvest(video_id):
+            try:
+                for page in self._comment_pages(video_id, max_comments, stop):
+                    for comment in page:
+                        comment['video_id'] = video_id
+                    if not put(page):
+                        return
+            except HttpError as e:
+                # Disabled comments (403) or a removed video: skip it, keep the rest
+                print(f"⚠️ Could not fetch comments for {video_id}: {e}")
+            except Exception as e:
+                put(e)
+            put(finished)
+        
+        workers = max(1, min(max_workers or self.max_workers, len(video_ids)))
+        print(f"💬 Fetching up to {max_comments} comments from {len(video_ids)} videos ({workers} at a time)...")
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        for video_id in video_ids:
+            executor.submit(harvest, video_id)
         
         try:
-            request = self.youtube.commentThreads().list(
+            remaining = len(video_ids)
+            while remaining:
+                item = pages.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Don't wait for in-flight pages: workers see `stop` before their next request
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _comment_pages(self, video_id, max_comments, stop=None):
+        """
+        Yield one list of parsed comments per commentThreads page, within the video's page budget.
+        
+        No further page is requested once the optional `stop` event is set.
+        """
+        page_token = None
+        remaining = max_comments
+        
+        for _ in range(math.ceil(max_comments / COMMENT_PAGE_SIZE)):
+            if stop is not None and stop.is_set():
+                return
+            params = dict(
                 part="snippet",
                 videoId=video_id,
-                maxResults=min(100, max_comments),
+                maxResults=min(COMMENT_PAGE_SIZE, remaining),
                 order="relevance",
-                textFormat="plainText"
+                textFormat="plainText",
+                fields=COMMENT_FIELDS
             )
+            if page_token:
+                params['pageToken'] = page_token
             
-            while request and len(comments) < max_comments:
-                response = request.execute()
-                
-                for item in response.get('items', []):
-                    comment_data = item['snippet']['topLevelComment']['snippet']
-                    comments.append({
-                        'author': comment_data['authorDisplayName'],
-                        'text': comment_data['textDisplay'],
-                        'like_count': comment_data['likeCount'],
-                        'published_at': comment_data['publishedAt'],
-                        'reply_count': item['snippet']['totalReplyCount']
-                    })
-                
-                # Get next page
-                if 'nextPageToken' in response and len(comments) < max_comments:
-                    request = self.youtube.commentThreads().list(
-                        part="snippet",
-                        videoId=video_id,
-                        maxResults=min(100, max_comments - len(comments)),
-                        pageToken=response['nextPageToken'],
-                        order="relevance",
-                        textFormat="plainText"
-                    )
-                else:
-                    request = None
+            response = self._send(self.youtube.commentThreads().list(**params))
             
-            return comments
+            comments = []
+            for item in response.get('items', [])[:remaining]:
+                comment_data = item['snippet']['topLevelComment']['snippet']
+                comments.append({
+                    'comment_id': item['id'],
+                    'author': comment_data['authorDisplayName'],
+                    'text': comment_data['textDisplay'],
+                    'like_count': comment_data['likeCount'],
+                    'published_at': comment_data['publishedAt'],
+                    'reply_count': item['snippet']['totalReplyCount']
+                })
+            yield comments
+            
+            remaining -= len(comments)
+            page_token = response.get('nextPageToken')
+            if not page_token or remaining <= 0:
+                return
+    
+    def _send(self, request):
+        """Execute a request on a pooled connection through the shared pacer"""
+        def attempt():
+            # httplib2 connections are not thread-safe: borrow one per call
+            with self.http_pool.connection() as http:
+                return request.execute(http=http)
         
-        except HttpError as e:
-            st.error(f"Could not fetch comments: {e}")
-            return []
+        return call_with_backoff(attempt, youtube_retry_policy, pacer=self.pacer, label="YouTube API")
     
     def analyze_sentiment(self, text):
         """Analyze sentiment of a single text"""
         if not self.analyzer:
             return {'compound': 0, 'category': 'Neutral'}
         
-        scores = self.analyzer.polarity_scores(text)
-        
-        # Categorize based on compound score
-        if scores['compound'] >= 0.05:
-            category = 'Positive'
-        elif scores['compound'] <= -0.05:
-            category = 'Negative'
-        else:
-            category = 'Neutral'
-        
-        return {
-            'compound': scores['compound'],
-            'positive': scores['pos'],
-            'negative': scores['neg'],
-            'neutral': scores['neu'],
-            'category': category
-        }
+        return sentiment_scorer.score([text]).iloc[0].to_dict()
     
     def analyze_comments(self, comments):
-        """Analyze sentiment for all comments"""
+        """
+        Analyze sentiment for all comments.
+        
+        Texts are scored in bulk by sentiment_scorer (deduplicated, cached,
+        and spread over a process pool for large sets) and the result is
+        assembled column by column. With a store attached, comments already
+        scored are read back instead and only new or edited ones are scored.
+        
+        Args:
+            comments: List of comment dicts, or a comments DataFrame from
+                fetch_comments_for_videos (its video_id and comment_id columns are kept)
+        
+        Returns:
+            pd.DataFrame: One row per comment with sentiment scores and category
+        """
         if not self.analyzer:
             return pd.DataFrame()
         
-        results = []
+        if not isinstance(comments, pd.DataFrame):
+            comments = pd.DataFrame(list(comments))
+        if comments.empty:
+            return pd.DataFrame()
         
-        for comment in comments:
-            sentiment = self.analyze_sentiment(comment['text'])
-            results.append({
-                'author': comment['author'],
-                'text': comment['text'][:100] + '...' if len(comment['text']) > 100 else comment['text'],
-                'full_text': comment['text'],
-                'likes': comment['like_count'],
-                'replies': comment['reply_count'],
-                'sentiment_score': sentiment['compound'],
-                'sentiment_category': sentiment['category'],
-                'positive_score': sentiment['positive'],
-                'negative_score': sentiment['negative'],
-                'neutral_score': sentiment['neutral']
-            })
-        
-        return pd.DataFrame(results)
-    
-    def get_sentiment_summary(self, sentiment_df):
-        """Generate sentiment summary statistics"""
-        if sentiment_df.empty:
-            return {}
+        text = comments['text'].fillna('').astype(str)
+        if self.store is not None and {'video_id', 'comment_id'} <= set(comments.columns):
+            scores = self._score_incremental(comments, text)
+        else:
+            scores = sentiment_scorer.score(text.tolist())
+        
+        results = pd.DataFrame({
+            'author': comments['author'].to_numpy(),
+            'text': text.where(text.str.len() <= 100, text.str[:100] + '...').to_numpy(),
+            'full_text': text.to_numpy(),
+            'likes': comments['like_count'].to_numpy(),
+            'replies': comments['reply_count'].to_numpy(),
+            'sentiment_score': scores['compound'].to_numpy(),
+            'sentiment_category': scores['category'].to_numpy(),
+            'positive_score': scores['positive'].to_numpy(),
+            'negative_score': scores['negative'].to_numpy(),
+            'neutral_score': scores['neutral'].to_numpy()
+        })
+        for name in ('comment_id', 'video_id'):
+            if name in comments:
+                results.insert(0, name, comments[name].to_numpy())
         
-        total = len(sentiment_df)
-        positive = len(sentiment_df[sentiment_df['sentiment_category'] == 'Positive'])
-        negative = len(sentiment_df[sentiment_df['sentiment_category'] == 'Negative'])
-        neutral = len(sentiment_df[sentiment_df['sentiment_category'] == 'Neutral'])
-        
-        return {
-            'total_comments': total,
-            'positive_count': positive,
-            'negative_count': negative,
-            'neutral_count': neutral,
-            'positive_percentage': (positive / total) * 100,
-            'negative_percentage': (negative / total) * 100,
-            'neutral_percentage': (neutral / total) * 100,
-            'average_sentiment': sentiment_df['sentiment_score'].mean(),
-            'most_positive': sentiment_df.nlargest(1, 'sentiment_score')['full_text'].values[0] if not sentiment_df.empty else "",
-            'most_negative': sentiment_df.nsmallest(1, 'sentiment_score')['full_text'].values[0] if not sentiment_df.empty else ""
-        }
+        return results
     
-    def extract_keywords(self, comments, top_n=20):
-        """Extract most common keywords from comments"""
-        # Combine all comment texts
-        all_text = ' '.join([c['text'].lower() for c in comments])
+    def _score_incremental(self, comments, text):
+        """Scores from the store for known comments; new or edited ones are scored and recorded."""
+        hashes = [text_hash(normalize_text(t)) for t in text]
+        comment_ids = comments['comment_id'].tolist()
+        known = self.store.lookup(comment_ids)
         
-        # Remove special characters and split into words
-        words = re.findall(r'\b[a-z]{3,}\b', all_text)
+        matrix = np.zeros((len(comment_ids), 4))
+        fresh = []
+        for i, (comment_id, hashed) in enumerate(zip(comment_ids, hashes)):
+            stored = known.get(comment_id)
+            if stored is not None and stored[0] == hashed:
+                matrix[i] = stored[1:]
+            else:
+                fresh.append(i)
         
-        # Remove common stop words
-        stop_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 
-                     'can', 'has', 'was', 'one', 'our', 'out', 'this', 'that',
-                     'with', 'have', 'from', 'they', 'been', 'will', 'what',
-                     'about', 'which', 'when', 'more', 'your', 'like', 'just'}
+        if fresh:
+            matrix[fresh] = sentiment_scorer.score(text.iloc[fresh].tolist())[SCORE_COLUMNS[:-1]].to_numpy()
         
-        filtered_words = [w for w in words if w not in stop_words]
+        scores = pd.DataFrame(matrix, columns=SCORE_COLUMNS[:-1])
+        scores['category'] = categorize(scores['compound'])
         
-        # Count frequencies
-        word_freq = Counter(filtered_words)
+        # Every row is recorded: known comments refresh like/reply counts only
+        self.store.record(scores.assign(
+            comment_id=comment_ids,
+            video_id=comments['video_id'].to_numpy(),
+            text_hash=hashes,
+            like_count=comments['like_count'].to_numpy(),
+            reply_count=comments['reply_count'].to_numpy()
+        ))
+        print(f"🧠 Scored {len(fresh):,} new comments, reused {len(comment_ids) - len(fresh):,} stored scores")
+        return scores
+    
+    def get_sentiment_summary(self, sentiment_df, video_ids=None):
+        """
+        Generate sentiment summary statistics.
         
-        return word_freq.most_common(top_n)
+        Args:
+            sentiment_df: Output of analyze_comments
+            video_ids (list): With a store attached, summarize every stored
+                comment of these videos from the maintained per-video
+                counters instead of counting sentiment_df
+        
+        Returns:
+            dict: Counts, percentages, average sentiment and the most
+                positive/negative comment of sentiment_df
+        """
+        if video_ids is not None and self.store is not None:
+            counts = self.store.video_summaries(video_ids).sum()
+            if not counts['total_comments']:
+                return {}
+            summary = _summary_from_counts(*counts[['total_comments', 'positive_count', 'negative_count',
+                                                    'neutral_count', 'compound_sum']])
+        elif sentiment_df.empty:
+            return {}
+        else:
+            categories = sentiment_df['sentiment_category']
+            summary = _summary_from_counts(
+                len(sentiment_df),
+                int((categories == 'Positive').sum()),
+                int((categories == 'Negative').sum()),
+                int((categories == 'Neutral').sum()),
+                sentiment_df['sentiment_score'].sum()
+            )
+        
+        summary['most_positive'] = sentiment_df.nlargest(1, 'sentiment_score')['full_text'].values[0] if not sentiment_df.empty else ""
+        summary['most_negative'] = sentiment_df.nsmallest(1, 'sentiment_score')['full_text'].values[0] if not sentiment_df.empty else ""
+        return summary
+    
+    def get_video_summaries(self, video_ids=None):
+        """
+        Per-video sentiment summaries from the store's maintained counters.
+        
+        Args:
+            video_ids (list): Videos to include (None = every stored video)
+        
+        Returns:
+            pd.DataFrame: Indexed by video_id, with the count, percentage and
+                average columns of get_sentiment_summary (empty without a store)
+        """
+        if self.store is None:
+            return pd.DataFrame()
+        
+        counts = self.store.video_summaries(video_ids)
+        if video_ids is not None:
+            counts = counts.reindex([video_id for video_id in dict.fromkeys(video_ids) if video_id in counts.index])
+        total = counts['total_comments'].replace(0, np.nan)
+        
+        summaries = counts[['total_comments', 'positive_count', 'negative_count', 'neutral_count']].copy()
+        for name in ('positive', 'negative', 'neutral'):
+            summaries[f'{name}_percentage'] = (counts[f'{name}_count'] / total * 100).fillna(0)
+        summaries['average_sentiment'] = (counts['compound_sum'] / total).fillna(0)
+        return summaries
+    
+    def extract_keywords(self, comments, top_n=20):
+        """Extract most common keywords from comments"""
+        stats = CommentTextStats(score=False)
+        stats.update(comments)
+        return stats.keywords(top_n)
     
     def analyze_emoji_usage(self, comments):
         """Analyze emoji usage in comments"""
-        emoji_pattern = re.compile("["
-            u"\U0001F600-\U0001F64F"  # emoticons
-            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-            u"\U0001F680-\U0001F6FF"  # transport & map symbols
-            u"\U0001F1E0-\U0001F1FF"  # flags
-            u"\U00002702-\U000027B0"
-            u"\U000024C2-\U0001F251"
-            "]+", flags=re.UNICODE)
+        stats = CommentTextStats(score=False)
+        stats.update(comments)
+        return stats.emojis(10)
+    
+    def analyze_text_stream(self, pages):
+        """
+        Keywords, emoji, bigrams and sentiment in one pass over comment pages.
         
-        all_emojis = []
+        Args:
+            pages (iterable): Lists of comment dicts, e.g. iter_comment_pages();
+                each page is released once it has been counted
+        
+        Returns:
+            CommentTextStats
+        """
+        stats = CommentTextStats(score=self.analyzer is not None)
+        for page in pages:
+            stats.update(page)
+        return stats
+
+
+class CommentTextStats:
+    """
+    Streaming text analytics over comment pages.
+    
+    Each comment is read once: its keywords, keyword bigrams and emoji go
+    into counters, and its text waits in a small buffer that is scored by
+    sentiment_scorer every TEXT_STATS_SCORE_BATCH comments. The scores feed
+    the category counts, compound sum and most positive/negative comment.
+    """
+    
+    def __init__(self, score=True):
+        """
+        Args:
+            score (bool): Also accumulate VADER sentiment (needs vaderSentiment)
+        """
+        self.score = score
+        self.keyword_counts = Counter()
+        self.bigram_counts = Counter()
+        self.emoji_counts = Counter()
+        
+        self.total = 0
+        self.category_counts = Counter()
+        self.compound_sum = 0.0
+        self.most_positive = (-math.inf, "")
+        self.most_negative = (math.inf, "")
+        self._unscored = []
+    
+    def update(self, comments):
+        """Fold one page of comment dicts into every counter."""
+        keywords, bigrams, emojis = [], [], []
         
         for comment in comments:
-            emojis = emoji_pattern.findall(comment['text'])
-            all_emojis.extend(emojis)
+            text = comment['text'] or ''
+            words = [w for w in WORD_PATTERN.findall(text.lower()) if w not in STOP_WORDS]
+            keywords += words
+            bigrams += zip(words, words[1:])
+            emojis += EMOJI_PATTERN.findall(text)
+            self.total += 1
+            if self.score:
+                self._unscored.append(text)
         
-        emoji_freq = Counter(all_emojis)
+        # One counter update per page instead of per comment
+        self.keyword_counts.update(keywords)
+        self.bigram_counts.update(bigrams)
+        self.emoji_counts.update(emojis)
         
-        return emoji_freq.most_common(10)
+        if len(self._unscored) >= TEXT_STATS_SCORE_BATCH:
+            self._score_pending()
+    
+    def _score_pending(self):
+        """Score the buffered texts in one batch."""
+        texts, self._unscored = self._unscored, []
+        if not texts:
+            return
+        
+        scores = sentiment_scorer.score(texts)
+        compound = scores['compound'].to_numpy()
+        self.category_counts.update(scores['category'].tolist())
+        self.compound_sum += float(compound.sum())
+        
+        # First occurrence wins ties, as with nlargest/nsmallest
+        best, worst = int(compound.argmax()), int(compound.argmin())
+        if compound[best] > self.most_positive[0]:
+            self.most_positive = (float(compound[best]), texts[best])
+        if compound[worst] < self.most_negative[0]:
+            self.most_negative = (float(compound[worst]), texts[worst])
+    
+    def keywords(self, top_n=20):
+        """Most common keywords (stop words removed)."""
+        return self.keyword_counts.most_common(top_n)
+    
+    def bigrams(self, top_n=20):
+        """Most common adjacent keyword pairs, joined with a space."""
+        return [(' '.join(pair), count) for pair, count in self.bigram_counts.most_common(top_n)]
+    
+    def emojis(self, top_n=10):
+        """Most common emoji runs."""
+        return self.emoji_counts.most_common(top_n)
+    
+    def sentiment_summary(self):
+        """Same keys as SentimentAnalyzer.get_sentiment_summary ({} before any scored comment)."""
+        if not self.score or not self.total:
+            return {}
+        
+        self._score_pending()
+        summary = _summary_from_counts(
+            self.total,
+            self.category_counts['Positive'],
+            self.category_counts['Negative'],
+            self.category_counts['Neutral'],
+            self.compound_sum
+        )
+        summary['most_positive'] = self.most_positive[1]
+        summary['most_negative'] = self.most_negative[1]
+        return summary
+
+
+def _summary_from_counts(total, positive, negative, neutral, compound_sum):
+    """Summary statistics shared by frame-based and store-based summaries."""
+    return {
+        'total_comments': int(total),
+        'positive_count': int(positive),
+        'negative_count': int(negative),
+        'neutral_count': int(neutral),
+        'positive_percentage': (positive / total) * 100,
+        'negative_percentage': (negative / total) * 100,
+        'neutral_percentage': (neutral / total) * 100,
+        'average_sentiment': compound_sum / total
+    }
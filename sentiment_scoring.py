@@ -0,0 +1,205 @@
+# sentiment_scoring.py
+# Batched VADER scoring engine: normalize, deduplicate, cache, then score in chunks
+
+import atexit
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    VADER_AVAILABLE = True
+except ImportError:
+    VADER_AVAILABLE = False
+
+
+CACHE_SIZE = 200_000      # Distinct texts whose scores are kept (LRU)
+CHUNK_SIZE = 2_000        # Texts per process-pool task
+MIN_PARALLEL = 10_000     # Fewer uncached texts than this are scored in-process
+
+# polarity_scores() keys, in result-column order
+SCORE_KEYS = ('compound', 'pos', 'neg', 'neu')
+SCORE_COLUMNS = ['compound', 'positive', 'negative', 'neutral', 'category']
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text):
+    """
+    Canonical form used for deduplication.
+
+    VADER tokenizes on whitespace and reads case, punctuation and emoji,
+    so only whitespace is collapsed: the normalized text scores the same.
+    """
+    return _WHITESPACE.sub(' ', text or '').strip()
+
+
+def text_hash(text):
+    """Stable 128-bit hex digest of a normalized text."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def categorize(compound):
+    """Positive / Negative / Neutral labels for an array of compound scores."""
+    compound = np.asarray(compound, dtype='float64')
+    return np.select([compound >= 0.05, compound <= -0.05], ['Positive', 'Negative'], 'Neutral')
+
+
+# One analyzer per process (VADER loads its lexicon on construction)
+_analyzer = None
+
+
+def _score_chunk(texts):
+    """Score a list of texts; runs in worker processes, so it must stay module-level."""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = SentimentIntensityAnalyzer()
+
+    rows = []
+    for text in texts:
+        scores = _analyzer.polarity_scores(text)
+        rows.append(tuple(scores[key] for key in SCORE_KEYS))
+    return rows
+
+
+class ScoreCache:
+    """Thread-safe LRU map of text hash -> (compound, pos, neg, neu)"""
+
+    def __init__(self, max_size=CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+
+    def get_many(self, keys):
+        """Cached scores for the keys that have them (refreshing their recency)."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                scores = self._entries.get(key)
+                if scores is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = scores
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+
+    def put_many(self, items):
+        """Insert (key, scores) pairs, evicting the least recently used."""
+        with self._lock:
+            for key, scores in items:
+                self._entries[key] = scores
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+    def stats(self):
+        """Entries held and lookup counters."""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class SentimentScorer:
+    """
+    VADER scoring for large comment sets.
+
+    Texts are normalized and deduplicated first, unique texts are looked up
+    in an LRU cache by hash, and only the remainder is scored: in-process
+    for small batches, in CHUNK_SIZE chunks on a process pool otherwise
+    (VADER is pure Python, so threads would not help).
+    """
+
+    def __init__(self, cache_size=CACHE_SIZE, processes=None, chunk_size=CHUNK_SIZE, min_parallel=MIN_PARALLEL):
+        """
+        Args:
+            cache_size (int): Distinct texts kept in the LRU score cache
+            processes (int): Worker processes (default: CPU count; 1 disables the pool)
+            chunk_size (int): Texts per pool task
+            min_parallel (int): Smallest number of uncached texts worth the pool
+        """
+        self.cache = ScoreCache(cache_size)
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.min_parallel = min_parallel
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+
+    def _executor(self):
+        """Lazily started process pool, kept for later batches."""
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn: safe in a threaded server and the same on every platform
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+
+    def close(self):
+        """Shut the process pool down (it restarts on the next large batch)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+
+
+    def _score_unique(self, texts):
+        """Score distinct uncached texts, in the pool when there are enough of them."""
+        if self.processes > 1 and len(texts) >= self.min_parallel:
+            chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+            return [row for rows in self._executor().map(_score_chunk, chunks) for row in rows]
+        return _score_chunk(texts)
+
+
+    def score(self, texts):
+        """
+        Score texts in bulk.
+
+        Args:
+            texts (iterable): Raw comment texts (None is treated as empty)
+
+        Returns:
+            pd.DataFrame: compound, positive, negative, neutral, category; one row per text
+        """
+        # Deduplicate: every distinct normalized text is hashed and scored once
+        hash_of = {}
+        unique = {}
+        hashes = []
+        for text in texts:
+            key = hash_of.get(text)
+            if key is None:
+                normalized = normalize_text(text)
+                key = text_hash(normalized)
+                hash_of[text] = key
+                unique.setdefault(key, normalized)
+            hashes.append(key)
+
+        scores = self.cache.get_many(list(unique))
+        missing = [key for key in unique if key not in scores]
+
+        if missing:
+            rows = self._score_unique([unique[key] for key in missing])
+            fresh = list(zip(missing, rows))
+            self.cache.put_many(fresh)
+            scores.update(fresh)
+
+        matrix = np.array([scores[key] for key in hashes], dtype='float64').reshape(-1, len(SCORE_KEYS))
+        df = pd.DataFrame(matrix, columns=SCORE_COLUMNS[:-1])
+        df['category'] = categorize(df['compound'])
+        return df
+
+
+# Shared by every session, so repeat analyses hit the same cache and pool
+sentiment_scorer = SentimentScorer()
+atexit.register(sentiment_scorer.close)
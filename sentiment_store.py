@@ -0,0 +1,217 @@
+# sentiment_store.py
+# Persistent comment sentiment store with incrementally maintained per-video summaries
+
+import os
+import sqlite3
+import threading
+import time
+import pandas as pd
+
+
+# SQLite's default host-parameter limit is 999 on older builds
+LOOKUP_BATCH_SIZE = 900
+
+# Per-comment columns passed to record()
+RECORD_COLUMNS = [
+    'comment_id', 'video_id', 'text_hash', 'like_count', 'reply_count',
+    'compound', 'positive', 'negative', 'neutral', 'category',
+]
+SUMMARY_COLUMNS = ['total_comments', 'positive_count', 'negative_count', 'neutral_count', 'compound_sum']
+
+
+class CommentSentimentStore:
+    """
+    SQLite store of scored YouTube comments, keyed by comment ID.
+
+    Each comment keeps its video, normalized-text hash, like/reply counts
+    and VADER scores. Per-video category counts and compound sums are
+    updated by the same transaction that records comments, so summaries
+    never need a rescan.
+    """
+
+    def __init__(self, db_path=".cache/youtube/comments.db"):
+        """
+        Args:
+            db_path (str): SQLite database file
+        """
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS comments (
+                comment_id TEXT PRIMARY KEY,
+                video_id TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                like_count INTEGER NOT NULL,
+                reply_count INTEGER NOT NULL,
+                compound REAL NOT NULL,
+                positive REAL NOT NULL,
+                negative REAL NOT NULL,
+                neutral REAL NOT NULL,
+                category TEXT NOT NULL,
+                scored_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS comments_by_video ON comments (video_id)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS video_summaries (
+                video_id TEXT PRIMARY KEY,
+                total_comments INTEGER NOT NULL,
+                positive_count INTEGER NOT NULL,
+                negative_count INTEGER NOT NULL,
+                neutral_count INTEGER NOT NULL,
+                compound_sum REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+
+    def lookup(self, comment_ids):
+        """
+        Stored hash and scores of the comments already seen.
+
+        Returns:
+            dict: comment_id -> (text_hash, compound, positive, negative, neutral)
+        """
+        comment_ids = list(comment_ids)
+        found = {}
+
+        with self._lock:
+            for i in range(0, len(comment_ids), LOOKUP_BATCH_SIZE):
+                batch = comment_ids[i:i + LOOKUP_BATCH_SIZE]
+                rows = self._conn.execute(
+                    "SELECT comment_id, text_hash, compound, positive, negative, neutral FROM comments "
+                    f"WHERE comment_id IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                found.update((row[0], row[1:]) for row in rows)
+        return found
+
+
+    def record(self, df):
+        """
+        Upsert scored comments and fold them into their videos' summaries.
+
+        New comments are added to the counters; re-scored ones (edited text)
+        replace their old contribution; known ones only refresh like/reply counts.
+
+        Args:
+            df (pd.DataFrame): One row per comment with RECORD_COLUMNS
+        """
+        df = df[RECORD_COLUMNS].drop_duplicates('comment_id', keep='last')
+        if df.empty:
+            return
+
+        now = time.time()
+        rows = list(df.itertuples(index=False, name=None))
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                previous = {}
+                ids = df['comment_id'].tolist()
+                for i in range(0, len(ids), LOOKUP_BATCH_SIZE):
+                    batch = ids[i:i + LOOKUP_BATCH_SIZE]
+                    previous.update(
+                        (row[0], row[1:]) for row in self._conn.execute(
+                            "SELECT comment_id, video_id, text_hash, compound, category FROM comments "
+                            f"WHERE comment_id IN ({','.join('?' * len(batch))})",
+                            batch
+                        )
+                    )
+
+                deltas = {}
+                for comment_id, video_id, text_hash, _, _, compound, _, _, _, category in rows:
+                    old = previous.get(comment_id)
+                    if old is not None and old[1] == text_hash:
+                        continue
+                    if old is not None:
+                        _add_delta(deltas, old[0], old[3], old[2], -1)
+                    _add_delta(deltas, video_id, category, compound, 1)
+
+                self._conn.executemany(
+                    """
+                    INSERT INTO comments (comment_id, video_id, text_hash, like_count, reply_count,
+                                          compound, positive, negative, neutral, category, scored_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (comment_id) DO UPDATE SET
+                        like_count = excluded.like_count,
+                        reply_count = excluded.reply_count,
+                        text_hash = excluded.text_hash,
+                        compound = excluded.compound,
+                        positive = excluded.positive,
+                        negative = excluded.negative,
+                        neutral = excluded.neutral,
+                        category = excluded.category,
+                        scored_at = CASE WHEN comments.text_hash = excluded.text_hash
+                                         THEN comments.scored_at ELSE excluded.scored_at END
+                    """,
+                    [row + (now,) for row in rows]
+                )
+                self._conn.executemany(
+                    """
+                    INSERT INTO video_summaries (video_id, total_comments, positive_count, negative_count,
+                                                 neutral_count, compound_sum, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (video_id) DO UPDATE SET
+                        total_comments = total_comments + excluded.total_comments,
+                        positive_count = positive_count + excluded.positive_count,
+                        negative_count = negative_count + excluded.negative_count,
+                        neutral_count = neutral_count + excluded.neutral_count,
+                        compound_sum = compound_sum + excluded.compound_sum,
+                        updated_at = excluded.updated_at
+                    """,
+                    [(video_id, *delta, now) for video_id, delta in deltas.items()]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+    def video_summaries(self, video_ids=None):
+        """
+        Maintained per-video counters.
+
+        Args:
+            video_ids (list): Videos to return (None = every stored video)
+
+        Returns:
+            pd.DataFrame: SUMMARY_COLUMNS indexed by video_id
+        """
+        query = f"SELECT video_id, {', '.join(SUMMARY_COLUMNS)} FROM video_summaries"
+
+        with self._lock:
+            if video_ids is None:
+                rows = self._conn.execute(query).fetchall()
+            else:
+                video_ids = list(video_ids)
+                rows = []
+                for i in range(0, len(video_ids), LOOKUP_BATCH_SIZE):
+                    batch = video_ids[i:i + LOOKUP_BATCH_SIZE]
+                    rows += self._conn.execute(
+                        f"{query} WHERE video_id IN ({','.join('?' * len(batch))})", batch
+                    ).fetchall()
+
+        return pd.DataFrame(rows, columns=['video_id'] + SUMMARY_COLUMNS).set_index('video_id')
+
+
+    def count(self, video_id=None):
+        """Number of stored comments (for one video, or overall)."""
+        with self._lock:
+            if video_id is None:
+                return self._conn.execute("SELECT COUNT(*) FROM comments").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM comments WHERE video_id = ?", (video_id,)
+            ).fetchone()[0]
+
+
+def _add_delta(deltas, video_id, category, compound, sign):
+    """Accumulate one comment's (+1) or its old version's (-1) summary contribution."""
+    delta = deltas.setdefault(video_id, [0, 0, 0, 0, 0.0])
+    delta[0] += sign
+    delta[1 + ('Positive', 'Negative', 'Neutral').index(category)] += sign
+    delta[4] += sign * compound
@@ -0,0 +1,86 @@
+# tabs/comment_sentiment.py
+import streamlit as st
+import plotly.graph_objects as go
+from ui.components import kpi, chart_card, end_card, info_card
+from ui.styles import plotly_layout
+
+
+def render_comment_sentiment_tab(df, sentiment_df, summary, video_summaries, terms=None):
+    """Render comment sentiment tab (top videos' comments)"""
+
+    if sentiment_df is None or sentiment_df.empty or not summary:
+        info_card("Comment Sentiment", "Enable \"Fetch comments\" in Advanced Options to analyze viewer sentiment")
+        return
+
+    st.markdown("")
+    st.markdown("## 💬 Comment Sentiment")
+    st.markdown(f"*{len(sentiment_df):,} comments from the top {sentiment_df['video_id'].nunique()} videos by views*")
+    st.markdown("")
+
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        kpi("Comments Scored", f"{summary['total_comments']:,}", "All stored comments of these videos")
+    with c2:
+        kpi("Positive", f"{summary['positive_percentage']:.1f}%", f"{summary['positive_count']:,} comments")
+    with c3:
+        kpi("Negative", f"{summary['negative_percentage']:.1f}%", f"{summary['negative_count']:,} comments", positive=False)
+    with c4:
+        kpi("Average Sentiment", f"{summary['average_sentiment']:+.3f}", "VADER compound (-1 to +1)")
+
+    st.markdown("")
+
+    # Per-video breakdown, from the store's maintained counters
+    if not video_summaries.empty:
+        titles = df.set_index('video_id')['title'].reindex(video_summaries.index).fillna(video_summaries.index.to_series())
+        labels = [t[:40] + '...' if len(t) > 40 else t for t in titles]
+
+        cont = chart_card("Sentiment by Video")
+        with cont:
+            fig = go.Figure()
+            for name, color in (("positive", "#10B981"), ("neutral", "#94A3B8"), ("negative", "#EF4444")):
+                fig.add_trace(go.Bar(
+                    y=labels,
+                    x=video_summaries[f'{name}_percentage'],
+                    name=name.title(),
+                    orientation='h',
+                    marker_color=color,
+                    hovertemplate='%{y}<br>' + name.title() + ': %{x:.1f}%<extra></extra>'
+                ))
+            fig.update_layout(**plotly_layout(), barmode='stack', height=max(320, 32 * len(labels)),
+                              xaxis_title="% of comments", margin=dict(l=20, r=20, t=20, b=40))
+            st.plotly_chart(fig, use_container_width=True)
+        end_card()
+
+    # What viewers talk about: keywords, keyword pairs and emoji
+    if terms:
+        columns = st.columns(3)
+        for column, (title, key) in zip(columns, (("Top Keywords", 'keywords'), ("Top Phrases", 'bigrams'),
+                                                  ("Top Emoji", 'emojis'))):
+            with column:
+                cont = chart_card(title)
+                with cont:
+                    counts = terms.get(key) or []
+                    if counts:
+                        fig = go.Figure(go.Bar(
+                            y=[term for term, _ in counts][::-1],
+                            x=[count for _, count in counts][::-1],
+                            orientation='h',
+                            marker_color='#3B82F6'
+                        ))
+                        fig.update_layout(**plotly_layout(), height=360, margin=dict(l=20, r=20, t=20, b=20))
+                        st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.info("None found")
+                end_card()
+
+    left, right = st.columns(2)
+    with left:
+        cont = chart_card("Most Positive Comment")
+        with cont:
+            st.success(summary['most_positive'])
+        end_card()
+    with right:
+        cont = chart_card("Most Negative Comment")
+        with cont:
+            st.error(summary['most_negative'])
+        end_card()
@@ -65,21 +65,23 @@ def render_sidebar(sentiment_available=False, vader_available=False, predictive_
         
         # Route
         if "YouTube" in platform:
-            return render_youtube_config()
+            return render_youtube_config(sentiment_available)
         else:
             return render_reddit_config()
 
 
-def render_youtube_config():
+def render_youtube_config(sentiment_available=False):
     """YouTube configuration"""
     
     # Quota display
     if QUOTA_ENABLED:
         try:
-            quota_data = quota_manager.quota_data
-            used = quota_data.get('used', 0)
-            total = quota_data.get('total', 100)
-            percentage = (used / total * 100) if total > 0 else 0
+            quota_stats = quota_manager.get_usage_stats("youtube")
+            used = quota_stats['used']
+            total = quota_stats['limit']
+            percentage = min(quota_stats['percentage'], 100)
+            endpoint_usage = quota_manager.get_endpoint_usage("youtube")
+            breakdown = " · ".join(f"{endpoint.split('.')[0]} {units:,}" for endpoint, units in endpoint_usage.items())
             
             if percentage < 50:
                 color = "#10B981"
@@ -93,34 +95,114 @@ def render_youtube_config():
             
             st.markdown(f"""
             <div style='background: rgba(30, 41, 59, 0.6); border: 1px solid rgba(59, 130, 246, 0.2); border-radius: 10px; padding: 16px; margin-bottom: 20px;'>
-                <div style='color: #94A3B8; font-size: 11px; text-transform: uppercase; margin-bottom: 8px;'>Daily Quota</div>
+                <div style='color: #94A3B8; font-size: 11px; text-transform: uppercase; margin-bottom: 8px;'>Daily Quota (API units)</div>
                 <div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;'>
-                    <span style='color: white; font-size: 20px; font-weight: 700;'>{used} / {total}</span>
+                    <span style='color: white; font-size: 20px; font-weight: 700;'>{used:,} / {total:,}</span>
                     <span style='background: {color}; color: white; padding: 4px 10px; border-radius: 5px; font-size: 11px; font-weight: 600;'>{status}</span>
                 </div>
                 <div style='background: rgba(15, 23, 42, 0.8); border-radius: 6px; height: 8px; overflow: hidden;'>
                     <div style='background: {color}; height: 100%; width: {percentage}%;'></div>
                 </div>
+                <div style='color: #94A3B8; font-size: 11px; margin-top: 8px;'>{breakdown}</div>
             </div>
             """, unsafe_allow_html=True)
         except:
             pass
     
-    channel_input = st.text_input(
-        "Channel Identifier",
-        placeholder="@channel or URL",
-        key="yt_channel"
+    mode = st.radio(
+        "Mode",
+        ["Single Channel", "Compare Channels"],
+        horizontal=True,
+        key="yt_mode"
     )
+    bulk = mode == "Compare Channels"
     
-    analyze_clicked = st.button("🚀 Analyze Channel", use_container_width=True, type="primary")
+    if bulk:
+        channels_text = st.text_area(
+            "Channel Identifiers",
+            placeholder="@channel1\n@channel2\nhttps://youtube.com/@channel3",
+            help="One channel per line (or comma separated)",
+            height=160,
+            key="yt_channels"
+        )
+        channel_inputs = [c.strip() for c in channels_text.replace(",", "\n").splitlines() if c.strip()]
+        channel_input = ""
+    else:
+        channel_input = st.text_input(
+            "Channel Identifier",
+            placeholder="@channel or URL",
+            key="yt_channel"
+        )
+        channel_inputs = []
+    
+    with st.expander("Advanced Options"):
+        incremental = st.checkbox(
+            "Incremental refresh",
+            value=True,
+            help="Reuse the last analysis of this channel and only fetch new uploads and stale statistics",
+            key="yt_incremental"
+        )
+        
+        window_label = st.selectbox(
+            "Upload Window",
+            ["All uploads", "Last 30 days", "Last 90 days", "Last 365 days"],
+            help="Only fetch videos published inside this window (fewer API calls)",
+            key="yt_window"
+        )
+        window_days = {"Last 30 days": 30, "Last 90 days": 90, "Last 365 days": 365}.get(window_label)
+        
+        if bulk:
+            max_videos_label = st.selectbox(
+                "Videos per Channel",
+                ["50 most recent", "200 most recent", "500 most recent", "All uploads"],
+                key="yt_bulk_max_videos"
+            )
+            max_videos = {"50 most recent": 50, "200 most recent": 200, "500 most recent": 500}.get(max_videos_label)
+        else:
+            max_videos_label = st.selectbox(
+                "Videos to Analyze",
+                ["All uploads", "500 most recent", "1,000 most recent", "5,000 most recent"],
+                key="yt_max_videos"
+            )
+            max_videos = {"500 most recent": 500, "1,000 most recent": 1000, "5,000 most recent": 5000}.get(max_videos_label)
+        
+        fetch_comments = False
+        max_comments = 100
+        num_videos_for_comments = 10
+        if sentiment_available and not bulk:
+            fetch_comments = st.checkbox(
+                "Fetch comments",
+                value=False,
+                help="Harvest comments from the most viewed videos (several videos at a time)",
+                key="yt_fetch_comments"
+            )
+            if fetch_comments:
+                num_videos_for_comments = st.slider(
+                    "Videos for Comments", 5, 50, 10, 5,
+                    help="Top videos by views whose comments are fetched",
+                    key="yt_comment_videos"
+                )
+                max_comments = st.slider(
+                    "Comments per Video", 100, 1000, 100, 100,
+                    help="Each video costs one quota unit per 100 comments",
+                    key="yt_max_comments"
+                )
+    
+    button_label = f"🚀 Analyze {len(channel_inputs)} Channels" if bulk else "🚀 Analyze Channel"
+    analyze_clicked = st.button(button_label, use_container_width=True, type="primary")
     
     return {
         "platform": "youtube",
         "channel_input": channel_input,
+        "channel_inputs": channel_inputs,
+        "bulk": bulk,
         "analyze_clicked": analyze_clicked,
-        "fetch_comments": False,
-        "max_comments": 100,
-        "num_videos_for_comments": 10,
+        "incremental": incremental,
+        "window_days": window_days,
+        "max_videos": max_videos,
+        "fetch_comments": fetch_comments,
+        "max_comments": max_comments,
+        "num_videos_for_comments": num_videos_for_comments,
         "enable_predictions": False
     }
 
@@ -151,16 +233,60 @@ def render_reddit_config():
         )
         identifier_type = "user"
     
+    sample_listings = False
+    track_history = False
+    live = False
+    comment_posts = 0
+    
     with st.expander("Advanced Options"):
-        post_limit = st.slider("Posts to Fetch", 50, 500, 200, 50)
+        if identifier_type == "subreddit":
+            live = st.checkbox(
+                "Live monitor",
+                value=False,
+                help="Stream new posts in the background and refresh the dashboard every few seconds",
+                key="reddit_live"
+            )
+        
+        if not live:
+            track_history = st.checkbox(
+                "Track history",
+                value=False,
+                help="Keep every post seen in a local store; later runs only fetch new posts and refresh recent scores",
+                key="reddit_track"
+            )
+        
+        if identifier_type == "subreddit" and not track_history and not live:
+            sample_listings = st.checkbox(
+                "Sample multiple listings",
+                value=False,
+                help="Fetch hot, new, rising and top (week/month/year) in parallel for less trend-biased posting-time charts",
+                key="reddit_sample"
+            )
+        
+        if sample_listings:
+            post_limit = st.slider("Post Budget (all listings)", 300, 3000, 1200, 300)
+        else:
+            post_limit = st.slider("Posts to Fetch", 50, 500, 200, 50)
+        
+        if identifier_type == "subreddit" and not live:
+            comment_posts = st.slider(
+                "Comment Trees (top posts)", 0, 25, 0, 5,
+                help="Fetch full comment trees of the most upvoted posts for reply-depth analysis",
+                key="reddit_comment_posts"
+            )
     
-    analyze_clicked = st.button("🚀 Analyze Reddit", use_container_width=True, type="primary")
+    button_label = "📡 Start Live Monitor" if live else "🚀 Analyze Reddit"
+    analyze_clicked = st.button(button_label, use_container_width=True, type="primary")
     
     return {
         "platform": "reddit",
         "identifier": identifier,
         "identifier_type": identifier_type,
         "post_limit": post_limit if 'post_limit' in locals() else 200,
+        "sample_listings": sample_listings,
+        "track_history": track_history,
+        "live": live,
+        "comment_posts": comment_posts,
         "analyze_clicked": analyze_clicked
     }
 